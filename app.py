@@ -1,9 +1,41 @@
 import streamlit as st
 import os
+import uuid
 from pages.login import show_login
 from pages.signup import show_signup
-from pages.dashboard import show_dashboard
-from database.db_functions import init_connection
+from database.db_functions import (init_connection, get_catalog, get_artifacts, get_career_trend,
+                                   record_audit_event)
+from database import audit
+from utils import warmup
+from utils.auth import is_admin
+from utils.dashboard_data import warm_demo_data, dashboard_careers
+from utils.lazy_pages import lazy_page, load_module
+from database.timeseries import RESOLUTIONS
+from utils.session_memory import account_session
+from utils.tracing import span, start_metrics_server
+from database.query_profiler import rerun_scope
+
+# Pages behind login pull in the plotting stack; import them on first use only
+show_dashboard = lazy_page("pages.dashboard", "show_dashboard")
+show_admin = lazy_page("pages.admin", "show_admin")
+
+# Lazy builds the first request after a deploy would otherwise pay for, run in the background at startup
+WARMUP_TASKS = [
+    warmup.Task("db.schema", lambda: init_connection().close(), priority=0),
+    warmup.Task("catalog", get_catalog, priority=10, requires=["db.schema"]),
+    warmup.Task("dashboard.data", warm_demo_data, priority=20),
+    warmup.Task("career_demand", lambda: [get_career_trend(career, resolution) for career in dashboard_careers()
+                                          for resolution in RESOLUTIONS],
+                priority=30, requires=["db.schema"]),
+    warmup.Task("artifacts", get_artifacts, priority=40, required=False),
+    warmup.Task("page.admin", lambda: load_module("pages.admin"), priority=90, required=False),
+]
+
+# Importing the dashboard page at startup undoes its lazy import for every process, including ones
+# that never serve a logged-in user; opt in where the first dashboard visit matters more than that
+if os.environ.get("CODEHOLICS_WARMUP_DASHBOARD_IMPORTS") == "1":
+    WARMUP_TASKS.append(warmup.Task("page.dashboard", lambda: load_module("pages.dashboard"), priority=80,
+                                    required=False))
 
 # Set page configuration
 st.set_page_config(
@@ -29,10 +61,18 @@ if "username" not in st.session_state:
     st.session_state.username = None
 if "current_page" not in st.session_state:
     st.session_state.current_page = "login"
+if "login_session_id" not in st.session_state:
+    st.session_state.login_session_id = uuid.uuid4().hex
+
+# Size of what this session kept from its previous reruns; see the admin page
+with span("app.account_session"):
+    account_session(st.session_state.login_session_id, st.session_state)
 
 def main():
     """Main function to control navigation and authentication"""
-    conn = init_connection()
+    with span("app.init_connection"):
+        warmup.wait("db.schema")
+        conn = init_connection()
 
     # ✅ Sidebar Navigation
     with st.sidebar:
@@ -43,7 +83,12 @@ def main():
             if st.button("Dashboard", key="dashboard_button"):
                 st.session_state.current_page = "dashboard"
                 st.rerun()
+            if is_admin() and st.button("Performance", key="admin_button"):
+                st.session_state.current_page = "admin"
+                st.rerun()
             if st.button("Logout", key="logout_button"):
+                record_audit_event(audit.LOGOUT, st.session_state.username,
+                                   session_id=st.session_state.get("login_session_id"))
                 st.session_state.authenticated = False
                 st.session_state.username = None
                 st.session_state.current_page = "login"
@@ -64,8 +109,15 @@ def main():
             show_login()
         elif st.session_state.current_page == "signup":
             show_signup()
+    elif st.session_state.current_page == "admin" and is_admin():
+        show_admin()
     else:
-        show_dashboard()
+        with span("dashboard.total"):
+            warmup.wait("dashboard.data", "career_demand")
+            show_dashboard()
 
 if __name__ == "__main__":
-    main()
+    start_metrics_server()
+    warmup.start(WARMUP_TASKS)
+    with span("app.rerun"), rerun_scope():
+        main()
@@ -0,0 +1,79 @@
+import os
+import io
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from utils.charts import CHARTS, BACKENDS, MATPLOTLIB, PYPLOT_DPI, build
+from utils.dashboard_data import build_timeline, compute_skill_gap
+from utils.datasets import load_courses
+
+
+def sample_arguments():
+    """Representative inputs for every chart, taken from the shipped courses.csv"""
+    courses = list(load_courses().values())[:5]
+    skills = ["Python", "SQL", "Data Analysis", "Machine Learning", "Deep Learning", "Statistics"]
+    values = [0.85, 0.80, 0.78, 0.65, 0.40, 0.72]
+    skill_data = [{"skill": s, "proficiency": v} for s, v in zip(skills, values)]
+    return {
+        "bar": (skills, values, "Current Skills", "Proficiency", (4, 4)),
+        "radar": (skills, values, "blue", "Current Skill Profile"),
+        "skill_gap": (compute_skill_gap(skill_data, skills[:4] + ["Big Data"]), "Skill Gap Analysis"),
+        "journey_timeline": (build_timeline(courses),),
+        "trend": (list(range(1, 13)), [1 + 0.05 * i for i in range(12)], "Demand Trend", "Months"),
+        "donut": (3.5, "Difficulty: 3.5/5"),
+    }
+
+
+def serialize(backend, figure):
+    """Produce the bytes that would be shipped to the browser"""
+    if backend == MATPLOTLIB:
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png", dpi=PYPLOT_DPI, bbox_inches="tight")
+        plt.close(figure)
+        return buffer.getvalue()
+    return figure.to_json().encode("utf-8")
+
+
+def run(repeat):
+    results = {}
+    arguments = sample_arguments()
+    for chart in CHARTS:
+        for backend in BACKENDS:
+            wall, cpu, size = [], [], 0
+            for _ in range(repeat):
+                start_wall, start_cpu = time.perf_counter(), time.process_time()
+                payload = serialize(backend, build(chart, backend, *arguments[chart]))
+                wall.append(time.perf_counter() - start_wall)
+                cpu.append(time.process_time() - start_cpu)
+                size = len(payload)
+            results[f"{chart}.{backend}"] = {
+                "wall_ms_mean": sum(wall) / repeat * 1000,
+                "cpu_ms_mean": sum(cpu) / repeat * 1000,
+                "payload_bytes": size,
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare server CPU and payload size of chart backends")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--out", default="chart_backends.json")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    for name, result in results.items():
+        print(f"{name:30s} cpu {result['cpu_ms_mean']:8.2f} ms  payload {result['payload_bytes']:>9d} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run_benchmarks import git_commit
+from utils.datasets import USERS_CSV, COURSES_CSV, load_users, load_courses
+from utils.recommender import recommend_courses
+
+# Share of each user's completions hidden from the recommender
+HOLDOUT_FRACTION = 0.2
+
+# Users with fewer completions than this are left out (nothing would remain to learn from)
+MIN_COMPLETIONS = 2
+
+# Users scored per pool task
+CHUNK_USERS = 2000
+
+
+def mask_completions(users, course_ids, fraction=HOLDOUT_FRACTION, seed=0):
+    """Hide a random share of each user's completions
+
+    Returns (masked users, held-out course ids per user). Completions of
+    courses missing from the catalog are ignored.
+    """
+    rng = random.Random(seed)
+    masked, holdouts = [], []
+    for user in users:
+        completed = [course_id for course_id in user["completed_courses"] if course_id in course_ids]
+        if len(completed) < MIN_COMPLETIONS:
+            continue
+        held = set(rng.sample(completed, max(1, round(fraction * len(completed)))))
+        masked.append(dict(user, completed_courses=[course_id for course_id in completed if course_id not in held]))
+        holdouts.append(sorted(held))
+    return masked, holdouts
+
+
+def _init_worker(courses, k):
+    global _worker_courses, _worker_k
+    _worker_courses = courses
+    _worker_k = k
+
+
+def _score_chunk(users):
+    """Top-k course ids per user; runs in a pool worker"""
+    return [[course_id for course_id, _ in recommend_courses(user, _worker_courses, _worker_k)] for user in users]
+
+
+def score_users(users, courses, k, workers=None, chunk_users=CHUNK_USERS):
+    """Recommend for every user in batch (default: one process per CPU; 1 = inline)"""
+    chunks = [users[start:start + chunk_users] for start in range(0, len(users), chunk_users)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(courses, k)
+        results = map(_score_chunk, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(courses, k)) as pool:
+            results = list(pool.map(_score_chunk, chunks))
+    return [picks for chunk in results for picks in chunk]
+
+
+def _encode(rows, index, width, fill=-1):
+    """Ragged rows of course ids -> (users x width) int32 matrix of catalog indices"""
+    matrix = np.full((len(rows), width), fill, dtype=np.int32)
+    for i, row in enumerate(rows):
+        matrix[i, :len(row)] = [index[course_id] for course_id in row[:width]]
+    return matrix
+
+
+def evaluate(recommended, holdouts, n_courses, cutoffs):
+    """precision@k, recall@k, NDCG@k and catalog coverage@k, computed over all users at once
+
+    `recommended` is a (users x k) matrix of course indices (-1 = no pick) and
+    `holdouts` a (users x h) matrix of held-out course indices (-1 padded).
+    """
+    n_users, k = recommended.shape
+    # A pick is a hit if (user, course) is among the held-out pairs
+    held_keys = holdouts.astype(np.int64) + np.arange(n_users, dtype=np.int64)[:, None] * n_courses
+    held_keys = held_keys[holdouts >= 0]
+    rec_keys = recommended.astype(np.int64) + np.arange(n_users, dtype=np.int64)[:, None] * n_courses
+    hits = np.isin(rec_keys, held_keys) & (recommended >= 0)
+
+    n_held = (holdouts >= 0).sum(axis=1)
+    discounts = 1.0 / np.log2(np.arange(2, k + 2))
+    ideal = np.cumsum(discounts)
+
+    metrics = {}
+    for cutoff in cutoffs:
+        top = hits[:, :cutoff]
+        n_hits = top.sum(axis=1)
+        dcg = (top * discounts[:cutoff]).sum(axis=1)
+        idcg = ideal[np.minimum(n_held, cutoff) - 1]
+        picked = recommended[:, :cutoff]
+        metrics[f"@{cutoff}"] = {
+            "precision": float((n_hits / cutoff).mean()),
+            "recall": float((n_hits / n_held).mean()),
+            "ndcg": float((dcg / idcg).mean()),
+            "hit_rate": float((n_hits > 0).mean()),
+            "coverage": float(np.unique(picked[picked >= 0]).size / n_courses),
+        }
+    return metrics
+
+
+def run(args):
+    courses = load_courses(args.courses_csv)
+    users = load_users(args.users_csv)
+    masked, holdouts = mask_completions(users, courses, args.holdout, args.seed)
+    k = max(args.k)
+
+    start = time.perf_counter()
+    picks = score_users(masked, courses, k, args.workers, args.chunk_users)
+    scoring = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = {course_id: i for i, course_id in enumerate(sorted(courses))}
+    recommended = _encode(picks, index, k)
+    held = _encode(holdouts, index, max(map(len, holdouts), default=1))
+    metrics = evaluate(recommended, held, len(index), sorted(set(args.k)))
+    metrics_seconds = time.perf_counter() - start
+
+    return {
+        "meta": {"commit": git_commit(), "timestamp": time.time(), "params": vars(args)},
+        "data": {"users": len(users), "evaluated_users": len(masked), "courses": len(courses),
+                 "held_out": sum(map(len, holdouts))},
+        "throughput": {"workers": args.workers or os.cpu_count(), "scoring_s": scoring,
+                       "users_per_s": len(masked) / scoring if scoring else None, "metrics_s": metrics_seconds},
+        "metrics": metrics,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline quality and speed of the course recommender on held-out completions")
+    parser.add_argument("--users-csv", default=USERS_CSV)
+    parser.add_argument("--courses-csv", default=COURSES_CSV)
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10], help="Cutoffs to report")
+    parser.add_argument("--holdout", type=float, default=HOLDOUT_FRACTION)
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (defaults to the CPU count)")
+    parser.add_argument("--chunk-users", type=int, default=CHUNK_USERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="recommender_eval.json")
+    args = parser.parse_args()
+
+    report = run(args)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    throughput = report["throughput"]
+    print(f"{report['data']['evaluated_users']} users scored in {throughput['scoring_s']:.2f}s "
+          f"({throughput['users_per_s']:,.0f} users/s, {throughput['workers']} workers)")
+    for cutoff, values in report["metrics"].items():
+        print(f"{cutoff:4s} " + "  ".join(f"{name} {value:.4f}" for name, value in values.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import ast
+import csv
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run_benchmarks import git_commit
+from utils import ingest
+from utils.data_generator import generate_dataset
+from utils.datasets import USER_LITERAL_COLUMNS, COURSE_LITERAL_COLUMNS
+
+
+def literal_eval_baseline(csv_path, literal_columns):
+    """The original approach: DictReader plus ast.literal_eval on every literal cell"""
+    rows = 0
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for column in literal_columns:
+                row[column] = ast.literal_eval(row[column])
+            rows += 1
+    return rows
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    rows = func(*args)
+    elapsed = time.perf_counter() - start
+    return {"rows": rows, "seconds": elapsed, "rows_per_s": rows / elapsed if elapsed else None}
+
+
+def run(args):
+    work_dir = tempfile.mkdtemp(prefix="codeholics-ingest-")
+    paths = generate_dataset(work_dir, args.users, args.courses, seed=args.seed)
+    results = {}
+    for name, schema, literal_columns in (("users", ingest.USER_SCHEMA, USER_LITERAL_COLUMNS),
+                                          ("courses", ingest.COURSE_SCHEMA, COURSE_LITERAL_COLUMNS)):
+        path = paths[name]
+        baseline = measure(literal_eval_baseline, path, literal_columns)
+        single = measure(lambda: len(ingest.ingest(path, schema, workers=1, chunk_rows=args.chunk_rows)))
+        pooled = measure(lambda: len(ingest.ingest(path, schema, workers=args.workers, chunk_rows=args.chunk_rows)))
+        results[name] = {
+            "literal_eval": baseline,
+            "tokenizer": dict(single, speedup=baseline["seconds"] / single["seconds"]),
+            "tokenizer_pool": dict(pooled, workers=args.workers or os.cpu_count(),
+                                   speedup=baseline["seconds"] / pooled["seconds"]),
+        }
+    return {"meta": {"commit": git_commit(), "timestamp": time.time(), "params": vars(args)}, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the literal-column tokenizer with ast.literal_eval")
+    parser.add_argument("--users", type=int, default=200000)
+    parser.add_argument("--courses", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (defaults to the CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=ingest.CHUNK_ROWS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="ingest_benchmark.json")
+    args = parser.parse_args()
+
+    document = run(args)
+    with open(args.out, "w") as f:
+        json.dump(document, f, indent=2)
+    for name, result in document["results"].items():
+        for method, stats in result.items():
+            speedup = f" x{stats['speedup']:.1f}" if "speedup" in stats else ""
+            print(f"{name:8s} {method:15s} {stats['rows_per_s']:12,.0f} rows/s{speedup}")
+
+
+if __name__ == "__main__":
+    main()
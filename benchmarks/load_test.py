@@ -0,0 +1,223 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from benchmarks.run_benchmarks import Timer, git_commit
+
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+
+# Pages of the dashboard's sidebar "Navigation" radio, visited in order
+NAV_PAGES = ["Dashboard", "Learning Path", "Skill Analysis", "Peer Network"]
+
+# How often the lock probe tries to take the database write lock (seconds)
+PROBE_INTERVAL = 0.01
+
+
+def rss_bytes():
+    """Current resident set size of this process (0 where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def prepare_environment(work_dir, accounts, seed):
+    """Point the app at a fresh generated database and cache file under `work_dir`"""
+    os.environ["CODEHOLICS_DB_PATH"] = os.path.join(work_dir, "load_test.db")
+    os.environ["CODEHOLICS_CACHE_PATH"] = os.path.join(work_dir, "cache.db")
+
+    from database.db_functions import init_connection
+    from database.models import User
+    from utils.data_generator import generate_dataset
+
+    paths = generate_dataset(work_dir, users=0, courses=0, accounts=accounts, seed=seed)
+    conn = init_connection()
+    try:
+        User.import_from_csv(conn, paths["accounts"])
+    finally:
+        conn.close()
+    return os.environ["CODEHOLICS_DB_PATH"]
+
+
+class LockProbe:
+    """Samples how long it takes to get the database write lock while the sessions run
+
+    Each sample is a BEGIN IMMEDIATE/ROLLBACK pair, so a slow sample means
+    some session was holding the write lock at that moment.
+    """
+
+    def __init__(self, db_path, interval=PROBE_INTERVAL):
+        self.db_path = db_path
+        self.interval = interval
+        self.timer = Timer()
+        self.timeouts = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lock-probe", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _acquire(self, conn):
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("ROLLBACK")
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    self.timer.time(self._acquire, conn)
+                except sqlite3.OperationalError:
+                    self.timeouts += 1
+        finally:
+            conn.close()
+
+    def summary(self, threshold_ms=1.0):
+        waited = sum(1 for sample in self.timer.samples if sample * 1000 > threshold_ms)
+        samples = len(self.timer.samples)
+        return dict(self.timer.summary(), timeouts=self.timeouts,
+                    contended_fraction=waited / samples if samples else 0.0)
+
+
+class Session:
+    """One simulated browser session driving app.py through Streamlit's AppTest"""
+
+    def __init__(self, n, timers, errors, timeout):
+        self.n = n
+        self.timers = timers
+        self.errors = errors
+        self.timeout = timeout
+        self.at = None
+
+    def step(self, name, action):
+        start = time.perf_counter()
+        action()
+        self.timers.setdefault(name, Timer()).samples.append(time.perf_counter() - start)
+        for exception in self.at.exception:
+            self.errors.append({"session": self.n, "step": name, "error": exception.message})
+
+    def _button(self, key):
+        return self.at.button(key=key)
+
+    def open(self):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(APP_PATH, default_timeout=self.timeout)
+        self.step("open", self.at.run)
+
+    def login(self):
+        self.at.text_input[0].input(f"user{self.n}@example.com")
+        self.at.text_input[1].input(f"password{self.n}")
+        submit = next(b for b in self.at.button if b.key != "login_button_sidebar" and b.label == "Login")
+        self.step("login", lambda: submit.click().run())
+        if not self.at.session_state["authenticated"]:
+            self.errors.append({"session": self.n, "step": "login", "error": "login rejected"})
+            return False
+        return True
+
+    def browse(self):
+        self.step("dashboard", lambda: self._button("dashboard_button").click().run())
+        for page in NAV_PAGES:
+            radio = next(r for r in self.at.sidebar.radio if r.label == "Navigation")
+            self.step(f"page:{page}", lambda: radio.set_value(page).run())
+
+    def logout(self):
+        self.step("logout", lambda: self._button("logout_button").click().run())
+
+    def walk(self):
+        self.open()
+        if self.login():
+            self.browse()
+            self.logout()
+
+
+def run(args):
+    work_dir = tempfile.mkdtemp(prefix="codeholics-load-")
+    db_path = prepare_environment(work_dir, args.sessions, args.seed)
+
+    timers = {}
+    errors = []
+    rounds = []
+    rss_start = rss_bytes()
+
+    probe = LockProbe(db_path)
+    probe.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        for round_no in range(args.rounds):
+            round_started = time.perf_counter()
+            # Each round is a fresh wave of N concurrent sessions; RSS after each shows retained growth
+            sessions = [Session(n, timers, errors, args.timeout) for n in range(1, args.sessions + 1)]
+            for future in [pool.submit(session.walk) for session in sessions]:
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append({"round": round_no, "error": repr(e)})
+            rounds.append({"round": round_no, "wall_s": time.perf_counter() - round_started,
+                           "rss_mb": rss_bytes() / 2 ** 20})
+    elapsed = time.perf_counter() - started
+    probe.stop()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.time(),
+            "params": vars(args),
+            "work_dir": work_dir,
+        },
+        "steps": {name: timer.summary() for name, timer in timers.items()},
+        "lock_probe": probe.summary(),
+        "memory": {
+            "rss_start_mb": rss_start / 2 ** 20,
+            "rss_end_mb": rss_bytes() / 2 ** 20,
+            "growth_per_session_kb": (rss_bytes() - rss_start) / 1024 / (args.sessions * args.rounds),
+            "rounds": rounds,
+        },
+        "walks_per_s": args.sessions * args.rounds / elapsed if elapsed else None,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive N concurrent app sessions through login, dashboard and logout")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions (one account each)")
+    parser.add_argument("--rounds", type=int, default=3, help="Waves of sessions; memory is sampled after each")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds allowed for one script run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="load_test.json")
+    args = parser.parse_args()
+
+    document = run(args)
+    with open(args.out, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    for name, result in document["steps"].items():
+        print(f"{name:22s} ops={result['ops']:<6d} p50={result['p50_ms']:9.1f}ms "
+              f"p95={result['p95_ms']:9.1f}ms p99={result['p99_ms']:9.1f}ms")
+    probe = document["lock_probe"]
+    print(f"write lock: p99 wait={probe.get('p99_ms', 0):.2f}ms contended={probe['contended_fraction']:.1%} "
+          f"timeouts={probe['timeouts']}")
+    memory = document["memory"]
+    print(f"rss: {memory['rss_start_mb']:.1f}MB -> {memory['rss_end_mb']:.1f}MB "
+          f"({memory['growth_per_session_kb']:.1f}KB per session)")
+    if document["errors"]:
+        print(f"{len(document['errors'])} errors, first: {document['errors'][0]}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import platform
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import User
+from database import events
+from utils.data_generator import generate_dataset
+from utils.datasets import load_users, load_courses
+from utils.recommender import recommend_courses
+from utils.dashboard_data import assemble_dashboard
+
+# Relative slowdown reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.10
+
+
+class Timer:
+    """Collects per-operation timings for one benchmark"""
+
+    def __init__(self):
+        self.samples = []
+
+    def time(self, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.samples.append(time.perf_counter() - start)
+        return result
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        total = sum(ordered)
+        if not ordered:
+            return {"ops": 0, "total_s": 0.0}
+
+        def pct(q):
+            return ordered[min(len(ordered) - 1, int(q * (len(ordered) - 1)))] * 1000
+
+        return {
+            "ops": len(ordered),
+            "total_s": total,
+            "ops_per_s": len(ordered) / total if total else None,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+        }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    """Run every benchmark and return the results document"""
+    rng = random.Random(args.seed)
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix="codeholics-bench-")
+
+    timer = Timer()
+    paths = timer.time(generate_dataset, work_dir, args.users, args.courses, args.accounts, args.seed)
+    results["generate_dataset"] = timer.summary()
+
+    timer = Timer()
+    courses = timer.time(load_courses, paths["courses"])
+    results["csv_parse_courses"] = dict(timer.summary(), rows=len(courses))
+
+    timer = Timer()
+    users = timer.time(load_users, paths["users"])
+    results["csv_parse_users"] = dict(timer.summary(), rows=len(users))
+
+    conn = sqlite3.connect(os.path.join(work_dir, "bench.db"))
+    User.create_table(conn)
+    timer = Timer()
+    timer.time(User.import_from_csv, conn, paths["accounts"])
+    results["csv_import_accounts"] = dict(timer.summary(), rows=args.accounts)
+
+    emails = [f"user{rng.randint(1, args.accounts)}@example.com" for _ in range(args.lookups)]
+    timer = Timer()
+    for email in emails:
+        timer.time(User.get_by_email, conn, email)
+    results["user_get_by_email"] = timer.summary()
+
+    timer = Timer()
+    for _ in range(args.logins):
+        n = rng.randint(1, args.accounts)
+        user = User.get_by_email(conn, f"user{n}@example.com")
+        timer.time(user.check_password, f"password{n}")
+    results["login_verify"] = timer.summary()
+
+    events.create_tables(conn)
+    event_types = sorted(events.EVENT_TYPES)
+    batch = []
+    for _ in range(args.events):
+        event_type = rng.choice(event_types)
+        value = rng.random() if event_type in (events.COURSE_PROGRESS, events.TIME_SPENT) else (
+            rng.uniform(50, 100) if event_type == events.QUIZ_SCORED else None)
+        batch.append((f"U{rng.randint(1, args.users):03d}", f"C{rng.randint(1, args.courses):03d}",
+                      event_type, value, time.time()))
+    timer = Timer()
+    for start in range(0, len(batch), args.event_batch):
+        timer.time(events.append_events, conn, batch[start:start + args.event_batch])
+    results["event_ingest"] = dict(timer.summary(), events=len(batch),
+                                   events_per_s=len(batch) / sum(timer.samples) if timer.samples else None)
+    conn.close()
+
+    sample = rng.sample(users, min(args.score_users, len(users)))
+    timer = Timer()
+    for user in sample:
+        timer.time(recommend_courses, user, courses, args.k)
+    results["recommendation_scoring"] = timer.summary()
+
+    timer = Timer()
+    for user in sample:
+        timer.time(assemble_dashboard, user, courses, args.k)
+    results["dashboard_assembly"] = timer.summary()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": vars(args),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current):
+    """Print per-benchmark p50 changes and return the names that regressed"""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before or not before.get("p50_ms") or "p50_ms" not in result:
+            continue
+        change = (result["p50_ms"] - before["p50_ms"]) / before["p50_ms"]
+        flag = ""
+        if change > REGRESSION_THRESHOLD:
+            regressions.append(name)
+            flag = "  <-- regression"
+        print(f"{name:28s} {before['p50_ms']:10.3f}ms -> {result['p50_ms']:10.3f}ms ({change:+.1%}){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data import, login and recommendation paths")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--courses", type=int, default=1000)
+    parser.add_argument("--accounts", type=int, default=200,
+                        help="Accounts imported into SQLite (each one costs a password hash)")
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--event-batch", type=int, default=1000)
+    parser.add_argument("--score-users", type=int, default=500)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    document = run(args)
+    with open(args.out, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    for name, result in document["results"].items():
+        print(f"{name:28s} ops={result['ops']:<8d} total={result['total_s']:.3f}s p50={result.get('p50_ms', 0):.3f}ms")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, document):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+import os
+import sys
+import json
+import mmap
+import time
+import shutil
+import bisect
+import hashlib
+import sqlite3
+import argparse
+import threading
+from array import array
+
+from utils.datasets import USERS_CSV, COURSES_CSV, load_users, load_courses
+from utils.recommender import recommend_courses, career_matches, CAREER_SKILLS
+from database import recommendations, similar_courses
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACTS_DIR = os.environ.get("CODEHOLICS_ARTIFACTS_DIR", os.path.join(BASE_DIR, "artifacts"))
+
+# Name of the file holding the live version's directory name
+CURRENT = "CURRENT"
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+# Old versions kept next to the live one, for rollback and for workers still mapping them
+KEEP_VERSIONS = 3
+
+# How often workers check CURRENT for a new version (seconds)
+POLL_INTERVAL = 10.0
+
+DEFAULT_K = 5
+CAREER_K = 3
+
+# Bundle sections that stand in for database tables
+RECOMMENDATIONS = "recommendations"
+SIMILAR = "similar"
+
+
+# --- Writing ---
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BundleWriter:
+    """Writes flat binary arrays and string tables into a bundle directory and records them in the manifest"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        os.makedirs(path)
+
+    def array(self, name, typecode, values, shape=None):
+        data = values if isinstance(values, array) else array(typecode, values)
+        file_name = f"{name}.{typecode}.bin"
+        with open(os.path.join(self.path, file_name), "wb") as f:
+            data.tofile(f)
+        self.entries[name] = {"kind": "array", "file": file_name, "typecode": typecode,
+                              "length": len(data), "shape": shape or [len(data)]}
+
+    def strings(self, name, values):
+        """A string table: utf-8 blob plus uint64 offsets; string i is blob[offsets[i]:offsets[i + 1]]"""
+        offsets = array("Q", [0])
+        blob = bytearray()
+        for value in values:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        blob_file = f"{name}.utf8"
+        with open(os.path.join(self.path, blob_file), "wb") as f:
+            f.write(blob)
+        self.array(f"{name}.offsets", "Q", offsets)
+        self.entries[name] = {"kind": "strings", "file": blob_file, "length": len(offsets) - 1}
+
+    def finish(self, meta):
+        for entry in self.entries.values():
+            entry["sha256"] = _sha256(os.path.join(self.path, entry["file"]))
+        manifest = {"format": FORMAT_VERSION, "byteorder": sys.byteorder, "created_at": time.time(),
+                    "meta": meta, "entries": self.entries}
+        with open(os.path.join(self.path, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def _matrix(rows, width, fill):
+    """Flatten ragged rows into a row-major list padded to `width`"""
+    flat = []
+    for row in rows:
+        flat.extend(row[:width])
+        flat.extend([fill] * (width - len(row[:width])))
+    return flat
+
+
+def watermarks(conn):
+    """Data versions of the database tables each bundle section stands in for"""
+    return {RECOMMENDATIONS: recommendations.data_version(conn), SIMILAR: similar_courses.data_version(conn)}
+
+
+def stored_similar(conn, course_ids):
+    """{course_id: [(neighbour_id, score)]} exactly as the database serves them, for build_bundle's `similar`"""
+    return {course_id: [(other, score) for other, _, score in rows]
+            for course_id, rows in similar_courses.get_similar_many(conn, course_ids).items()}
+
+
+def build_bundle(root, users, courses, k=DEFAULT_K, similar=None, watermarks=None):
+    """Compute the derived structures, write them as a new version under `root` and make it live
+
+    `users` is a list of parsed users and `courses` a dict of parsed courses.
+    `similar` optionally maps course_id -> [(neighbour_id, score)].
+    `watermarks` records the database versions the bundle supersedes (see
+    watermarks()); a section is served only while the database is unchanged.
+    """
+    course_ids = sorted(courses)
+    course_index = {course_id: i for i, course_id in enumerate(course_ids)}
+    careers = sorted(CAREER_SKILLS)
+    career_index = {career: i for i, career in enumerate(careers)}
+    users = sorted(users, key=lambda user: user["user_id"])
+
+    rec_rows, rec_scores, career_rows, career_scores = [], [], [], []
+    for user in users:
+        picks = recommend_courses(user, courses, k)
+        rec_rows.append([course_index[course_id] for course_id, _ in picks])
+        rec_scores.append([score for _, score in picks])
+        matches = career_matches(user, CAREER_K)
+        career_rows.append([career_index[career] for career, _ in matches])
+        career_scores.append([match for _, match in matches])
+
+    version = time.strftime("v%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+    staging = os.path.join(root, f".{version}.tmp")
+    writer = BundleWriter(staging)
+    writer.strings("users", [user["user_id"] for user in users])
+    writer.strings("courses", course_ids)
+    writer.strings("course_titles", [courses[course_id]["title"] for course_id in course_ids])
+    writer.strings("careers", careers)
+    writer.array("recommendations", "i", _matrix(rec_rows, k, -1), [len(users), k])
+    writer.array("recommendation_scores", "f", _matrix(rec_scores, k, 0.0), [len(users), k])
+    writer.array("career_matches", "i", _matrix(career_rows, CAREER_K, -1), [len(users), CAREER_K])
+    writer.array("career_scores", "f", _matrix(career_scores, CAREER_K, 0.0), [len(users), CAREER_K])
+    if similar is not None:
+        rows = [[course_index[other] for other, _ in similar.get(course_id, ()) if other in course_index]
+                for course_id in course_ids]
+        scores = [[score for other, score in similar.get(course_id, ()) if other in course_index]
+                  for course_id in course_ids]
+        writer.array("similar", "i", _matrix(rows, k, -1), [len(course_ids), k])
+        writer.array("similar_scores", "f", _matrix(scores, k, 0.0), [len(course_ids), k])
+    writer.finish({"users": len(users), "courses": len(course_ids), "k": k, "watermarks": watermarks or {}})
+
+    # Publish: the version directory appears whole, then CURRENT is replaced in one rename
+    os.rename(staging, os.path.join(root, version))
+    pointer = os.path.join(root, f".{CURRENT}.tmp")
+    with open(pointer, "w") as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(root, CURRENT))
+    prune(root, keep=KEEP_VERSIONS)
+    return version
+
+
+def prune(root, keep=KEEP_VERSIONS):
+    """Delete all but the newest `keep` versions besides the live one"""
+    live = current_version(root)
+    versions = sorted(name for name in os.listdir(root) if name.startswith("v") and name != live)
+    for name in versions[:max(0, len(versions) - keep)]:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+# --- Reading ---
+def current_version(root):
+    try:
+        with open(os.path.join(root, CURRENT)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class _Strings:
+    """Read-only sequence view over a mapped string table"""
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def index(self, value):
+        """Position of `value` in a sorted table by binary search, or -1"""
+        i = bisect.bisect_left(self, value)
+        return i if i < len(self) and self[i] == value else -1
+
+
+class Bundle:
+    """One memory-mapped bundle version
+
+    Every file is mapped read-only, so all workers on a host share the same
+    page-cache pages and opening a bundle reads nothing but the manifest
+    (plus one pass over each file when `verify` is set).
+    """
+
+    def __init__(self, path, verify=True):
+        self.path = path
+        self.version = os.path.basename(path)
+        with open(os.path.join(path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        self.watermarks = self.manifest["meta"].get("watermarks", {})
+        if self.manifest["format"] != FORMAT_VERSION or self.manifest["byteorder"] != sys.byteorder:
+            raise ValueError(f"Bundle {self.version} was written in an incompatible format")
+        self._maps = {}
+        self.entries = {}
+        for name, entry in self.manifest["entries"].items():
+            if verify and _sha256(os.path.join(path, entry["file"])) != entry["sha256"]:
+                raise ValueError(f"Checksum mismatch for {entry['file']} in bundle {self.version}")
+        for name, entry in self.manifest["entries"].items():
+            if entry["kind"] == "array":
+                self.entries[name] = self._map(entry["file"]).cast(entry["typecode"])
+        for name, entry in self.manifest["entries"].items():
+            if entry["kind"] == "strings":
+                self.entries[name] = _Strings(self._map(entry["file"]), self.entries[f"{name}.offsets"])
+
+    def _map(self, file_name):
+        with open(os.path.join(self.path, file_name), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[file_name] = mapped
+        return memoryview(mapped)
+
+    def _row(self, name, index):
+        width = self.manifest["entries"][name]["shape"][1]
+        return self.entries[name][index * width:(index + 1) * width]
+
+    def _top(self, rows_name, scores_name, index):
+        """(label index, score) pairs of one row, padding dropped"""
+        return [(i, score) for i, score in zip(self._row(rows_name, index), self._row(scores_name, index)) if i >= 0]
+
+    def recommendations(self, user_id):
+        """Return {"courses": [...], "careers": [...]} of (id, label, score), or None for an unknown user"""
+        index = self.entries["users"].index(user_id)
+        if index < 0:
+            return None
+        course_ids, titles, careers = (self.entries[name] for name in ("courses", "course_titles", "careers"))
+        return {
+            "courses": [(course_ids[i], titles[i], score)
+                        for i, score in self._top("recommendations", "recommendation_scores", index)],
+            "careers": [(careers[i], careers[i], score)
+                        for i, score in self._top("career_matches", "career_scores", index)],
+        }
+
+    def similar(self, course_id):
+        """Return [(neighbour_id, title, score)] for a course, or None if the bundle has no neighbours"""
+        if "similar" not in self.entries:
+            return None
+        course_ids, titles = self.entries["courses"], self.entries["course_titles"]
+        index = course_ids.index(course_id)
+        if index < 0:
+            return None
+        return [(course_ids[i], titles[i], score) for i, score in self._top("similar", "similar_scores", index)]
+
+
+class BundleWatcher:
+    """Keeps the live bundle mapped and swaps to a new version when CURRENT changes
+
+    Readers take `self.fresh(section)` once per request; a swap replaces the
+    reference after the new version has been opened and verified, and the old
+    mappings are released when the last reader drops them. `watermarks` is a
+    callable returning the database's current watermarks(); each poll compares
+    them with the bundle's, and a section the database has moved past is not
+    served until a newer bundle is built.
+    """
+
+    def __init__(self, root=ARTIFACTS_DIR, poll_interval=POLL_INTERVAL, watermarks=None):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.watermarks = watermarks
+        # (bundle, stale sections), swapped as one reference
+        self._live = (None, frozenset())
+        # A version that failed to load is not re-read (and re-hashed) until CURRENT names another
+        self.failed_version = None
+        self.swaps = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self.check()
+
+    @property
+    def bundle(self):
+        return self._live[0]
+
+    def fresh(self, section):
+        """The live bundle, or None if there is none or the database is newer for `section`"""
+        bundle, stale = self._live
+        return None if bundle is None or section in stale else bundle
+
+    def check(self):
+        """Load the live version if it differs from the mapped one and re-check staleness; return True on a swap"""
+        bundle, stale = self._live
+        version = current_version(self.root)
+        swapped = False
+        if version is not None and version != self.failed_version and (bundle is None or bundle.version != version):
+            try:
+                bundle = Bundle(os.path.join(self.root, version))
+                swapped = True
+                self.failed_version = None
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Artifact bundle {version} not loaded, keeping {bundle.version if bundle else 'none'}: {e}")
+                self.failed_version = version
+        if bundle is not None and self.watermarks is not None:
+            try:
+                current = self.watermarks()
+                stale = frozenset(section for section, value in current.items() if bundle.watermarks.get(section) != value)
+            except sqlite3.Error as e:
+                print(f"Artifact watermarks not read: {e}")
+        self._live = (bundle, stale)
+        if swapped:
+            self.swaps += 1
+        return swapped
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="artifact-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                # One bad poll must not stop the watcher; the next one tries again
+                print(f"Artifact watcher check failed: {type(e).__name__}: {e}")
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the precomputed artifact bundle")
+    parser.add_argument("command", choices=["build", "verify"])
+    parser.add_argument("--root", default=ARTIFACTS_DIR)
+    parser.add_argument("--users-csv", default=USERS_CSV)
+    parser.add_argument("--courses-csv", default=COURSES_CSV)
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--db", help="SQLite file whose watermarks the bundle records (defaults to the app database)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        from database.db_functions import get_db_path, create_tables
+
+        courses = load_courses(args.courses_csv)
+        # Neighbours are copied from the database in the same read transaction as the watermarks, so a
+        # fresh bundle serves exactly what get_similar() would; writes made during the build leave it stale
+        conn = sqlite3.connect(args.db or get_db_path())
+        create_tables(conn)
+        conn.execute("BEGIN")
+        marks = watermarks(conn)
+        similar = stored_similar(conn, sorted(courses))
+        conn.execute("COMMIT")
+        conn.close()
+
+        os.makedirs(args.root, exist_ok=True)
+        version = build_bundle(args.root, load_users(args.users_csv), courses, args.k, similar, marks)
+        print(f"Built and published {version}")
+    else:
+        version = current_version(args.root)
+        if version is None:
+            sys.exit("No live bundle")
+        bundle = Bundle(os.path.join(args.root, version))
+        print(f"{version}: {len(bundle.manifest['entries'])} entries, checksums ok")
+
+
+if __name__ == "__main__":
+    main()
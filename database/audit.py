@@ -0,0 +1,160 @@
+import re
+import time
+import sqlite3
+import argparse
+import datetime
+
+# --- Event types ---
+LOGIN_SUCCEEDED = "login_succeeded"
+LOGIN_FAILED = "login_failed"
+LOGIN_RATE_LIMITED = "login_rate_limited"
+LOGOUT = "logout"
+
+# One table per calendar month, so retention drops whole tables instead of deleting rows
+PARTITION_PREFIX = "audit_log_"
+_PARTITION_RE = re.compile(rf"{PARTITION_PREFIX}(\d{{4}})(\d{{2}})")
+
+# Months of audit history kept, counting the current one
+RETENTION_MONTHS = 6
+
+ACTIVE_USERS_SQL = "SELECT COUNT(*) FROM user_last_seen WHERE last_seen_at >= ?"
+LAST_SEEN_SQL = """INSERT INTO user_last_seen (username, last_seen_at) VALUES (?, ?)
+    ON CONFLICT(username) DO UPDATE SET last_seen_at = MAX(last_seen_at, excluded.last_seen_at)"""
+
+
+def create_tables(conn):
+    """Create the last-seen table and the current month's audit partition if they don't exist
+
+    user_last_seen keeps one row per user with their latest successful login,
+    so "active in the last N days" is an index range count, not a scan of the log.
+    """
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS user_last_seen (
+        username TEXT PRIMARY KEY,
+        last_seen_at REAL NOT NULL
+    )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_last_seen_at ON user_last_seen (last_seen_at)")
+    conn.commit()
+    ensure_partition(conn, partition_for(time.time()))
+
+
+def partition_for(timestamp):
+    """Name of the monthly partition holding a unix timestamp ("audit_log_202610")"""
+    return PARTITION_PREFIX + datetime.date.fromtimestamp(timestamp).strftime("%Y%m")
+
+
+def ensure_partition(conn, partition):
+    """Create one monthly partition with its indexes"""
+    if not _PARTITION_RE.fullmatch(partition):
+        raise ValueError(f"not an audit partition: {partition}")
+    cursor = conn.cursor()
+    cursor.execute(f'''
+    CREATE TABLE IF NOT EXISTS {partition} (
+        id INTEGER PRIMARY KEY,
+        created_at REAL NOT NULL,
+        event TEXT NOT NULL,
+        username TEXT,
+        email TEXT,
+        session_id TEXT
+    )
+    ''')
+    # Covers time-range queries per event type and per-account reviews
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{partition}_event ON {partition} (event, created_at, username)")
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{partition}_email ON {partition} (email, created_at)")
+    conn.commit()
+
+
+def insert_sql(partition):
+    return f"INSERT INTO {partition} (created_at, event, username, email, session_id) VALUES (?, ?, ?, ?, ?)"
+
+
+def partitions(conn):
+    """Existing partitions, oldest first"""
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?",
+                        (PARTITION_PREFIX + "%",)).fetchall()
+    return sorted(row[0] for row in rows if _PARTITION_RE.fullmatch(row[0]))
+
+
+def _month_start(timestamp, months_back=0):
+    date = datetime.date.fromtimestamp(timestamp)
+    index = date.year * 12 + date.month - 1 - months_back
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+# --- Queries ---
+def events_between(conn, start, end, event=None, email=None):
+    """Audit entries with start <= created_at < end as (created_at, event, username, email, session_id)
+
+    Only the partitions overlapping the range are read; filtering by event
+    or email uses that partition's index.
+    """
+    first = PARTITION_PREFIX + _month_start(start).strftime("%Y%m")
+    last = partition_for(end)
+    conditions, params = ["created_at >= ?", "created_at < ?"], [start, end]
+    if event is not None:
+        conditions.append("event = ?")
+        params.append(event)
+    if email is not None:
+        conditions.append("email = ?")
+        params.append(email)
+    where = " AND ".join(conditions)
+    rows = []
+    for partition in partitions(conn):
+        if first <= partition <= last:
+            rows.extend(conn.execute(
+                f"SELECT created_at, event, username, email, session_id FROM {partition} WHERE {where} ORDER BY created_at",
+                params).fetchall())
+    return rows
+
+
+def active_users(conn, days=7, now=None):
+    """Number of users with a successful login in the last `days` days"""
+    now = time.time() if now is None else now
+    return conn.execute(ACTIVE_USERS_SQL, (now - days * 86400,)).fetchone()[0]
+
+
+def prune(conn, retention_months=RETENTION_MONTHS, now=None):
+    """Drop partitions older than the retention window; returns the dropped names"""
+    now = time.time() if now is None else now
+    oldest = _month_start(now, retention_months - 1)
+    cutoff = time.mktime(oldest.timetuple())
+    dropped = [partition for partition in partitions(conn)
+               if partition < PARTITION_PREFIX + oldest.strftime("%Y%m")]
+    with conn:
+        for partition in dropped:
+            conn.execute(f"DROP TABLE {partition}")
+        conn.execute("DELETE FROM user_last_seen WHERE last_seen_at < ?", (cutoff,))
+    return dropped
+
+
+def main():
+    from database.db_functions import get_db_path
+
+    parser = argparse.ArgumentParser(description="Inspect and prune the login audit log")
+    parser.add_argument("command", choices=["active", "failures", "prune"])
+    parser.add_argument("--db", help="SQLite file to use (defaults to the app database)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--retention-months", type=int, default=RETENTION_MONTHS)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db or get_db_path())
+    create_tables(conn)
+    try:
+        if args.command == "active":
+            print(f"{active_users(conn, args.days)} users logged in during the last {args.days} days")
+        elif args.command == "failures":
+            now = time.time()
+            for created_at, event, username, email, session_id in events_between(conn, now - args.days * 86400, now):
+                if event in (LOGIN_FAILED, LOGIN_RATE_LIMITED):
+                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created_at))} {event:20s} {email} {session_id}")
+        else:
+            dropped = prune(conn, args.retention_months)
+            print(f"Dropped {len(dropped)} partitions: {', '.join(dropped) or '-'}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import time
+import sqlite3
+import threading
+from database.models import Course
+from database import query_profiler
+
+# How often the background thread checks the catalog change counter (seconds)
+POLL_INTERVAL = 5.0
+
+# Rebuild at least this often even if no change was seen (seconds)
+MAX_AGE = 3600.0
+
+VERSION_SQL = "SELECT version FROM catalog_meta WHERE id = 1"
+
+
+def create_change_counter(conn):
+    """Create the catalog version row and the triggers that bump it on any courses write"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS catalog_meta (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+    cursor.execute("INSERT OR IGNORE INTO catalog_meta (id, version) VALUES (1, 0)")
+    for action in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS courses_version_{action.lower()}
+        AFTER {action} ON courses
+        BEGIN
+            UPDATE catalog_meta SET version = version + 1 WHERE id = 1;
+        END
+        ''')
+    conn.commit()
+
+
+def read_version(conn):
+    """Current catalog change counter"""
+    row = conn.execute(VERSION_SQL).fetchone()
+    return row[0] if row else 0
+
+
+class CatalogSnapshot:
+    """Immutable in-memory copy of the course catalog"""
+
+    def __init__(self, version, courses):
+        self.version = version
+        self.loaded_at = time.time()
+        self.courses = tuple(courses)
+        self.by_id = {course.id: course for course in self.courses}
+
+
+def build_snapshot(conn):
+    """Read the catalog and its version in one read transaction"""
+    conn.execute("BEGIN")
+    try:
+        version = read_version(conn)
+        courses = Course.get_all_courses(conn)
+    finally:
+        conn.execute("COMMIT")
+    return CatalogSnapshot(version, courses)
+
+
+class CatalogCache:
+    """Serves catalog reads from a snapshot that a background thread refreshes
+
+    Readers only dereference `self._snapshot`; a refresh builds a complete new
+    snapshot and swaps the reference, so readers never block or see a partial
+    catalog.
+    """
+
+    def __init__(self, db_path, poll_interval=POLL_INTERVAL, max_age=MAX_AGE, prepare=None):
+        self.db_path = db_path
+        self.prepare = prepare
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.refreshes = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               factory=query_profiler.connection_factory())
+
+    def current(self):
+        """Return the live snapshot, building the first one on demand"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    if self.prepare:
+                        conn = self._connect()
+                        try:
+                            self.prepare(conn)
+                        finally:
+                            conn.close()
+                    self.refresh()
+                    self._start()
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self):
+        """Build a new snapshot and swap it in"""
+        conn = self._connect()
+        try:
+            self._snapshot = build_snapshot(conn)
+            self.refreshes += 1
+        finally:
+            conn.close()
+        return self._snapshot
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="catalog-refresh", daemon=True)
+            self._thread.start()
+
+    def _watch(self):
+        conn = self._connect()
+        try:
+            while not self._stop.wait(self.poll_interval):
+                snapshot = self._snapshot
+                try:
+                    stale = (read_version(conn) != snapshot.version
+                             or time.time() - snapshot.loaded_at > self.max_age)
+                    if stale:
+                        self.refresh()
+                except sqlite3.Error as e:
+                    print(f"Catalog refresh failed: {e}")
+        finally:
+            conn.close()
+
+    def stop(self):
+        self._stop.set()
+
+    # --- Read API ---
+    def get_all(self):
+        return self.current().courses
+
+    def get_by_id(self, course_id):
+        return self.current().by_id.get(course_id)
@@ -0,0 +1,215 @@
+import csv
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+
+from utils.datasets import USERS_CSV, COURSES_CSV, parse_user_row, parse_course_row
+
+USERS = "users"
+COURSES = "courses"
+
+# Natural key column of each dataset
+KEY_COLUMNS = {USERS: "user_id", COURSES: "course_id"}
+
+# Rows written per transaction
+BATCH_SIZE = 5000
+
+
+def create_tables(conn):
+    """Create the sync state and learner profile tables if they don't exist
+
+    csv_sync_state remembers, per dataset row, the hash of its raw CSV cells
+    and the rowid it was written to, so a re-run only touches changed rows.
+    """
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS csv_sync_state (
+        dataset TEXT NOT NULL,
+        natural_key TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        row_id INTEGER,
+        PRIMARY KEY (dataset, natural_key)
+    ) WITHOUT ROWID
+    ''')
+    # Learner profiles from users.csv; separate from the login accounts in `users`
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS learner_profiles (
+        user_id TEXT PRIMARY KEY,
+        explicit_skills TEXT NOT NULL,
+        certifications TEXT NOT NULL,
+        completed_courses TEXT NOT NULL,
+        career_goals TEXT NOT NULL,
+        engagement_metrics TEXT NOT NULL
+    )
+    ''')
+    conn.commit()
+
+
+def row_hash(cells):
+    """Content hash of a raw CSV row"""
+    return hashlib.blake2b("\x1f".join(cells).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def diff(conn, dataset, csv_path):
+    """Compare a CSV with the stored hashes
+
+    Returns (header, changes, deletes, unchanged) where changes is a list of
+    (key, hash, cells, is_new, row_id) and deletes a list of (key, row_id).
+    Unchanged rows are hashed but never parsed.
+    """
+    stored = {key: (content_hash, row_id) for key, content_hash, row_id in conn.execute(
+        "SELECT natural_key, content_hash, row_id FROM csv_sync_state WHERE dataset = ?", (dataset,))}
+    changes = []
+    unchanged = 0
+    seen = set()
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        key_index = header.index(KEY_COLUMNS[dataset])
+        for cells in reader:
+            key = cells[key_index]
+            if key in seen:
+                raise ValueError(f"duplicate {KEY_COLUMNS[dataset]} {key} on line {reader.line_num} of {csv_path}")
+            seen.add(key)
+            content_hash = row_hash(cells)
+            previous = stored.get(key)
+            if previous is not None and previous[0] == content_hash:
+                unchanged += 1
+                continue
+            if previous is None:
+                changes.append((key, content_hash, cells, True, None))
+            else:
+                changes.append((key, content_hash, cells, False, previous[1]))
+    deletes = [(key, row_id) for key, (_, row_id) in stored.items() if key not in seen]
+    return header, changes, deletes, unchanged
+
+
+# --- Per-dataset writers ---
+def _write_course(conn, header, cells, row_id):
+    course = parse_course_row(dict(zip(header, cells)))
+    # courses.csv has no instructor; the app's courses table requires one
+    values = (course["title"], course["description"], "", f"{course['difficulty_level']:.1f}")
+    if row_id is None:
+        return conn.execute(
+            "INSERT INTO courses (name, description, instructor, difficulty) VALUES (?, ?, ?, ?)", values
+        ).lastrowid
+    conn.execute("UPDATE courses SET name = ?, description = ?, instructor = ?, difficulty = ? WHERE id = ?",
+                 values + (row_id,))
+    return row_id
+
+
+def _delete_course(conn, key, row_id):
+    conn.execute("DELETE FROM courses WHERE id = ?", (row_id,))
+
+
+def _write_user(conn, header, cells, row_id):
+    user = parse_user_row(dict(zip(header, cells)))
+    conn.execute(
+        """INSERT OR REPLACE INTO learner_profiles (user_id, explicit_skills, certifications, completed_courses,
+                                                    career_goals, engagement_metrics)
+        VALUES (?, ?, ?, ?, ?, ?)""",
+        (user["user_id"], json.dumps(user["explicit_skills"]), json.dumps(user["certifications"]),
+         json.dumps(user["completed_courses"]), json.dumps(user["career_goals"]),
+         json.dumps(user["engagement_metrics"])),
+    )
+    return None
+
+
+def _delete_user(conn, key, row_id):
+    conn.execute("DELETE FROM learner_profiles WHERE user_id = ?", (key,))
+
+
+WRITERS = {COURSES: (_write_course, _delete_course), USERS: (_write_user, _delete_user)}
+
+
+# --- Derived data ---
+def invalidate_derived(conn, dataset, header, changes, deletes):
+    """Drop only the derived rows that depend on the changed or deleted natural keys
+
+    The in-memory catalog refreshes itself through the courses triggers. A
+    course whose title, description or skills changed loses its stored
+    neighbours and its similar-courses fingerprint, so the next incremental
+    build recomputes it; a change to any other column keeps both. A deleted
+    course loses its neighbours but keeps its fingerprint, which is how the
+    build finds the courses that listed it. Users holding a changed or
+    deleted course (or, for users.csv, the changed users) are marked dirty
+    for the next recommendations refresh.
+    """
+    deleted = [key for key, _ in deletes]
+    keys = [change[0] for change in changes] + deleted
+    if not keys:
+        return
+    from database import recommendations, similar_courses
+
+    with conn:
+        if dataset == COURSES:
+            stored = dict(conn.execute("SELECT course_id, fingerprint FROM similar_course_fingerprints"))
+            reindex = [key for key, _, cells, _, _ in changes
+                       if stored.get(key) != similar_courses.course_fingerprint(parse_course_row(dict(zip(header, cells))))]
+            conn.executemany("DELETE FROM similar_course_fingerprints WHERE course_id = ?", [(key,) for key in reindex])
+            conn.executemany("DELETE FROM similar_courses WHERE course_id = ?", [(key,) for key in reindex + deleted])
+            if reindex or deleted:
+                conn.execute(similar_courses.UPDATED_SQL, (time.time(),))
+            holders = set()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                holders.update(row[0] for row in conn.execute(
+                    f"""SELECT DISTINCT user_id FROM user_recommendations
+                    WHERE kind = ? AND item_id IN ({', '.join('?' * len(chunk))})""",
+                    [recommendations.COURSE, *chunk]))
+            keys = holders
+    recommendations.mark_dirty(conn, keys)
+
+
+def sync(conn, dataset, csv_path, batch_size=BATCH_SIZE):
+    """Apply the inserts, updates and deletes that bring the database in line with a CSV"""
+    started = time.perf_counter()
+    header, changes, deletes, unchanged = diff(conn, dataset, csv_path)
+    write, delete = WRITERS[dataset]
+
+    inserted = sum(1 for change in changes if change[3])
+    for start in range(0, len(changes), batch_size):
+        with conn:
+            state = []
+            for key, content_hash, cells, _, row_id in changes[start:start + batch_size]:
+                state.append((dataset, key, content_hash, write(conn, header, cells, row_id)))
+            conn.executemany(
+                "INSERT OR REPLACE INTO csv_sync_state (dataset, natural_key, content_hash, row_id) VALUES (?, ?, ?, ?)",
+                state,
+            )
+    with conn:
+        for key, row_id in deletes:
+            delete(conn, key, row_id)
+        conn.executemany("DELETE FROM csv_sync_state WHERE dataset = ? AND natural_key = ?",
+                         [(dataset, key) for key, _ in deletes])
+
+    invalidate_derived(conn, dataset, header, changes, deletes)
+    return {"dataset": dataset, "inserted": inserted, "updated": len(changes) - inserted,
+            "deleted": len(deletes), "unchanged": unchanged, "seconds": time.perf_counter() - started}
+
+
+def main():
+    from database.db_functions import get_db_path, create_tables as create_app_tables
+
+    parser = argparse.ArgumentParser(description="Incrementally sync users.csv / courses.csv into the database")
+    parser.add_argument("--db", help="SQLite file to sync (defaults to the app database)")
+    parser.add_argument("--users-csv", default=USERS_CSV)
+    parser.add_argument("--courses-csv", default=COURSES_CSV)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db or get_db_path())
+    conn.execute("PRAGMA journal_mode=WAL")
+    create_app_tables(conn)
+    try:
+        for dataset, path in ((COURSES, args.courses_csv), (USERS, args.users_csv)):
+            stats = sync(conn, dataset, path)
+            print(f"{dataset}: {stats['inserted']} inserted, {stats['updated']} updated, {stats['deleted']} deleted, "
+                  f"{stats['unchanged']} unchanged in {stats['seconds']:.2f}s")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
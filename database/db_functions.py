@@ -2,30 +2,70 @@ import sqlite3
 import pandas as pd
 import os
 import csv
-from database.models import User, Course  # Import Course model
+import time
+import threading
+from database.models import User, Course, Feedback, ConnectionRequest  # Import Course model
+from database import events, timeseries, recommendations, similar_courses, query_profiler, csv_sync, artifacts, audit
+from database.write_behind import WriteBehindQueue
+from database.catalog import CatalogCache, create_change_counter
+from utils import tracing
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+_catalog = None
+_catalog_lock = threading.Lock()
+_artifacts = None
+_artifacts_lock = threading.Lock()
+# Database files whose schema has been checked by this process
+_schema_ready = set()
+# Audit partitions known to exist, so only the first login of a month creates one
+_audit_partitions = set()
+
+def get_db_path():
+    """Path of the application's SQLite database file (CODEHOLICS_DB_PATH overrides it)"""
+    override = os.environ.get("CODEHOLICS_DB_PATH")
+    if override:
+        return override
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "database", "database.db")
+
+def create_tables(conn):
+    """Create every application table that doesn't exist yet"""
+    User.create_table(conn)
+    Course.create_table(conn)
+    create_change_counter(conn)
+    Feedback.create_table(conn)
+    ConnectionRequest.create_table(conn)
+    events.create_tables(conn)
+    timeseries.create_table(conn)
+    recommendations.create_tables(conn)
+    similar_courses.create_tables(conn)
+    csv_sync.create_tables(conn)
+    audit.create_tables(conn)
 
 def init_connection():
     """Initialize database connection and create tables if they don't exist"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
     # Create a database directory if it doesn't exist
-    db_dir = os.path.join(base_dir, "database")
-    os.makedirs(db_dir, exist_ok=True)
+    db_path = get_db_path()
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
     # Connect to database
-    db_path = os.path.join(db_dir, "database.db")
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn = sqlite3.connect(db_path, check_same_thread=False, factory=query_profiler.connection_factory())
     conn.row_factory = sqlite3.Row
+    # WAL lets readers proceed while event batches are being written
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     
-    # Create tables
-    User.create_table(conn)
-    Course.create_table(conn)
+    # Create tables once per process; later connections skip the schema check
+    if db_path not in _schema_ready:
+        create_tables(conn)
+        _schema_ready.add(db_path)
     
     return conn
 
 # --- User Management ---
 def import_users_from_csv():
-    """Import users from users.csv into the database"""
+    """Sync learner profiles from users.csv, applying only added, changed and removed rows"""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     csv_path = os.path.join(base_dir, "data", "users.csv")
 
@@ -35,8 +75,8 @@ def import_users_from_csv():
 
     conn = init_connection()
     try:
-        User.import_from_csv(conn, csv_path)
-        print("Users imported successfully.")
+        stats = csv_sync.sync(conn, csv_sync.USERS, csv_path)
+        print(f"Users synced: {stats['inserted']} inserted, {stats['updated']} updated, {stats['deleted']} deleted.")
     except Exception as e:
         print(f"Error importing users: {e}")
     finally:
@@ -58,7 +98,7 @@ def get_user_by_email(email):
 
 # --- Course Management ---
 def import_courses_from_csv():
-    """Import courses from courses.csv into the database"""
+    """Sync courses from courses.csv, applying only added, changed and removed rows"""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     csv_path = os.path.join(base_dir, "data", "courses.csv")
 
@@ -68,23 +108,177 @@ def import_courses_from_csv():
 
     conn = init_connection()
     try:
-        Course.import_from_csv(conn, csv_path)
-        print("Courses imported successfully.")
+        stats = csv_sync.sync(conn, csv_sync.COURSES, csv_path)
+        print(f"Courses synced: {stats['inserted']} inserted, {stats['updated']} updated, {stats['deleted']} deleted.")
     except Exception as e:
         print(f"Error importing courses: {e}")
     finally:
         conn.close()
 
+def get_catalog():
+    """Process-wide in-memory course catalog, refreshed in the background when courses change"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = CatalogCache(get_db_path(), prepare=create_tables)
+    return _catalog
+
 def get_all_courses():
-    """Fetch all courses from the database"""
+    """Fetch all courses from the in-memory catalog snapshot (treat as read-only)"""
+    return list(get_catalog().get_all())
+
+def get_course_by_id(course_id):
+    """Fetch a single course by ID from the in-memory catalog snapshot"""
+    return get_catalog().get_by_id(course_id)
+
+# --- Learning Events ---
+def record_learning_events(batch):
+    """Append (user_id, course_id, event_type, value, created_at) events and update aggregates"""
+    conn = init_connection()
+    try:
+        count = events.append_events(conn, batch)
+        # A completion changes what can be recommended; the next batch refresh picks these users up
+        completed = {event[0] for event in batch if event[2] == events.COURSE_COMPLETED}
+        if completed:
+            recommendations.mark_dirty(conn, completed)
+        return count
+    finally:
+        conn.close()
+
+def get_user_engagement(user_id):
+    """Fetch a user's precomputed engagement metrics (None if no events yet)"""
     conn = init_connection()
-    courses = Course.get_all(conn)
+    engagement = events.get_engagement(conn, user_id)
     conn.close()
-    return courses
+    return engagement
 
-def get_course_by_id(course_id):
-    """Fetch a single course by ID"""
+def get_user_course_progress(user_id):
+    """Fetch {course_id: progress} for a user"""
+    conn = init_connection()
+    progress = events.get_course_progress(conn, user_id)
+    conn.close()
+    return progress
+
+def get_similar_courses(course_id):
+    """Fetch [(course_id, title, score)] of the precomputed most similar courses"""
+    bundle = get_artifacts().fresh(artifacts.SIMILAR)
+    similar = bundle.similar(course_id) if bundle is not None else None
+    if similar is not None:
+        return similar
+    conn = init_connection()
+    similar = similar_courses.get_similar(conn, course_id)
+    conn.close()
+    return similar
+
+def get_similar_courses_many(course_ids):
+    """Fetch {course_id: [(course_id, title, score)]} for several courses over one connection"""
+    bundle = get_artifacts().fresh(artifacts.SIMILAR)
+    similar = {}
+    for course_id in course_ids:
+        found = bundle.similar(course_id) if bundle is not None else None
+        if found is not None:
+            similar[course_id] = found
+    missing = [course_id for course_id in course_ids if course_id not in similar]
+    if missing:
+        conn = init_connection()
+        similar.update(similar_courses.get_similar_many(conn, missing))
+        conn.close()
+    return similar
+
+# --- Recommendations ---
+def get_artifacts():
+    """Process-wide watcher over the memory-mapped artifact bundle
+
+    `.fresh(section)` is None until a bundle is built, and while the database
+    holds newer recommendations or neighbours than the bundle.
+    """
+    global _artifacts
+    if _artifacts is None:
+        with _artifacts_lock:
+            if _artifacts is None:
+                _artifacts = artifacts.BundleWatcher(watermarks=_read_watermarks).start()
+    return _artifacts
+
+def _read_watermarks():
+    conn = init_connection()
+    marks = artifacts.watermarks(conn)
+    conn.close()
+    return marks
+
+def get_user_recommendations(user_id):
+    """Fetch a user's materialized course picks and career matches (None until the batch job has run)"""
+    bundle = get_artifacts().fresh(artifacts.RECOMMENDATIONS)
+    stored = bundle.recommendations(user_id) if bundle is not None else None
+    if stored is not None:
+        return stored
+    conn = init_connection()
+    stored = recommendations.get_recommendations(conn, user_id)
+    conn.close()
+    return stored
+
+# --- Career Demand ---
+def get_career_trend(career, resolution=timeseries.MONTHLY, last=12):
+    """Fetch (period labels, demand index) for the latest `last` periods of a career"""
+    conn = init_connection()
+    timeseries.ensure_loaded(conn)
+    window = timeseries.get_window(conn, career, resolution, last)
+    conn.close()
+    return window
+
+# --- Write-behind actions ---
+def get_write_queue():
+    """Process-wide write-behind queue; clicks enqueue and return without waiting on disk"""
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                _write_queue = WriteBehindQueue(get_db_path(), prepare=create_tables)
+                # Writes still land synchronously after the writer dies; /health is where that shows
+                tracing.register_health_check("write_behind", _write_queue_problem)
+    return _write_queue
+
+def _write_queue_problem():
+    failure = _write_queue.failure
+    return f"writer stopped ({failure}); writing synchronously" if failure is not None else None
+
+def get_connection_requests(from_user_id):
+    """Ids a user has already asked to connect with"""
+    conn = init_connection()
+    sent = ConnectionRequest.get_for_user(conn, from_user_id)
+    conn.close()
+    return sent
+
+def submit_feedback(username, user_id, feedback_type, text):
+    """Queue a feedback entry for the background writer"""
+    get_write_queue().submit(Feedback.INSERT_SQL, (username, user_id, feedback_type, text, time.time()))
+
+def request_connection(username, from_user_id, to_user_id):
+    """Queue a connection request for the background writer"""
+    get_write_queue().submit(ConnectionRequest.INSERT_SQL, (username, from_user_id, to_user_id, time.time()))
+
+# --- Audit log ---
+def record_audit_event(event, username=None, email=None, session_id=None):
+    """Queue a login/logout audit entry; successful logins also refresh the user's last-seen time"""
+    now = time.time()
+    partition = audit.partition_for(now)
+    if partition not in _audit_partitions:
+        # First entry of a new month: create its partition and drop expired ones
+        conn = init_connection()
+        try:
+            audit.ensure_partition(conn, partition)
+            audit.prune(conn)
+        finally:
+            conn.close()
+        _audit_partitions.add(partition)
+    queue = get_write_queue()
+    queue.submit(audit.insert_sql(partition), (now, event, username, email, session_id))
+    if event == audit.LOGIN_SUCCEEDED:
+        queue.submit(audit.LAST_SEEN_SQL, (username, now))
+
+def get_active_user_count(days=7):
+    """Number of users who logged in during the last `days` days"""
     conn = init_connection()
-    course = Course.get_by_id(conn, course_id)
+    count = audit.active_users(conn, days)
     conn.close()
-    return course
+    return count
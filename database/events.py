@@ -0,0 +1,275 @@
+import csv
+import time
+import datetime
+import threading
+
+# --- Event types ---
+COURSE_STARTED = "course_started"
+COURSE_COMPLETED = "course_completed"
+COURSE_PROGRESS = "course_progress"  # value = fraction of the course done (0-1)
+QUIZ_SCORED = "quiz_scored"          # value = score (0-100)
+TIME_SPENT = "time_spent"            # value = hours
+FORUM_POST = "forum_post"
+
+EVENT_TYPES = {COURSE_STARTED, COURSE_COMPLETED, COURSE_PROGRESS, QUIZ_SCORED, TIME_SPENT, FORUM_POST}
+
+# Event types that must name a course, and the allowed range of `value` for those that carry one
+COURSE_EVENTS = {COURSE_STARTED, COURSE_COMPLETED, COURSE_PROGRESS}
+VALUE_RANGES = {COURSE_PROGRESS: (0.0, 1.0), QUIZ_SCORED: (0.0, 100.0), TIME_SPENT: (0.0, float("inf"))}
+
+# Forum posts per started course that count as full participation
+FORUM_POSTS_PER_COURSE = 2
+
+
+def create_tables(conn):
+    """Create the event log and the aggregate tables if they don't exist"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS learning_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        course_id TEXT,
+        event_type TEXT NOT NULL,
+        value REAL,
+        created_at REAL NOT NULL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS user_engagement (
+        user_id TEXT PRIMARY KEY,
+        courses_started INTEGER DEFAULT 0,
+        courses_completed INTEGER DEFAULT 0,
+        quiz_count INTEGER DEFAULT 0,
+        quiz_total REAL DEFAULT 0,
+        forum_posts INTEGER DEFAULT 0,
+        time_spent_total REAL DEFAULT 0,
+        last_event_at REAL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS user_weekly_time (
+        user_id TEXT NOT NULL,
+        week TEXT NOT NULL,
+        hours REAL DEFAULT 0,
+        PRIMARY KEY (user_id, week)
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS course_progress (
+        user_id TEXT NOT NULL,
+        course_id TEXT NOT NULL,
+        progress REAL DEFAULT 0,
+        completed INTEGER DEFAULT 0,
+        updated_at REAL,
+        PRIMARY KEY (user_id, course_id)
+    )
+    ''')
+    conn.commit()
+
+
+def week_of(timestamp):
+    """ISO week bucket ("2026-W42") for a unix timestamp"""
+    year, week, _ = datetime.date.fromtimestamp(timestamp).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _aggregate(events):
+    """Fold a batch of events into per-user and per-course deltas
+
+    courses_started and courses_completed are left at zero here: they count
+    distinct courses, so append_events derives them from course_progress.
+    """
+    users = {}
+    weekly = {}
+    progress = {}
+    for user_id, course_id, event_type, value, created_at in events:
+        delta = users.get(user_id)
+        if delta is None:
+            delta = users[user_id] = [0, 0, 0, 0.0, 0, 0.0, created_at]
+        delta[6] = max(delta[6], created_at)
+
+        if event_type in COURSE_EVENTS:
+            # A started course shows up with zero progress until the first progress event
+            value, done = {COURSE_STARTED: (0.0, 0), COURSE_COMPLETED: (1.0, 1)}.get(event_type, (value, 0))
+            current = progress.get((user_id, course_id))
+            if current is not None:
+                value, done = max(value, current[0]), max(done, current[1])
+                created_at = max(created_at, current[2])
+            progress[(user_id, course_id)] = (1.0 if done else value, done, created_at)
+        elif event_type == QUIZ_SCORED:
+            delta[2] += 1
+            delta[3] += value
+        elif event_type == FORUM_POST:
+            delta[4] += 1
+        elif event_type == TIME_SPENT:
+            delta[5] += value
+            key = (user_id, week_of(created_at))
+            weekly[key] = weekly.get(key, 0.0) + value
+    return users, weekly, progress
+
+
+def check_event(event):
+    """Raise ValueError if an event can't be aggregated"""
+    user_id, course_id, event_type, value, created_at = event
+    if event_type not in EVENT_TYPES:
+        raise ValueError(f"Unknown event type: {event_type}")
+    if not user_id:
+        raise ValueError("missing user_id")
+    if not isinstance(created_at, (int, float)):
+        raise ValueError(f"created_at must be a unix timestamp, got {created_at!r}")
+    if event_type in COURSE_EVENTS and not course_id:
+        raise ValueError(f"{event_type} needs a course_id")
+    if event_type in VALUE_RANGES:
+        low, high = VALUE_RANGES[event_type]
+        if not isinstance(value, (int, float)) or not low <= value <= high:
+            raise ValueError(f"{event_type} needs a value in [{low}, {high}], got {value!r}")
+
+
+def append_events(conn, events, rejected=None):
+    """Append a batch of events and update the running aggregates in one transaction
+
+    Each event is a (user_id, course_id, event_type, value, created_at) tuple.
+    Aggregates are updated with the batch's deltas only, never by rescanning
+    learning_events. Invalid events are skipped one by one, never failing the
+    batch; (event, reason) pairs go to `rejected` when a list is given.
+    Returns the number of events written.
+    """
+    valid = []
+    for event in events:
+        try:
+            check_event(event)
+        except (ValueError, TypeError) as e:
+            if rejected is not None:
+                rejected.append((event, str(e)))
+            else:
+                print(f"Skipping learning event {event}: {e}")
+            continue
+        valid.append(event)
+    events = valid
+    if not events:
+        return 0
+
+    users, weekly, progress = _aggregate(events)
+    with conn:
+        conn.executemany(
+            "INSERT INTO learning_events (user_id, course_id, event_type, value, created_at) VALUES (?, ?, ?, ?, ?)",
+            events,
+        )
+        # Read after the first write, so no other writer can change these rows before the upsert below
+        by_user = {}
+        for (user_id, course_id), (_, done, _) in progress.items():
+            by_user.setdefault(user_id, []).append((course_id, done))
+        for user_id, courses in by_user.items():
+            stored = dict(conn.execute("SELECT course_id, completed FROM course_progress WHERE user_id = ?", (user_id,)))
+            # A course counts as started when its row first appears and as completed when it first completes
+            users[user_id][0] += sum(1 for course_id, _ in courses if course_id not in stored)
+            users[user_id][1] += sum(1 for course_id, done in courses if done and not stored.get(course_id))
+        conn.executemany(
+            """INSERT INTO user_engagement (user_id, courses_started, courses_completed, quiz_count,
+                                            quiz_total, forum_posts, time_spent_total, last_event_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                courses_started = courses_started + excluded.courses_started,
+                courses_completed = courses_completed + excluded.courses_completed,
+                quiz_count = quiz_count + excluded.quiz_count,
+                quiz_total = quiz_total + excluded.quiz_total,
+                forum_posts = forum_posts + excluded.forum_posts,
+                time_spent_total = time_spent_total + excluded.time_spent_total,
+                last_event_at = MAX(COALESCE(last_event_at, 0), excluded.last_event_at)""",
+            [(user_id, *delta) for user_id, delta in users.items()],
+        )
+        conn.executemany(
+            """INSERT INTO user_weekly_time (user_id, week, hours) VALUES (?, ?, ?)
+            ON CONFLICT(user_id, week) DO UPDATE SET hours = hours + excluded.hours""",
+            [(user_id, week, hours) for (user_id, week), hours in weekly.items()],
+        )
+        conn.executemany(
+            """INSERT INTO course_progress (user_id, course_id, progress, completed, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, course_id) DO UPDATE SET
+                progress = CASE WHEN completed THEN progress ELSE MAX(progress, excluded.progress) END,
+                completed = MAX(completed, excluded.completed),
+                updated_at = MAX(COALESCE(updated_at, 0), excluded.updated_at)""",
+            [(user_id, course_id, value, done, at) for (user_id, course_id), (value, done, at) in progress.items()],
+        )
+    return len(events)
+
+
+def get_engagement(conn, user_id, now=None):
+    """Return engagement_metrics for a user from the precomputed aggregates, or None"""
+    row = conn.execute(
+        """SELECT courses_started, courses_completed, quiz_count, quiz_total, forum_posts
+        FROM user_engagement WHERE user_id = ?""",
+        (user_id,),
+    ).fetchone()
+    if row is None:
+        return None
+    started, completed, quiz_count, quiz_total, forum_posts = row
+    weekly = conn.execute(
+        "SELECT hours FROM user_weekly_time WHERE user_id = ? AND week = ?",
+        (user_id, week_of(now or time.time())),
+    ).fetchone()
+    return {
+        "course_completion_rate": min(1.0, completed / started) if started else 0.0,
+        "avg_quiz_score": quiz_total / quiz_count if quiz_count else 0.0,
+        "forum_participation": min(1.0, forum_posts / (FORUM_POSTS_PER_COURSE * started)) if started else 0.0,
+        "time_spent_weekly": weekly[0] if weekly else 0.0,
+    }
+
+
+def get_course_progress(conn, user_id):
+    """Return {course_id: progress} for a user"""
+    rows = conn.execute(
+        "SELECT course_id, progress FROM course_progress WHERE user_id = ?", (user_id,)
+    ).fetchall()
+    return {course_id: progress for course_id, progress in rows}
+
+
+class EventBatcher:
+    """Collects events and appends them in batches of `batch_size`"""
+
+    def __init__(self, conn, batch_size=500):
+        self.conn = conn
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def record(self, user_id, event_type, course_id=None, value=None, created_at=None):
+        """Queue one event, flushing when the batch is full"""
+        with self._lock:
+            self._buffer.append((user_id, course_id, event_type, value, created_at or time.time()))
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._append(batch)
+
+    def flush(self):
+        """Write whatever is buffered"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        return self._append(batch)
+
+    def _append(self, batch):
+        try:
+            return append_events(self.conn, batch)
+        except Exception:
+            # Put the batch back in front of anything recorded meanwhile so a retry writes it
+            with self._lock:
+                self._buffer[:0] = batch
+            raise
+
+
+def ingest_csv(conn, csv_path, batch_size=5000):
+    """Bulk-load events from a CSV with user_id, course_id, event_type, value, created_at columns"""
+    total = 0
+    batch = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            value = float(row["value"]) if row.get("value") else None
+            batch.append((row["user_id"], row.get("course_id") or None, row["event_type"],
+                          value, float(row["created_at"])))
+            if len(batch) >= batch_size:
+                total += append_events(conn, batch)
+                batch = []
+    total += append_events(conn, batch)
+    return total
@@ -0,0 +1,204 @@
+import os
+import sqlite3
+import argparse
+
+from database.db_functions import get_db_path
+from utils.datasets import USERS_CSV, COURSES_CSV, iter_users, iter_courses
+
+# pyarrow is an optional dependency, imported by the first export that runs
+pa = None
+pq = None
+
+# Columns never written to an export
+EXCLUDED_COLUMNS = {
+    "users": {"password_hash", "email"},
+}
+
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_ROWS_PER_FILE = 1000000
+
+
+def _require_pyarrow():
+    """Import pyarrow on first use"""
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+def _arrow_type(declared):
+    declared = (declared or "").upper()
+    if "INT" in declared:
+        return pa.int64()
+    if "REAL" in declared or "FLOA" in declared or "DOUB" in declared:
+        return pa.float64()
+    return pa.string()
+
+
+class PartitionedWriter:
+    """Writes record batches to part-00000.parquet, part-00001.parquet, ... under one directory"""
+
+    def __init__(self, out_dir, schema, rows_per_file=DEFAULT_ROWS_PER_FILE):
+        self.out_dir = out_dir
+        self.schema = schema
+        self.rows_per_file = rows_per_file
+        self.rows = 0
+        self.files = 0
+        self._writer = None
+        self._file_rows = 0
+        os.makedirs(out_dir, exist_ok=True)
+
+    def write_rows(self, rows):
+        """Write a list of row tuples as one record batch"""
+        if not rows:
+            return
+        columns = list(zip(*rows))
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+            schema=self.schema,
+        )
+        if self._writer is None or self._file_rows >= self.rows_per_file:
+            self._roll()
+        self._writer.write_batch(batch)
+        self._file_rows += len(rows)
+        self.rows += len(rows)
+
+    def _roll(self):
+        if self._writer is not None:
+            self._writer.close()
+        path = os.path.join(self.out_dir, f"part-{self.files:05d}.parquet")
+        self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self.files += 1
+        self._file_rows = 0
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def export_table(conn, table, out_dir, batch_size=DEFAULT_BATCH_SIZE, rows_per_file=DEFAULT_ROWS_PER_FILE):
+    """Stream a SQLite table into partitioned Parquet, skipping excluded columns"""
+    _require_pyarrow()
+    excluded = EXCLUDED_COLUMNS.get(table, set())
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+    columns = [(row[1], row[2]) for row in info if row[1] not in excluded]
+    schema = pa.schema([(name, _arrow_type(declared)) for name, declared in columns])
+
+    writer = PartitionedWriter(os.path.join(out_dir, table), schema, rows_per_file)
+    cursor = conn.execute(f"SELECT {', '.join(name for name, _ in columns)} FROM {table}")
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            writer.write_rows([tuple(row) for row in rows])
+    finally:
+        writer.close()
+    return writer.rows
+
+
+# --- Derived analytics from the CSV datasets ---
+def _derived_writers(out_dir, rows_per_file):
+    schemas = {
+        "user_skills": pa.schema([("user_id", pa.string()), ("skill", pa.string()), ("proficiency", pa.float64())]),
+        "user_completions": pa.schema([("user_id", pa.string()), ("course_id", pa.string())]),
+        "user_career_goals": pa.schema([("user_id", pa.string()), ("career", pa.string())]),
+        "user_engagement": pa.schema([
+            ("user_id", pa.string()), ("course_completion_rate", pa.float64()),
+            ("avg_quiz_score", pa.float64()), ("forum_participation", pa.float64()),
+            ("time_spent_weekly", pa.float64()),
+        ]),
+        "course_catalog": pa.schema([
+            ("course_id", pa.string()), ("title", pa.string()), ("difficulty_level", pa.float64()),
+            ("duration_hours", pa.int64()),
+        ]),
+        "course_skills": pa.schema([("course_id", pa.string()), ("skill", pa.string())]),
+        "course_prerequisites": pa.schema([("course_id", pa.string()), ("skill", pa.string())]),
+        "course_industry_relevance": pa.schema([
+            ("course_id", pa.string()), ("industry", pa.string()), ("relevance", pa.float64()),
+        ]),
+    }
+    return {name: PartitionedWriter(os.path.join(out_dir, name), schema, rows_per_file)
+            for name, schema in schemas.items()}
+
+
+def export_datasets(out_dir, users_csv=USERS_CSV, courses_csv=COURSES_CSV,
+                    batch_size=DEFAULT_BATCH_SIZE, rows_per_file=DEFAULT_ROWS_PER_FILE):
+    """Stream the parsed users/courses CSV structures into long-format Parquet tables"""
+    _require_pyarrow()
+    writers = _derived_writers(out_dir, rows_per_file)
+    buffers = {name: [] for name in writers}
+
+    def emit(name, row):
+        buffer = buffers[name]
+        buffer.append(row)
+        if len(buffer) >= batch_size:
+            writers[name].write_rows(buffer)
+            buffer.clear()
+
+    try:
+        for user in iter_users(users_csv):
+            uid = user["user_id"]
+            for skill, proficiency in user["skills"].items():
+                emit("user_skills", (uid, skill, proficiency))
+            for course_id in user["completed_courses"]:
+                emit("user_completions", (uid, course_id))
+            for career in user["career_goals"]:
+                emit("user_career_goals", (uid, career))
+            metrics = user["engagement_metrics"]
+            emit("user_engagement", (uid, metrics.get("course_completion_rate"), metrics.get("avg_quiz_score"),
+                                     metrics.get("forum_participation"), metrics.get("time_spent_weekly")))
+
+        for course in iter_courses(courses_csv):
+            cid = course["course_id"]
+            emit("course_catalog", (cid, course["title"], course["difficulty_level"], course["duration_hours"]))
+            for skill in course["skills_covered"]:
+                emit("course_skills", (cid, skill))
+            for skill in course["prerequisites"]:
+                emit("course_prerequisites", (cid, skill))
+            for industry, relevance in course["industry_relevance"].items():
+                emit("course_industry_relevance", (cid, industry, relevance))
+
+        for name, buffer in buffers.items():
+            writers[name].write_rows(buffer)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {name: writer.rows for name, writer in writers.items()}
+
+
+def export_all(out_dir, db_path=None, batch_size=DEFAULT_BATCH_SIZE, rows_per_file=DEFAULT_ROWS_PER_FILE):
+    """Export the users and courses tables plus the derived CSV structures"""
+    _require_pyarrow()
+    counts = {}
+    # Read-only connection so an export never takes a write lock on the app database
+    conn = sqlite3.connect(f"file:{db_path or get_db_path()}?mode=ro", uri=True)
+    try:
+        for table in ("users", "courses"):
+            counts[table] = export_table(conn, table, out_dir, batch_size, rows_per_file)
+    finally:
+        conn.close()
+    counts.update(export_datasets(out_dir, batch_size=batch_size, rows_per_file=rows_per_file))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export users, courses and derived analytics to Parquet")
+    parser.add_argument("out_dir")
+    parser.add_argument("--db", help="SQLite file to export (defaults to the app database)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--rows-per-file", type=int, default=DEFAULT_ROWS_PER_FILE)
+    args = parser.parse_args()
+
+    counts = export_all(args.out_dir, args.db, args.batch_size, args.rows_per_file)
+    for name, rows in counts.items():
+        print(f"{name}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
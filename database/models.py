@@ -4,6 +4,11 @@ from werkzeug.security import generate_password_hash, check_password_hash
 
 # --- User Model ---
 class User:
+    # Lookup statements; also checked by database/query_profiler.py for index use
+    GET_BY_EMAIL_SQL = "SELECT id, username, email, password_hash, skills, education_level, about, created_at FROM users WHERE email = ?"
+    EMAIL_EXISTS_SQL = "SELECT 1 FROM users WHERE email = ?"
+    USERNAME_EXISTS_SQL = "SELECT 1 FROM users WHERE username = ?"
+
     def __init__(self, id=None, username=None, email=None, password_hash=None, 
                  skills=None, education_level=None, about=None, created_at=None):
         self.id = id
@@ -67,10 +72,7 @@ class User:
     def get_by_email(cls, conn, email):
         """Find user by email"""
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, username, email, password_hash, skills, education_level, about, created_at FROM users WHERE email = ?", 
-            (email,)
-        )
+        cursor.execute(cls.GET_BY_EMAIL_SQL, (email,))
         row = cursor.fetchone()
         if row is None:
             return None
@@ -90,14 +92,14 @@ class User:
     def email_exists(cls, conn, email):
         """Check if an email already exists in the database"""
         cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM users WHERE email = ?", (email,))
+        cursor.execute(cls.EMAIL_EXISTS_SQL, (email,))
         return cursor.fetchone() is not None
 
     @classmethod
     def username_exists(cls, conn, username):
         """Check if a username already exists in the database"""
         cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM users WHERE username = ?", (username,))
+        cursor.execute(cls.USERNAME_EXISTS_SQL, (username,))
         return cursor.fetchone() is not None
 
     @classmethod
@@ -116,6 +118,8 @@ class User:
 
 # --- Course Model ---
 class Course:
+    GET_BY_ID_SQL = "SELECT id, name, description, instructor, difficulty FROM courses WHERE id = ?"
+
     def __init__(self, id=None, name=None, description=None, instructor=None, difficulty="Unknown"):
         self.id = id
         self.name = name
@@ -159,10 +163,20 @@ class Course:
     def get_all_courses(cls, conn):
         """Retrieve all courses"""
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM courses")
+        cursor.execute("SELECT id, name, description, instructor, difficulty FROM courses")
         rows = cursor.fetchall()
         return [cls(*row) for row in rows]
 
+    @classmethod
+    def get_by_id(cls, conn, course_id):
+        """Find course by ID"""
+        cursor = conn.cursor()
+        cursor.execute(cls.GET_BY_ID_SQL, (course_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return cls(*row)
+
     @classmethod
     def import_from_csv(cls, conn, csv_path):
         """Import courses from a CSV file"""
@@ -175,6 +189,57 @@ class Course:
             )
         conn.commit()
 
+# --- Feedback Model ---
+class Feedback:
+    INSERT_SQL = """INSERT INTO feedback (username, user_id, feedback_type, text, created_at)
+                    VALUES (?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def create_table(conn):
+        """Create the feedback table if it doesn't exist"""
+        cursor = conn.cursor()
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT,
+            user_id TEXT,
+            feedback_type TEXT NOT NULL,
+            text TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+        ''')
+        conn.commit()
+
+# --- Connection Request Model ---
+class ConnectionRequest:
+    # Repeated clicks on the same Connect button are idempotent
+    INSERT_SQL = """INSERT OR IGNORE INTO connection_requests (username, from_user_id, to_user_id, created_at)
+                    VALUES (?, ?, ?, ?)"""
+    GET_FOR_USER_SQL = "SELECT to_user_id FROM connection_requests WHERE from_user_id = ?"
+
+    @staticmethod
+    def create_table(conn):
+        """Create the connection_requests table if it doesn't exist"""
+        cursor = conn.cursor()
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS connection_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT,
+            from_user_id TEXT NOT NULL,
+            to_user_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            UNIQUE (from_user_id, to_user_id)
+        )
+        ''')
+        conn.commit()
+
+    @staticmethod
+    def get_for_user(conn, from_user_id):
+        """Return the ids a user has already asked to connect with"""
+        cursor = conn.cursor()
+        cursor.execute(ConnectionRequest.GET_FOR_USER_SQL, (from_user_id,))
+        return {row[0] for row in cursor.fetchall()}
+
 # --- Database Initialization ---
 def init_db():
     conn = sqlite3.connect("database.db")
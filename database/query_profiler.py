@@ -0,0 +1,262 @@
+import os
+import re
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# Profiling is off unless explicitly enabled; when off, connections are plain sqlite3 ones
+_enabled = os.environ.get("CODEHOLICS_QUERY_PROFILE", "0") == "1"
+
+# Number of most recent timings kept per statement for percentiles
+WINDOW_SIZE = 1024
+
+# Executions of one statement shape within a single rerun that count as an N+1 pattern
+N_PLUS_ONE_THRESHOLD = 10
+
+# Most recent N+1 findings kept for the admin page
+MAX_FINDINGS = 100
+
+_lock = threading.Lock()
+_statements = {}
+_findings = deque(maxlen=MAX_FINDINGS)
+_rerun = threading.local()
+
+# String and number literals, so traced SQL with bound values folds into one statement shape
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def enable():
+    """Profile connections opened from now on"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def normalize(sql):
+    """Statement shape: literals replaced by ? and whitespace collapsed"""
+    return _SPACE_RE.sub(" ", _LITERAL_RE.sub("?", sql)).strip()
+
+
+class StatementStats:
+    """Counts, timings and rows returned for one statement shape"""
+
+    def __init__(self, sql, window=WINDOW_SIZE):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=window)
+
+    def snapshot(self):
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(0.99 * (len(ordered) - 1)))] if ordered else 0.0
+        return {
+            "statement": self.sql,
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p99_ms": p99 * 1000,
+            "rows": self.rows,
+        }
+
+
+def _stats(sql):
+    stats = _statements.get(sql)
+    if stats is None:
+        stats = _statements[sql] = StatementStats(sql)
+    return stats
+
+
+def _record(sql, elapsed, rows=0, sample=True):
+    with _lock:
+        stats = _stats(sql)
+        stats.total += elapsed
+        stats.rows += rows
+        if sample:
+            stats.samples.append(elapsed)
+
+
+def _trace(statement):
+    """sqlite3 trace callback: one call per statement SQLite actually runs, triggers included"""
+    sql = normalize(statement)
+    with _lock:
+        _stats(sql).count += 1
+    counts = getattr(_rerun, "counts", None)
+    if counts is not None:
+        counts[sql] = counts.get(sql, 0) + 1
+
+
+# --- Timing wrappers ---
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that times execute and fetch calls and counts the rows fetched
+
+    Fetch time is added to the statement's total but not to its p99 samples,
+    which time execute only. Rows read by iterating the cursor are not counted.
+    """
+
+    _sql = None
+
+    def execute(self, sql, parameters=()):
+        self._sql = normalize(sql)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record(self._sql, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = normalize(sql)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record(self._sql, time.perf_counter() - start)
+
+    def _fetched(self, start, rows):
+        if self._sql is not None:
+            _record(self._sql, time.perf_counter() - start, rows, sample=False)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, row is not None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(size or self.arraysize)
+        self._fetched(start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, len(rows))
+        return rows
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose cursors are ProfiledCursors and whose statements are traced"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_trace_callback(_trace)
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory():
+    """Factory to pass to sqlite3.connect: profiled when profiling is enabled"""
+    return ProfiledConnection if _enabled else sqlite3.Connection
+
+
+# --- Per-rerun N+1 detection ---
+@contextmanager
+def rerun_scope(label="rerun"):
+    """Count statements run by this thread until exit and record any N+1 patterns"""
+    if not _enabled:
+        yield
+        return
+    _rerun.counts = {}
+    try:
+        yield
+    finally:
+        counts, _rerun.counts = _rerun.counts, None
+        for sql, count in counts.items():
+            if count >= N_PLUS_ONE_THRESHOLD:
+                _findings.append({"at": time.time(), "scope": label, "statement": sql, "count": count})
+
+
+def snapshot():
+    """Per-statement summaries, most total time first"""
+    with _lock:
+        rows = [stats.snapshot() for stats in _statements.values()]
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def findings():
+    """Recent N+1 findings, newest last"""
+    return list(_findings)
+
+
+def reset():
+    with _lock:
+        _statements.clear()
+        _findings.clear()
+
+
+# --- Query-plan checks ---
+def registered_queries():
+    """(name, sql, params) for every lookup that must be served by an index"""
+    from database.models import User, Course, ConnectionRequest
+    from database import catalog, recommendations, similar_courses, audit
+
+    return [
+        ("User.get_by_email", User.GET_BY_EMAIL_SQL, ("user@example.com",)),
+        ("User.email_exists", User.EMAIL_EXISTS_SQL, ("user@example.com",)),
+        ("User.username_exists", User.USERNAME_EXISTS_SQL, ("user",)),
+        ("Course.get_by_id", Course.GET_BY_ID_SQL, (1,)),
+        ("catalog.read_version", catalog.VERSION_SQL, ()),
+        ("ConnectionRequest.get_for_user", ConnectionRequest.GET_FOR_USER_SQL, ("U001",)),
+        ("recommendations.get_recommendations", recommendations.GET_SQL, ("U001",)),
+        ("similar_courses.get_similar", similar_courses.GET_SQL, ("C001",)),
+        ("audit.active_users", audit.ACTIVE_USERS_SQL, (0.0,)),
+    ]
+
+
+def full_scans(conn, sql, params=()):
+    """EXPLAIN QUERY PLAN details that scan a whole table or index"""
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[-1] for row in plan if row[-1].startswith("SCAN")]
+
+
+def check_query_plans(conn=None):
+    """Return {query name: [scan details]} for registered queries that do full scans"""
+    if conn is None:
+        from database.db_functions import create_tables
+        conn = sqlite3.connect(":memory:")
+        create_tables(conn)
+    failures = {}
+    for name, sql, params in registered_queries():
+        scans = full_scans(conn, sql, params)
+        if scans:
+            failures[name] = scans
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if a registered query plans a full table scan")
+    parser.add_argument("--db", help="Check against this database's schema instead of a fresh one")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db) if args.db else None
+    failures = check_query_plans(conn)
+    for name, sql, _ in registered_queries():
+        status = "FULL SCAN: " + "; ".join(failures[name]) if name in failures else "ok"
+        print(f"{name:40s} {status}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
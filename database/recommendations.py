@@ -0,0 +1,287 @@
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.datasets import USERS_CSV, COURSES_CSV, load_users, load_courses
+from utils.recommender import recommend_courses, career_matches, skill_needs, score_course
+
+COURSE = "course"
+CAREER = "career"
+
+DEFAULT_K = 5
+CAREER_K = 3
+
+# Users per process-pool task
+SHARD_SIZE = 1000
+
+GET_SQL = "SELECT kind, item_id, label, score FROM user_recommendations WHERE user_id = ? ORDER BY kind, rank"
+# Bumped in the same transaction as every write to user_recommendations
+UPDATED_SQL = "INSERT OR REPLACE INTO recommendation_meta (key, value) VALUES ('updated_at', ?)"
+
+
+def create_tables(conn):
+    """Create the materialized recommendation tables if they don't exist
+
+    user_recommendations holds both course picks and career matches, keyed so
+    one user's full list is a single primary-key range read.
+    """
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS user_recommendations (
+        user_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        item_id TEXT NOT NULL,
+        label TEXT,
+        score REAL NOT NULL,
+        PRIMARY KEY (user_id, kind, rank)
+    ) WITHOUT ROWID
+    ''')
+    # Fingerprint of the inputs each user's rows were computed from
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS recommendation_inputs (
+        user_id TEXT PRIMARY KEY,
+        fingerprint TEXT NOT NULL,
+        computed_at REAL NOT NULL
+    )
+    ''')
+    # Fingerprint of each course as of the last completed run
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS recommendation_courses (
+        course_id TEXT PRIMARY KEY,
+        fingerprint TEXT NOT NULL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS recommendation_dirty (
+        user_id TEXT PRIMARY KEY,
+        marked_at REAL NOT NULL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS recommendation_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    ''')
+    conn.commit()
+
+
+# --- Dirty-set tracking ---
+def mark_dirty(conn, user_ids):
+    """Queue users for recomputation on the next refresh"""
+    now = time.time()
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO recommendation_dirty (user_id, marked_at) VALUES (?, ?)",
+            [(user_id, now) for user_id in user_ids],
+        )
+
+
+def _fingerprint(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def user_fingerprint(user):
+    """Hash of everything in a user that the scores depend on"""
+    return _fingerprint([user["skills"], sorted(user["completed_courses"]), sorted(user["career_goals"])])
+
+
+def course_fingerprint(course):
+    """Hash of everything in a course that the scores or the stored label depend on"""
+    return _fingerprint([course["title"], course["skills_covered"], course["prerequisites"]])
+
+
+def data_version(conn):
+    """When the stored recommendations last changed (None before the first refresh)"""
+    row = conn.execute("SELECT value FROM recommendation_meta WHERE key = 'updated_at'").fetchone()
+    return row[0] if row else None
+
+
+def _stored_k(conn):
+    row = conn.execute("SELECT value FROM recommendation_meta WHERE key = 'k'").fetchone()
+    return int(row[0]) if row else None
+
+
+def find_dirty(conn, users, courses, k=DEFAULT_K):
+    """Return the ids of users whose stored recommendations may be out of date
+
+    A user is dirty when their inputs changed, they were marked explicitly,
+    a course in their stored list changed or disappeared, or a new or changed
+    course would now beat their k-th pick.
+    """
+    if _stored_k(conn) != k:
+        return {user["user_id"] for user in users}
+
+    stored_inputs = dict(conn.execute("SELECT user_id, fingerprint FROM recommendation_inputs"))
+    dirty = {user["user_id"] for user in users if stored_inputs.get(user["user_id"]) != user_fingerprint(user)}
+    dirty.update(row[0] for row in conn.execute("SELECT user_id FROM recommendation_dirty"))
+
+    stored_courses = dict(conn.execute("SELECT course_id, fingerprint FROM recommendation_courses"))
+    changed = {course_id for course_id, course in courses.items()
+               if stored_courses.get(course_id) != course_fingerprint(course)}
+    removed = set(stored_courses) - set(courses)
+
+    if changed | removed:
+        # Users holding a changed or removed course in their list
+        stale = changed | removed
+        for user_id, item_id in conn.execute(
+                "SELECT user_id, item_id FROM user_recommendations WHERE kind = ?", (COURSE,)):
+            if item_id in stale:
+                dirty.add(user_id)
+
+    if changed:
+        # Users for whom a new or changed course now scores above their k-th pick
+        floors = {user_id: (count, low) for user_id, count, low in conn.execute(
+            "SELECT user_id, count(*), min(score) FROM user_recommendations WHERE kind = ? GROUP BY user_id",
+            (COURSE,))}
+        candidates = [courses[course_id] for course_id in changed]
+        for user in users:
+            user_id = user["user_id"]
+            if user_id in dirty:
+                continue
+            count, low = floors.get(user_id, (0, 0.0))
+            completed = set(user["completed_courses"])
+            needs = skill_needs(user)
+            for course in candidates:
+                if course["course_id"] in completed:
+                    continue
+                if count < k or score_course(user, needs, course) >= low:
+                    dirty.add(user_id)
+                    break
+    return dirty
+
+
+# --- Batch computation ---
+_worker_courses = None
+_worker_k = DEFAULT_K
+
+
+def _init_worker(courses, k):
+    global _worker_courses, _worker_k
+    _worker_courses = courses
+    _worker_k = k
+
+
+def _compute_shard(users):
+    """Rows for one shard of users; runs in a pool worker"""
+    rows = []
+    inputs = []
+    for user in users:
+        user_id = user["user_id"]
+        for rank, (course_id, score) in enumerate(recommend_courses(user, _worker_courses, _worker_k)):
+            rows.append((user_id, COURSE, rank, course_id, _worker_courses[course_id]["title"], score))
+        for rank, (career, match) in enumerate(career_matches(user, CAREER_K)):
+            rows.append((user_id, CAREER, rank, career, career, match))
+        inputs.append((user_id, user_fingerprint(user)))
+    return inputs, rows
+
+
+def _write_shard(conn, inputs, rows):
+    now = time.time()
+    user_ids = [(user_id,) for user_id, _ in inputs]
+    with conn:
+        conn.executemany("DELETE FROM user_recommendations WHERE user_id = ?", user_ids)
+        conn.executemany(
+            "INSERT INTO user_recommendations (user_id, kind, rank, item_id, label, score) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            """INSERT INTO recommendation_inputs (user_id, fingerprint, computed_at) VALUES (?, ?, ?)
+            ON CONFLICT(user_id) DO UPDATE SET fingerprint = excluded.fingerprint, computed_at = excluded.computed_at""",
+            [(user_id, fingerprint, now) for user_id, fingerprint in inputs],
+        )
+        conn.executemany("DELETE FROM recommendation_dirty WHERE user_id = ?", user_ids)
+        conn.execute(UPDATED_SQL, (str(now),))
+
+
+def _remove_users(conn, user_ids):
+    rows = [(user_id,) for user_id in user_ids]
+    with conn:
+        for table in ("user_recommendations", "recommendation_inputs", "recommendation_dirty"):
+            conn.executemany(f"DELETE FROM {table} WHERE user_id = ?", rows)
+        conn.execute(UPDATED_SQL, (str(time.time()),))
+
+
+def refresh(conn, users, courses, k=DEFAULT_K, workers=None, shard_size=SHARD_SIZE, full=False):
+    """Recompute recommendations for dirty users (or everyone with `full`) and return run stats
+
+    `users` is a list of parsed users and `courses` a dict of parsed courses
+    keyed by course_id. Shards are scored in a process pool and each shard is
+    written in its own transaction, so readers always see complete lists.
+    """
+    started = time.perf_counter()
+    current_ids = {user["user_id"] for user in users}
+    known = conn.execute("SELECT user_id FROM recommendation_inputs UNION SELECT user_id FROM recommendation_dirty")
+    gone = {row[0] for row in known} - current_ids
+    if gone:
+        _remove_users(conn, gone)
+
+    dirty = current_ids if full else find_dirty(conn, users, courses, k)
+    todo = [user for user in users if user["user_id"] in dirty]
+    shards = [todo[i:i + shard_size] for i in range(0, len(todo), shard_size)]
+
+    if workers == 1 or len(shards) <= 1:
+        _init_worker(courses, k)
+        for shard in shards:
+            _write_shard(conn, *_compute_shard(shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(courses, k)) as pool:
+            for future in as_completed([pool.submit(_compute_shard, shard) for shard in shards]):
+                _write_shard(conn, *future.result())
+
+    # Course fingerprints move forward only once every affected user has been rewritten
+    with conn:
+        conn.execute("DELETE FROM recommendation_courses")
+        conn.executemany(
+            "INSERT INTO recommendation_courses (course_id, fingerprint) VALUES (?, ?)",
+            [(course_id, course_fingerprint(course)) for course_id, course in courses.items()],
+        )
+        conn.execute("INSERT OR REPLACE INTO recommendation_meta (key, value) VALUES ('k', ?)", (str(k),))
+
+    return {"users": len(users), "recomputed": len(todo), "removed": len(gone),
+            "shards": len(shards), "seconds": time.perf_counter() - started}
+
+
+# --- Reads ---
+def get_recommendations(conn, user_id):
+    """Return {"courses": [...], "careers": [...]} of (id, label, score) for a user, or None"""
+    rows = conn.execute(GET_SQL, (user_id,)).fetchall()
+    if not rows:
+        return None
+    result = {"courses": [], "careers": []}
+    for kind, item_id, label, score in rows:
+        result["courses" if kind == COURSE else "careers"].append((item_id, label, score))
+    return result
+
+
+def main():
+    from database.db_functions import get_db_path, create_tables as create_app_tables
+
+    parser = argparse.ArgumentParser(description="Precompute top-k course and career recommendations per user")
+    parser.add_argument("--db", help="SQLite file to write (defaults to the app database)")
+    parser.add_argument("--users-csv", default=USERS_CSV)
+    parser.add_argument("--courses-csv", default=COURSES_CSV)
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (defaults to the CPU count)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--full", action="store_true", help="Recompute every user, not just dirty ones")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db or get_db_path())
+    conn.execute("PRAGMA journal_mode=WAL")
+    create_app_tables(conn)
+    try:
+        stats = refresh(conn, load_users(args.users_csv), load_courses(args.courses_csv),
+                        args.k, args.workers, args.shard_size, args.full)
+    finally:
+        conn.close()
+    print(f"Recomputed {stats['recomputed']} of {stats['users']} users in {stats['shards']} shards "
+          f"({stats['removed']} removed) in {stats['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+import re
+import math
+import time
+import zlib
+import heapq
+import hashlib
+import sqlite3
+import argparse
+from collections import Counter
+
+from utils.datasets import COURSES_CSV, load_courses
+
+# Hashed feature space; fixed size so adding courses never re-indexes terms
+N_FEATURES = 2 ** 20
+
+# Extra weight of a skills_covered entry over a description word
+SKILL_WEIGHT = 2.0
+
+# Features in more than this share of courses carry no signal and are dropped
+MAX_DF = 0.5
+
+DEFAULT_K = 5
+
+# Courses whose neighbours are computed (and committed) together
+BLOCK_SIZE = 256
+
+# Share of the catalog that may change before an incremental build falls back to a full one
+REBUILD_FRACTION = 0.1
+
+GET_SQL = "SELECT neighbour_id, title, score FROM similar_courses WHERE course_id = ? ORDER BY rank"
+# Bumped in the same transaction as every write to similar_courses
+UPDATED_SQL = "INSERT OR REPLACE INTO similar_course_meta (key, value) VALUES ('updated_at', ?)"
+
+TOKEN_RE = re.compile(r"[a-z][a-z+#]*")
+STOP_WORDS = {"a", "an", "and", "the", "this", "is", "of", "to", "in", "for", "with", "on", "course", "covering"}
+
+
+def create_tables(conn):
+    """Create the similar-courses tables if they don't exist"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS similar_courses (
+        course_id TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        neighbour_id TEXT NOT NULL,
+        title TEXT,
+        score REAL NOT NULL,
+        PRIMARY KEY (course_id, rank)
+    ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS similar_course_fingerprints (
+        course_id TEXT PRIMARY KEY,
+        fingerprint TEXT NOT NULL
+    )
+    ''')
+    # IDF frozen at the last full build; incremental builds reuse it so unchanged scores stay valid
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS similar_course_idf (
+        feature INTEGER PRIMARY KEY,
+        idf REAL NOT NULL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS similar_course_meta (
+        key TEXT PRIMARY KEY,
+        value REAL NOT NULL
+    )
+    ''')
+    conn.commit()
+
+
+# --- Vectors ---
+def _feature(token):
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+def term_counts(course):
+    """Hashed feature -> weighted count for a course's description and skills"""
+    counts = Counter()
+    for token in TOKEN_RE.findall(course["description"].lower()):
+        if token not in STOP_WORDS:
+            counts[_feature(token)] += 1.0
+    for skill in course["skills_covered"]:
+        counts[_feature("skill:" + skill.lower())] += SKILL_WEIGHT
+    return counts
+
+
+def compute_idf(counts_by_course):
+    """Smoothed IDF per feature; features above MAX_DF get 0"""
+    n = len(counts_by_course)
+    df = Counter()
+    for counts in counts_by_course.values():
+        df.update(counts.keys())
+    return {feature: 0.0 if count > MAX_DF * n else math.log((1 + n) / (1 + count)) + 1
+            for feature, count in df.items()}
+
+
+def vectorize(counts, idf, unseen_idf):
+    """L2-normalized TF-IDF vector as {feature: weight}"""
+    vector = {}
+    for feature, count in counts.items():
+        weight = count * idf.get(feature, unseen_idf)
+        if weight:
+            vector[feature] = weight
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {feature: w / norm for feature, w in vector.items()} if norm else {}
+
+
+def _postings(vectors):
+    """Inverted index feature -> [(course_id, weight)], i.e. the transposed sparse matrix"""
+    postings = {}
+    for course_id, vector in vectors.items():
+        for feature, weight in vector.items():
+            postings.setdefault(feature, []).append((course_id, weight))
+    return postings
+
+
+def _scores(vector, postings):
+    """Cosine similarity of one vector against every indexed course sharing a feature"""
+    scores = {}
+    for feature, weight in vector.items():
+        for other, other_weight in postings.get(feature, ()):
+            scores[other] = scores.get(other, 0.0) + weight * other_weight
+    return scores
+
+
+def nearest(course_ids, vectors, postings, k=DEFAULT_K, block_size=BLOCK_SIZE):
+    """Yield blocks of (course_id, [(neighbour_id, score)]) for `course_ids`
+
+    Each block is one slice of the sparse product V[block] x V^T, so memory
+    stays bounded by the block size whatever the catalog size.
+    """
+    for start in range(0, len(course_ids), block_size):
+        block = []
+        for course_id in course_ids[start:start + block_size]:
+            scores = _scores(vectors[course_id], postings)
+            scores.pop(course_id, None)
+            top = heapq.nlargest(k, ((score, other) for other, score in scores.items() if score > 0))
+            block.append((course_id, [(other, score) for score, other in top]))
+        yield block
+
+
+def course_fingerprint(course):
+    return hashlib.sha1(repr((course["title"], course["description"], course["skills_covered"])).encode()).hexdigest()
+
+
+# --- Build ---
+def _read_meta(conn):
+    return dict(conn.execute("SELECT key, value FROM similar_course_meta"))
+
+
+def data_version(conn):
+    """When the stored neighbour lists last changed (None before the first build)"""
+    row = conn.execute("SELECT value FROM similar_course_meta WHERE key = 'updated_at'").fetchone()
+    return row[0] if row else None
+
+
+def _write_block(conn, block, courses):
+    with conn:
+        conn.executemany("DELETE FROM similar_courses WHERE course_id = ?", [(course_id,) for course_id, _ in block])
+        conn.executemany(
+            "INSERT INTO similar_courses (course_id, rank, neighbour_id, title, score) VALUES (?, ?, ?, ?, ?)",
+            [(course_id, rank, other, courses[other]["title"], score)
+             for course_id, neighbours in block for rank, (other, score) in enumerate(neighbours)],
+        )
+        conn.execute(UPDATED_SQL, (time.time(),))
+
+
+def _affected(conn, changed, removed, vectors, k):
+    """Unchanged courses whose stored neighbours a changed or removed course could alter"""
+    affected = set()
+    stale = changed | removed
+    floors = {}
+    for course_id, neighbour_id, score in conn.execute(
+            "SELECT course_id, neighbour_id, score FROM similar_courses"):
+        if neighbour_id in stale:
+            affected.add(course_id)
+        count, low = floors.get(course_id, (0, 1.0))
+        floors[course_id] = (count + 1, min(low, score))
+
+    # Score every other course against only the changed ones: a |changed| x n product
+    changed_postings = _postings({course_id: vectors[course_id] for course_id in changed})
+    for course_id, vector in vectors.items():
+        if course_id in changed or course_id in affected:
+            continue
+        scores = _scores(vector, changed_postings)
+        if not scores:
+            continue
+        count, low = floors.get(course_id, (0, 0.0))
+        if count < k or max(scores.values()) >= low:
+            affected.add(course_id)
+    return affected
+
+
+def build(conn, courses, k=DEFAULT_K, block_size=BLOCK_SIZE, full=False):
+    """Build or incrementally update the index for parsed `courses` (dict by course_id) and return stats
+
+    An incremental run keeps the IDF weights of the last full build, so its
+    scores drift from a from-scratch build as the catalog changes; the
+    REBUILD_FRACTION threshold (or `full`) bounds that drift.
+    """
+    meta = _read_meta(conn)
+    stored = dict(conn.execute("SELECT course_id, fingerprint FROM similar_course_fingerprints"))
+    fingerprints = {course_id: course_fingerprint(course) for course_id, course in courses.items()}
+    changed = {course_id for course_id, fp in fingerprints.items() if stored.get(course_id) != fp}
+    removed = set(stored) - set(courses)
+
+    full = (full or not meta or meta.get("k") != k
+            or len(changed) + len(removed) > REBUILD_FRACTION * max(1, meta.get("doc_count", 0)))
+
+    counts = {course_id: term_counts(course) for course_id, course in courses.items()}
+    if full:
+        idf = compute_idf(counts)
+        doc_count = len(courses)
+        with conn:
+            conn.execute("DELETE FROM similar_course_idf")
+            conn.executemany("INSERT INTO similar_course_idf (feature, idf) VALUES (?, ?)", idf.items())
+            conn.execute("DELETE FROM similar_courses")
+            conn.execute(UPDATED_SQL, (time.time(),))
+            conn.executemany("INSERT OR REPLACE INTO similar_course_meta (key, value) VALUES (?, ?)",
+                             [("k", k), ("doc_count", doc_count)])
+    else:
+        idf = dict(conn.execute("SELECT feature, idf FROM similar_course_idf"))
+        doc_count = meta["doc_count"]
+    # A feature first seen after the last full build counts as appearing in one course
+    unseen_idf = math.log((1 + doc_count) / 2) + 1
+
+    vectors = {course_id: vectorize(c, idf, unseen_idf) for course_id, c in counts.items()}
+    if full:
+        todo = sorted(courses)
+    else:
+        todo = sorted(changed | _affected(conn, changed, removed, vectors, k))
+        if removed:
+            with conn:
+                conn.executemany("DELETE FROM similar_courses WHERE course_id = ?", [(c,) for c in removed])
+                conn.execute(UPDATED_SQL, (time.time(),))
+
+    postings = _postings(vectors)
+    for block in nearest(todo, vectors, postings, k, block_size):
+        _write_block(conn, block, courses)
+
+    with conn:
+        conn.execute("DELETE FROM similar_course_fingerprints")
+        conn.executemany("INSERT INTO similar_course_fingerprints (course_id, fingerprint) VALUES (?, ?)",
+                         fingerprints.items())
+    return {"courses": len(courses), "recomputed": len(todo), "removed": len(removed), "full": full}
+
+
+# --- Reads ---
+def get_similar(conn, course_id):
+    """Return [(neighbour_id, title, score)] for a course, best first"""
+    return conn.execute(GET_SQL, (course_id,)).fetchall()
+
+
+def get_similar_many(conn, course_ids, chunk_size=500):
+    """Return {course_id: [(neighbour_id, title, score)]} for many courses in one query per chunk"""
+    course_ids = list(dict.fromkeys(course_ids))
+    similar = {course_id: [] for course_id in course_ids}
+    for start in range(0, len(course_ids), chunk_size):
+        chunk = course_ids[start:start + chunk_size]
+        rows = conn.execute(
+            f"""SELECT course_id, neighbour_id, title, score FROM similar_courses
+            WHERE course_id IN ({', '.join('?' * len(chunk))}) ORDER BY course_id, rank""",
+            chunk,
+        ).fetchall()
+        for course_id, neighbour_id, title, score in rows:
+            similar[course_id].append((neighbour_id, title, score))
+    return similar
+
+
+def main():
+    from database.db_functions import get_db_path, create_tables as create_app_tables
+
+    parser = argparse.ArgumentParser(description="Build the similar-courses index from courses.csv")
+    parser.add_argument("--db", help="SQLite file to write (defaults to the app database)")
+    parser.add_argument("--courses-csv", default=COURSES_CSV)
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--full", action="store_true", help="Recompute IDF and every course's neighbours")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db or get_db_path())
+    create_app_tables(conn)
+    try:
+        stats = build(conn, load_courses(args.courses_csv), args.k, args.block_size, args.full)
+    finally:
+        conn.close()
+    mode = "full" if stats["full"] else "incremental"
+    print(f"{mode} build: {stats['recomputed']} of {stats['courses']} courses recomputed, {stats['removed']} removed")
+
+
+if __name__ == "__main__":
+    main()
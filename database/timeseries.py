@@ -0,0 +1,152 @@
+import os
+import csv
+import threading
+from array import array
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAREER_DEMAND_CSV = os.path.join(BASE_DIR, "data", "career_demand.csv")
+
+MONTHLY = "monthly"
+QUARTERLY = "quarterly"
+RESOLUTIONS = (MONTHLY, QUARTERLY)
+
+# Decoded series kept per process: (career, resolution) -> (start_period, array)
+_series_cache = {}
+_cache_lock = threading.Lock()
+
+
+def create_table(conn):
+    """Create the career demand table if it doesn't exist
+
+    Each row holds one career at one resolution as a packed float32 array,
+    starting at `start_period` and advancing one period per element.
+    """
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS career_demand (
+        career TEXT NOT NULL,
+        resolution TEXT NOT NULL,
+        start_period TEXT NOT NULL,
+        length INTEGER NOT NULL,
+        series BLOB NOT NULL,
+        PRIMARY KEY (career, resolution)
+    )
+    ''')
+    conn.commit()
+
+
+def _month_index(month):
+    year, mon = month.split("-")
+    return int(year) * 12 + int(mon) - 1
+
+
+def _month_label(index):
+    return f"{index // 12}-{index % 12 + 1:02d}"
+
+
+def _quarter_label(month_index):
+    return f"{month_index // 12}-Q{(month_index % 12) // 3 + 1}"
+
+
+def period_labels(resolution, start_period, length, offset=0):
+    """Labels ("2026-10" or "2026-Q4") for `length` periods, `offset` periods after `start_period`"""
+    if resolution == MONTHLY:
+        start = _month_index(start_period) + offset
+        return [_month_label(start + i) for i in range(length)]
+    year, quarter = start_period.split("-Q")
+    start = int(year) * 4 + int(quarter) - 1 + offset
+    return [f"{q // 4}-Q{q % 4 + 1}" for q in range(start, start + length)]
+
+
+def _downsample_quarterly(start_month, monthly):
+    """Average monthly values into calendar quarters (partial quarters use what exists)"""
+    quarters = array("f")
+    first_quarter = None
+    current, total, count = None, 0.0, 0
+    for i, value in enumerate(monthly):
+        quarter = (start_month + i) // 3
+        if quarter != current:
+            if current is not None:
+                quarters.append(total / count)
+            current, total, count = quarter, 0.0, 0
+            if first_quarter is None:
+                first_quarter = start_month + i
+        total += value
+        count += 1
+    if count:
+        quarters.append(total / count)
+    return _quarter_label(first_quarter), quarters
+
+
+def load_csv(conn, csv_path=CAREER_DEMAND_CSV):
+    """Bulk-load career,month,demand_index rows and store monthly and quarterly arrays"""
+    points = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            points.setdefault(row["career"], {})[_month_index(row["month"])] = float(row["demand_index"])
+
+    rows = []
+    for career, by_month in points.items():
+        start, end = min(by_month), max(by_month)
+        # Carry the last value forward over missing months so the array stays dense
+        monthly = array("f")
+        last = by_month[start]
+        for month in range(start, end + 1):
+            last = by_month.get(month, last)
+            monthly.append(last)
+        rows.append((career, MONTHLY, _month_label(start), len(monthly), monthly.tobytes()))
+        quarter_start, quarterly = _downsample_quarterly(start, monthly)
+        rows.append((career, QUARTERLY, quarter_start, len(quarterly), quarterly.tobytes()))
+
+    with conn:
+        conn.execute("DELETE FROM career_demand")
+        conn.executemany(
+            "INSERT INTO career_demand (career, resolution, start_period, length, series) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    clear_cache()
+    return len(points)
+
+
+def ensure_loaded(conn, csv_path=CAREER_DEMAND_CSV):
+    """Load the CSV the first time the table is found empty"""
+    if conn.execute("SELECT 1 FROM career_demand LIMIT 1").fetchone() is None and os.path.exists(csv_path):
+        load_csv(conn, csv_path)
+
+
+def clear_cache():
+    """Drop decoded series so the next read goes back to the table"""
+    with _cache_lock:
+        _series_cache.clear()
+
+
+def _get_series(conn, career, resolution):
+    key = (career, resolution)
+    cached = _series_cache.get(key)
+    if cached is not None:
+        return cached
+    row = conn.execute(
+        "SELECT start_period, series FROM career_demand WHERE career = ? AND resolution = ?",
+        (career, resolution),
+    ).fetchone()
+    if row is None:
+        return None
+    values = array("f")
+    values.frombytes(row[1])
+    with _cache_lock:
+        _series_cache[key] = (row[0], values)
+    return row[0], values
+
+
+def get_window(conn, career, resolution=MONTHLY, last=12):
+    """Return (period labels, values) for the most recent `last` periods, or None"""
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+    series = _get_series(conn, career, resolution)
+    if series is None:
+        return None
+    start_period, values = series
+    offset = max(0, len(values) - last)
+    window = values[offset:]
+    # float32 storage; round away the representation noise for display
+    return period_labels(resolution, start_period, len(window), offset), [round(v, 4) for v in window]
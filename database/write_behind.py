@@ -0,0 +1,168 @@
+import time
+import queue
+import atexit
+import sqlite3
+import threading
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """Batches INSERT/UPDATE statements onto a background writer thread
+
+    Callers enqueue (sql, params) pairs and return immediately. The writer
+    groups whatever has accumulated into one transaction (executemany per
+    statement), committing once `flush_size` writes are pending or
+    `flush_interval` seconds have passed since the first pending write.
+    Writes are applied in submission order. If a batch fails, its rows are
+    retried one by one so that only the bad rows are lost.
+    """
+
+    def __init__(self, db_path, flush_size=100, flush_interval=1.0, max_pending=10000, prepare=None):
+        self.db_path = db_path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.prepare = prepare
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        # Set when the writer thread stops on an error; submit then writes synchronously and flush fails fast
+        self.failure = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._flushed = threading.Condition()
+        self._submitted = 0
+        self._completed = 0
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, sql, params=()):
+        """Queue one write; only blocks if the writer is `max_pending` writes behind
+
+        Never raises: once the writer thread has stopped, the write is applied
+        on the caller's thread instead, and logged and dropped if that fails.
+        """
+        if self.failure is not None:
+            self._write_now(sql, params)
+            return
+        with self._flushed:
+            self._submitted += 1
+        self._queue.put((sql, params))
+
+    def _write_now(self, sql, params):
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            try:
+                with conn:
+                    conn.execute(sql, params)
+            finally:
+                conn.close()
+            self.written += 1
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"Write-behind row dropped ({e}): {' '.join(sql.split()[:3])} {params!r}")
+
+    def pending(self):
+        """Number of queued writes not yet committed"""
+        return self._submitted - self._completed
+
+    def flush(self, timeout=None):
+        """Wait until everything submitted so far is committed; False on timeout or if the writer stopped"""
+        with self._flushed:
+            target = self._submitted
+            self._flushed.wait_for(lambda: self._completed >= target or self.failure is not None, timeout)
+            return self._completed >= target and self.failure is None
+
+    def close(self, timeout=5.0):
+        """Flush outstanding writes and stop the writer thread"""
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print(f"Write-behind queue still full after {timeout}s; {self.pending()} writes not flushed")
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                if self.prepare:
+                    self.prepare(conn)
+                self._loop(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Write-behind writer stopped: {e}")
+            with self._flushed:
+                self.failure = e
+                self.errors += self._submitted - self._completed
+                self._flushed.notify_all()
+            # Unblock submitters waiting on a full queue; what they queued is counted as lost
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _loop(self, conn):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.flush_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Drain anything left once shutdown was requested
+            if stopping:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not _STOP:
+                        batch.append(item)
+            self._write(conn, batch)
+
+    def _write(self, conn, batch):
+        # Consecutive writes of the same statement share one executemany; order is kept
+        runs = []
+        for sql, params in batch:
+            if runs and runs[-1][0] == sql:
+                runs[-1][1].append(params)
+            else:
+                runs.append((sql, [params]))
+        try:
+            with conn:
+                for sql, rows in runs:
+                    conn.executemany(sql, rows)
+            self.written += len(batch)
+            self.batches += 1
+        except sqlite3.Error as e:
+            print(f"Write-behind batch of {len(batch)} failed ({e}); retrying row by row")
+            for sql, params in batch:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                    self.written += 1
+                except sqlite3.Error as row_error:
+                    self.errors += 1
+                    print(f"Write-behind row dropped ({row_error}): {' '.join(sql.split()[:3])} {params!r}")
+        with self._flushed:
+            self._completed += len(batch)
+            self._flushed.notify_all()
@@ -0,0 +1,103 @@
+import streamlit as st
+import pandas as pd
+from utils import tracing, charts, warmup, session_memory
+from utils.shared_cache import get_shared_cache
+from utils.lazy_pages import load_times
+from utils.auth import is_admin
+from database import query_profiler
+from database.db_functions import get_active_user_count
+
+def show_admin():
+    """Display the admin-only performance page with per-span timings"""
+    if not is_admin():
+        st.error("You do not have access to this page")
+        return
+
+    st.title("⏱️ Performance")
+
+    enabled = st.toggle("Record spans", value=tracing.is_enabled())
+    if enabled != tracing.is_enabled():
+        tracing.enable() if enabled else tracing.disable()
+
+    rows = tracing.snapshot()
+    if not rows:
+        st.info("No spans recorded yet. Enable recording and use the app to collect timings.")
+    else:
+        df = pd.DataFrame(rows)
+        st.dataframe(df, use_container_width=True)
+        st.bar_chart(df.set_index("span")["wall_p95_ms"])
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button("Download JSON", tracing.to_json(), file_name="spans.json", mime="application/json")
+    with col2:
+        st.download_button("Download Prometheus", tracing.to_prometheus(), file_name="metrics.prom", mime="text/plain")
+    with col3:
+        if st.button("Reset", key="reset_spans"):
+            tracing.reset()
+            st.rerun()
+
+    st.subheader("Chart backends")
+    st.caption("Applies to every session in this process; compare the chart.* spans above.")
+    backend_cols = st.columns(len(charts.CHARTS))
+    for col, chart in zip(backend_cols, charts.CHARTS):
+        with col:
+            current = charts.backend_for(chart)
+            choice = st.selectbox(chart, charts.BACKENDS, index=charts.BACKENDS.index(current), key=f"backend_{chart}")
+            if choice != current:
+                charts.set_backend(chart, choice)
+
+    st.subheader("SQL statements")
+    profiling = st.toggle("Profile queries", value=query_profiler.is_enabled(),
+                          help="Applies to database connections opened after switching on")
+    if profiling != query_profiler.is_enabled():
+        query_profiler.enable() if profiling else query_profiler.disable()
+    statements = query_profiler.snapshot()
+    if statements:
+        st.dataframe(pd.DataFrame(statements), use_container_width=True)
+    findings = query_profiler.findings()
+    if findings:
+        st.warning(f"{len(findings)} reruns ran one statement {query_profiler.N_PLUS_ONE_THRESHOLD}+ times (N+1)")
+        st.dataframe(pd.DataFrame(findings), use_container_width=True)
+    if st.button("Reset statements", key="reset_statements"):
+        query_profiler.reset()
+        st.rerun()
+
+    st.subheader("Activity")
+    st.metric("Users logged in during the last 7 days", get_active_user_count(7))
+
+    st.subheader("Memory")
+    projected = st.number_input("Concurrent sessions to size for", min_value=1, value=1000, step=100)
+    report = session_memory.session_report(projected)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Sessions (last hour)", report["session_count"])
+    col2.metric("Mean session state", f"{report['mean_session_bytes'] / 1024:.1f} KiB",
+                help=f"Cap {report['session_cap_bytes'] // 1024} KiB per session")
+    col3.metric(f"Projected for {projected} sessions", f"{report['projected_bytes'] / 2 ** 20:.1f} MiB",
+                help="Shared object store once per process plus mean session state per session")
+    if report["sessions"]:
+        st.dataframe(pd.DataFrame([{k: v for k, v in row.items() if k != "keys"} for row in report["sessions"]]),
+                     use_container_width=True)
+        with st.expander("Largest session by key"):
+            st.json(report["sessions"][0]["keys"])
+    store_entries = session_memory.get_object_store().entries()
+    if store_entries:
+        st.caption(f"Shared object store: {report['store']['bytes'] / 1024:.1f} of "
+                   f"{report['store']['max_bytes'] / 2 ** 20:.0f} MiB")
+        st.dataframe(pd.DataFrame(store_entries), use_container_width=True)
+    with st.expander("Shared cache file entries"):
+        st.dataframe(pd.DataFrame(get_shared_cache().largest_entries(), columns=["key", "bytes"]),
+                     use_container_width=True)
+
+    st.subheader("Warm-up")
+    status = warmup.readiness()
+    st.caption("Ready" if status["ready"] else "Still warming up; /ready answers 503 until the required tasks finish")
+    if status["tasks"]:
+        st.dataframe(pd.DataFrame(status["tasks"]), use_container_width=True)
+
+    if load_times:
+        st.subheader("Lazy page imports")
+        st.dataframe(pd.DataFrame([{"module": m, "first_import_ms": ms} for m, ms in load_times.items()]))
+
+    with st.expander("Prometheus text"):
+        st.code(tracing.to_prometheus(), language="text")
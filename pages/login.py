@@ -1,6 +1,21 @@
+import math
+import uuid
 import streamlit as st
-from database.db_functions import init_connection
+from database.db_functions import init_connection, record_audit_event
+from database import audit
 from database.models import User
+from utils.tracing import span
+from utils.rate_limit import get_login_limiter
+
+def _allow_attempt(email):
+    """Spend a rate-limit token for this email and session, showing an error when none is left"""
+    # Refuse bursts before they cost a lookup and a password hash
+    session_id = st.session_state.setdefault("login_session_id", uuid.uuid4().hex)
+    allowed, retry_after = get_login_limiter().acquire(email, session_id)
+    if not allowed:
+        record_audit_event(audit.LOGIN_RATE_LIMITED, email=email, session_id=session_id)
+        st.error(f"Too many login attempts. Try again in {math.ceil(retry_after)} seconds.")
+    return allowed
 
 def show_login():
     """Display the login page"""
@@ -18,14 +33,21 @@ def show_login():
             if submit:
                 if not email or not password:
                     st.error("Please enter both email and password")
-                else:
+                elif _allow_attempt(email):
                     # Connect to database
                     conn = init_connection()
                     
                     # Check if user exists
-                    user = User.get_by_email(conn, email)
-                    
-                    if user and user.check_password(password):
+                    with span("login.get_by_email"):
+                        user = User.get_by_email(conn, email)
+
+                    with span("login.check_password"):
+                        valid = user is not None and user.check_password(password)
+
+                    session_id = st.session_state["login_session_id"]
+                    if valid:
+                        get_login_limiter().reset(email)
+                        record_audit_event(audit.LOGIN_SUCCEEDED, user.username, email, session_id)
                         # Successful login
                         st.session_state.authenticated = True
                         st.session_state.username = user.username
@@ -33,6 +55,7 @@ def show_login():
                         st.success("Login successful!")
                         st.rerun()
                     else:
+                        record_audit_event(audit.LOGIN_FAILED, user.username if user else None, email, session_id)
                         st.error("Invalid email or password")
         
         # Link to signup page
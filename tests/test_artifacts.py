@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+from database import artifacts, csv_sync, recommendations, similar_courses
+from database.db_functions import create_tables
+from utils.datasets import COURSES_CSV, load_courses, load_users
+
+
+def test_sections_older_than_the_database_are_not_served(tmp_path):
+    conn = sqlite3.connect(":memory:")
+    create_tables(conn)
+    csv_sync.sync(conn, csv_sync.COURSES, COURSES_CSV)
+    users, courses = load_users(), load_courses()
+    similar_courses.build(conn, courses, k=3)
+    recommendations.refresh(conn, users, courses, k=3, workers=1)
+
+    root = str(tmp_path / "artifacts")
+    artifacts.build_bundle(root, users, courses, 3, artifacts.stored_similar(conn, sorted(courses)), artifacts.watermarks(conn))
+    watcher = artifacts.BundleWatcher(root, watermarks=lambda: artifacts.watermarks(conn))
+    assert watcher.fresh(artifacts.SIMILAR) is watcher.bundle is not None
+    assert watcher.fresh(artifacts.RECOMMENDATIONS) is watcher.bundle
+
+    changed = dict(courses["C003"], description="Advanced Kubernetes operations")
+    similar_courses.build(conn, dict(courses, C003=changed), k=3)
+    watcher.check()
+    assert watcher.fresh(artifacts.SIMILAR) is None
+    assert watcher.fresh(artifacts.RECOMMENDATIONS) is watcher.bundle
+
+    recommendations.refresh(conn, users, courses, k=3, workers=1, full=True)
+    watcher.check()
+    assert watcher.fresh(artifacts.RECOMMENDATIONS) is None
+
+
+def test_unchanged_database_keeps_the_bundle(tmp_path):
+    conn = sqlite3.connect(":memory:")
+    create_tables(conn)
+    users, courses = load_users(), load_courses()
+    similar_courses.build(conn, courses, k=3)
+
+    root = str(tmp_path / "artifacts")
+    artifacts.build_bundle(root, users, courses, 3, artifacts.stored_similar(conn, sorted(courses)), artifacts.watermarks(conn))
+    watcher = artifacts.BundleWatcher(root, watermarks=lambda: artifacts.watermarks(conn))
+    # An incremental build with nothing to recompute writes no rows
+    similar_courses.build(conn, courses, k=3)
+    watcher.check()
+    assert watcher.fresh(artifacts.SIMILAR) is watcher.bundle
+    assert [row[0] for row in watcher.bundle.similar("C001")] == [
+        row[0] for row in similar_courses.get_similar(conn, "C001")]
+
+
+def test_bundle_serves_the_stored_neighbours_after_an_incremental_build(tmp_path):
+    conn = sqlite3.connect(":memory:")
+    create_tables(conn)
+    users, courses = load_users(), load_courses()
+    similar_courses.build(conn, courses, k=3)
+    courses = dict(courses, C003=dict(courses["C003"], description="Advanced Kubernetes operations"))
+    assert not similar_courses.build(conn, courses, k=3)["full"]
+
+    root = str(tmp_path / "artifacts")
+    artifacts.build_bundle(root, users, courses, 3, artifacts.stored_similar(conn, sorted(courses)),
+                           artifacts.watermarks(conn))
+    bundle = artifacts.BundleWatcher(root, watermarks=lambda: artifacts.watermarks(conn)).fresh(artifacts.SIMILAR)
+    for course_id in courses:
+        stored = similar_courses.get_similar(conn, course_id)
+        served = bundle.similar(course_id)
+        assert [row[0] for row in served] == [row[0] for row in stored]
+        assert [row[2] for row in served] == pytest.approx([row[2] for row in stored], rel=1e-6)
+
+
+def test_broken_version_is_not_reloaded_until_current_changes(tmp_path, monkeypatch):
+    root = tmp_path / "artifacts"
+    (root / "v1").mkdir(parents=True)
+    (root / "CURRENT").write_text("v1")
+    opened = []
+    real_bundle = artifacts.Bundle
+
+    def counting_bundle(path, verify=True):
+        opened.append(path)
+        return real_bundle(path, verify)
+
+    monkeypatch.setattr(artifacts, "Bundle", counting_bundle)
+    watcher = artifacts.BundleWatcher(str(root))
+    watcher.check()
+    watcher.check()
+    assert watcher.bundle is None and watcher.failed_version == "v1"
+    assert len(opened) == 1
+
+    (root / "CURRENT").write_text("v2")
+    watcher.check()
+    assert len(opened) == 2
@@ -0,0 +1,78 @@
+import sqlite3
+import datetime
+import time
+
+from database import audit
+
+
+def _ts(year, month, day=15):
+    return time.mktime(datetime.date(year, month, day).timetuple())
+
+
+def _log(conn, created_at, event, username, email="user@example.com"):
+    partition = audit.partition_for(created_at)
+    audit.ensure_partition(conn, partition)
+    with conn:
+        conn.execute(audit.insert_sql(partition), (created_at, event, username, email, "session"))
+        if event == audit.LOGIN_SUCCEEDED:
+            conn.execute(audit.LAST_SEEN_SQL, (username, created_at))
+
+
+def _conn():
+    conn = sqlite3.connect(":memory:")
+    audit.create_tables(conn)
+    return conn
+
+
+def test_entries_go_to_monthly_partitions():
+    conn = _conn()
+    _log(conn, _ts(2026, 1), audit.LOGIN_SUCCEEDED, "ana")
+    _log(conn, _ts(2026, 3), audit.LOGIN_FAILED, "ana")
+
+    assert {"audit_log_202601", "audit_log_202603"} <= set(audit.partitions(conn))
+    assert audit.partitions(conn) == sorted(audit.partitions(conn))
+
+
+def test_events_between_spans_partitions_and_filters():
+    conn = _conn()
+    _log(conn, _ts(2026, 1, 30), audit.LOGIN_FAILED, "ana", "ana@example.com")
+    _log(conn, _ts(2026, 2, 2), audit.LOGIN_SUCCEEDED, "ana", "ana@example.com")
+    _log(conn, _ts(2026, 2, 3), audit.LOGIN_FAILED, "bo", "bo@example.com")
+    _log(conn, _ts(2026, 4, 1), audit.LOGIN_FAILED, "bo", "bo@example.com")
+
+    rows = audit.events_between(conn, _ts(2026, 1, 1), _ts(2026, 3, 1))
+    assert [row[2] for row in rows] == ["ana", "ana", "bo"]
+    assert [row[0] for row in rows] == sorted(row[0] for row in rows)
+
+    failed = audit.events_between(conn, _ts(2026, 1, 1), _ts(2026, 3, 1), event=audit.LOGIN_FAILED)
+    assert [row[2] for row in failed] == ["ana", "bo"]
+    assert len(audit.events_between(conn, _ts(2026, 1, 1), _ts(2026, 5, 1), email="bo@example.com")) == 2
+
+
+def test_active_users_counts_latest_login_per_user():
+    conn = _conn()
+    now = _ts(2026, 6, 20)
+    _log(conn, now - 30 * 86400, audit.LOGIN_SUCCEEDED, "ana")
+    _log(conn, now - 86400, audit.LOGIN_SUCCEEDED, "ana")
+    _log(conn, now - 2 * 86400, audit.LOGIN_SUCCEEDED, "bo")
+    _log(conn, now - 3 * 86400, audit.LOGIN_FAILED, "cy")
+    _log(conn, now - 20 * 86400, audit.LOGIN_SUCCEEDED, "dee")
+
+    assert audit.active_users(conn, 7, now) == 2
+    assert audit.active_users(conn, 30, now) == 3
+
+
+def test_prune_drops_old_partitions_and_last_seen_rows():
+    conn = _conn()
+    now = _ts(2026, 7, 10)
+    _log(conn, _ts(2025, 12), audit.LOGIN_SUCCEEDED, "old")
+    _log(conn, _ts(2026, 1, 31), audit.LOGIN_SUCCEEDED, "lapsed")
+    _log(conn, _ts(2026, 2, 1), audit.LOGIN_SUCCEEDED, "kept")
+
+    # Six months counting July: February onwards survives
+    dropped = audit.prune(conn, retention_months=6, now=now)
+    assert dropped == ["audit_log_202512", "audit_log_202601"]
+    assert audit.partitions(conn)[0] == "audit_log_202602"
+    remaining = {row[0] for row in conn.execute("SELECT username FROM user_last_seen")}
+    assert remaining == {"kept"}
+    assert audit.prune(conn, retention_months=6, now=now) == []
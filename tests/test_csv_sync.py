@@ -0,0 +1,63 @@
+import csv
+import sqlite3
+
+from database import csv_sync, similar_courses
+from database.db_functions import create_tables
+from utils.datasets import COURSES_CSV, load_courses
+
+
+def _write_courses(path, edit=None, drop=()):
+    with open(COURSES_CSV, newline="") as f:
+        rows = list(csv.DictReader(f))
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for row in rows:
+            if row["course_id"] in drop:
+                continue
+            if edit and row["course_id"] in edit:
+                row.update(edit[row["course_id"]])
+            writer.writerow(row)
+
+
+def _synced(tmp_path, **changes):
+    conn = sqlite3.connect(":memory:")
+    create_tables(conn)
+    path = tmp_path / "courses.csv"
+    _write_courses(path)
+    csv_sync.sync(conn, csv_sync.COURSES, str(path))
+    similar_courses.build(conn, load_courses(str(path)), k=3)
+    before = similar_courses.get_similar_many(conn, sorted(load_courses(str(path))))
+
+    _write_courses(path, **changes)
+    csv_sync.sync(conn, csv_sync.COURSES, str(path))
+    return conn, str(path), before
+
+
+def test_non_text_change_keeps_neighbours(tmp_path):
+    conn, path, before = _synced(tmp_path, edit={"C003": {"duration_hours": "99"}})
+    assert similar_courses.get_similar(conn, "C003") == before["C003"]
+
+    stats = similar_courses.build(conn, load_courses(path), k=3)
+    assert not stats["full"]
+    assert similar_courses.get_similar(conn, "C003") == before["C003"]
+
+
+def test_text_change_is_recomputed_by_the_next_build(tmp_path):
+    conn, path, before = _synced(tmp_path, edit={"C003": {"description": "Advanced Kubernetes operations"}})
+    assert similar_courses.get_similar(conn, "C003") == []
+
+    stats = similar_courses.build(conn, load_courses(path), k=3)
+    assert not stats["full"]
+    assert len(similar_courses.get_similar(conn, "C003")) == 3
+
+
+def test_deleted_course_drops_out_of_neighbour_lists(tmp_path):
+    conn, path, before = _synced(tmp_path, drop={"C003"})
+    holders = [course_id for course_id, rows in before.items() if any(row[0] == "C003" for row in rows)]
+    assert holders
+
+    similar_courses.build(conn, load_courses(path), k=3)
+    after = similar_courses.get_similar_many(conn, holders)
+    assert all(len(rows) == 3 and "C003" not in [row[0] for row in rows] for rows in after.values())
+    assert similar_courses.get_similar(conn, "C003") == []
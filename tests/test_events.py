@@ -0,0 +1,68 @@
+import sqlite3
+
+import pytest
+
+from database import events
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    events.create_tables(conn)
+    yield conn
+    conn.close()
+
+
+def test_invalid_events_are_skipped_one_by_one(conn):
+    rejected = []
+    batch = [
+        ("U1", "C1", events.COURSE_STARTED, None, 1.0),
+        ("U1", "C1", events.COURSE_PROGRESS, None, 2.0),
+        ("U1", None, events.COURSE_COMPLETED, None, 3.0),
+        ("U1", None, events.QUIZ_SCORED, 140.0, 4.0),
+        ("U1", None, "course_liked", None, 5.0),
+        ("U1", None, events.QUIZ_SCORED, 80.0, 6.0),
+    ]
+    assert events.append_events(conn, batch, rejected) == 2
+    assert len(rejected) == 4
+    assert conn.execute("SELECT count(*) FROM learning_events").fetchone()[0] == 2
+    assert events.get_engagement(conn, "U1")["avg_quiz_score"] == 80.0
+
+
+def test_started_course_has_zero_progress(conn):
+    events.append_events(conn, [("U1", "C1", events.COURSE_STARTED, None, 1.0)])
+    assert events.get_course_progress(conn, "U1") == {"C1": 0.0}
+    events.append_events(conn, [("U1", "C1", events.COURSE_PROGRESS, 0.4, 2.0),
+                                ("U1", "C1", events.COURSE_STARTED, None, 3.0)])
+    assert events.get_course_progress(conn, "U1") == {"C1": 0.4}
+
+
+def test_batcher_keeps_events_when_append_fails(conn):
+    batcher = events.EventBatcher(conn, batch_size=10)
+    batcher.record("U1", events.COURSE_STARTED, "C1")
+    batcher.record("U1", events.FORUM_POST)
+    conn.execute("DROP TABLE user_engagement")
+    with pytest.raises(sqlite3.OperationalError):
+        batcher.flush()
+
+    events.create_tables(conn)
+    assert batcher.flush() == 2
+    assert conn.execute("SELECT count(*) FROM learning_events").fetchone()[0] == 2
+
+
+def test_repeated_course_events_count_each_course_once(conn):
+    events.append_events(conn, [("U1", "C1", events.COURSE_STARTED, None, 1.0),
+                                ("U1", "C1", events.COURSE_STARTED, None, 2.0)])
+    events.append_events(conn, [("U1", "C1", events.COURSE_STARTED, None, 3.0),
+                                ("U1", "C1", events.COURSE_COMPLETED, None, 4.0)])
+    events.append_events(conn, [("U1", "C1", events.COURSE_COMPLETED, None, 5.0)])
+    started, completed = conn.execute(
+        "SELECT courses_started, courses_completed FROM user_engagement WHERE user_id = 'U1'").fetchone()
+    assert (started, completed) == (1, 1)
+    assert events.get_engagement(conn, "U1")["course_completion_rate"] == 1.0
+
+
+def test_older_event_does_not_move_updated_at_back(conn):
+    events.append_events(conn, [("U1", "C1", events.COURSE_PROGRESS, 0.5, 10.0)])
+    events.append_events(conn, [("U1", "C1", events.COURSE_PROGRESS, 0.2, 5.0)])
+    assert conn.execute("SELECT progress, updated_at FROM course_progress").fetchone() == (0.5, 10.0)
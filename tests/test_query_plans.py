@@ -0,0 +1,19 @@
+import sqlite3
+
+from database import query_profiler
+from database.db_functions import create_tables
+
+
+def test_registered_queries_use_an_index(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "schema.db"))
+    create_tables(conn)
+    failures = query_profiler.check_query_plans(conn)
+    assert failures == {}, "full table scans: " + "; ".join(
+        f"{name}: {', '.join(scans)}" for name, scans in failures.items())
+
+
+def test_full_scans_are_reported():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    assert query_profiler.full_scans(conn, "SELECT id FROM items WHERE name = ?", ("x",))
+    assert not query_profiler.full_scans(conn, "SELECT name FROM items WHERE id = ?", (1,))
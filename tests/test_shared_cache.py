@@ -0,0 +1,80 @@
+import os
+import stat
+import time
+
+import pytest
+
+from utils import session_memory
+from utils import shared_cache as shared_cache_module
+from utils.shared_cache import SharedCache, shared_cache
+
+
+def test_cache_file_and_directory_are_private(tmp_path):
+    path = tmp_path / "private" / "cache.db"
+    cache = SharedCache(str(path))
+    cache.set("key", {"value": 1})
+
+    assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+    assert cache.get("key") == (True, {"value": 1})
+
+
+def test_world_writable_location_is_refused(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+    with pytest.raises(PermissionError):
+        SharedCache(str(shared / "cache.db"))
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+def test_file_owned_by_another_user_is_refused(tmp_path):
+    path = tmp_path / "cache.db"
+    path.touch(mode=0o600)
+    os.chown(path, 12345, 12345)
+    with pytest.raises(PermissionError):
+        SharedCache(str(path))
+
+
+def test_ttl_expires_the_in_process_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_cache_module, "_default_cache", SharedCache(str(tmp_path / "cache.db")))
+    monkeypatch.setattr(session_memory, "_store", session_memory.ObjectStore())
+    calls = []
+
+    @shared_cache("test.ttl", ttl=0.2)
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert compute() == 1
+    assert compute() == 1
+    time.sleep(0.5)
+    assert compute() == 2
+
+
+def test_cache_path_is_read_when_the_cache_opens(tmp_path, monkeypatch):
+    monkeypatch.setenv("CODEHOLICS_CACHE_PATH", str(tmp_path / "late" / "cache.db"))
+    assert SharedCache().path == str(tmp_path / "late" / "cache.db")
+
+
+def test_unusable_cache_file_falls_back_to_process_cache(tmp_path, monkeypatch):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+    monkeypatch.setenv("CODEHOLICS_CACHE_PATH", str(shared / "cache.db"))
+    monkeypatch.setattr(shared_cache_module, "_default_cache", None)
+    monkeypatch.setattr(session_memory, "_store", session_memory.ObjectStore())
+    calls = []
+
+    @shared_cache("test.fallback")
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    assert isinstance(shared_cache_module.get_shared_cache(), shared_cache_module.LocalCache)
+    assert compute(2) == 4
+    assert compute(2) == 4
+    assert calls == [2]
+    compute.invalidate()
+    assert compute(2) == 4
+    assert calls == [2, 2]
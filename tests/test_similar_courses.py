@@ -0,0 +1,18 @@
+import sqlite3
+
+from database import similar_courses
+from utils.datasets import load_courses
+
+
+def test_get_similar_many_matches_single_lookups():
+    conn = sqlite3.connect(":memory:")
+    similar_courses.create_tables(conn)
+    courses = load_courses()
+    similar_courses.build(conn, courses, k=3)
+
+    course_ids = sorted(courses)[:7] + ["C999"]
+    many = similar_courses.get_similar_many(conn, course_ids, chunk_size=3)
+    assert list(many) == course_ids
+    for course_id in course_ids:
+        assert many[course_id] == similar_courses.get_similar(conn, course_id)
+    assert many["C999"] == []
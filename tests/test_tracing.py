@@ -0,0 +1,34 @@
+from collections import deque
+
+from utils import tracing
+
+
+def _series(text, suffix):
+    return [float(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+            if line.startswith(f"codeholics_span_wall_seconds_{suffix}")]
+
+
+def test_prometheus_histogram_never_decreases(monkeypatch):
+    monkeypatch.setattr(tracing, "_spans", {})
+    tracing.record("span", 0.002)
+    before = tracing.to_prometheus()
+    # Push the first sample out of a one-sample rolling window
+    tracing._spans["span"].wall = deque(tracing._spans["span"].wall, maxlen=1)
+    tracing.record("span", 20.0)
+    after = tracing.to_prometheus()
+
+    assert _series(after, "count") == [2]
+    assert all(b >= a for a, b in zip(_series(before, "bucket"), _series(after, "bucket")))
+    assert _series(after, "bucket")[-1] == 2
+
+
+def test_health_reports_failing_checks(monkeypatch):
+    monkeypatch.setattr(tracing, "_health_checks", {})
+    assert tracing.health() == {"healthy": True, "problems": {}}
+
+    tracing.register_health_check("ok", lambda: None)
+    tracing.register_health_check("writer", lambda: "writer stopped")
+    tracing.register_health_check("broken", lambda: 1 / 0)
+    document = tracing.health()
+    assert not document["healthy"]
+    assert document["problems"] == {"writer": "writer stopped", "broken": "ZeroDivisionError: division by zero"}
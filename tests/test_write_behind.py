@@ -0,0 +1,82 @@
+import time
+import sqlite3
+import threading
+
+import pytest
+
+from database.write_behind import WriteBehindQueue
+
+
+def _prepare(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    conn.execute("CREATE TABLE IF NOT EXISTS log (seq INTEGER PRIMARY KEY AUTOINCREMENT, item_id INTEGER)")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "queue.db")
+
+
+def test_writes_keep_submission_order(db_path):
+    writer = WriteBehindQueue(db_path, flush_size=100, flush_interval=0.05, prepare=_prepare)
+    for i in range(5):
+        writer.submit("INSERT INTO items (id, name) VALUES (?, ?)", (i, f"item {i}"))
+        # Each log row reads the item inserted just before it
+        writer.submit("INSERT INTO log (item_id) SELECT max(id) FROM items", ())
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute("SELECT item_id FROM log ORDER BY seq")] == [0, 1, 2, 3, 4]
+
+
+def test_failed_batch_is_retried_row_by_row(db_path):
+    writer = WriteBehindQueue(db_path, flush_size=100, flush_interval=0.05, prepare=_prepare)
+    writer.submit("INSERT INTO items (id, name) VALUES (?, ?)", (1, "first"))
+    writer.submit("INSERT INTO items (id, name) VALUES (?, ?)", (2, None))
+    writer.submit("INSERT INTO items (id, name) VALUES (?, ?)", (3, "third"))
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute("SELECT id FROM items ORDER BY id")] == [1, 3]
+    assert (writer.written, writer.errors) == (2, 1)
+
+
+def test_dead_writer_fails_waiters_and_writes_synchronously(db_path):
+    conn = sqlite3.connect(db_path)
+    _prepare(conn)
+    conn.close()
+
+    def broken(conn):
+        raise sqlite3.OperationalError("no schema")
+
+    writer = WriteBehindQueue(db_path, max_pending=2, prepare=broken)
+    writer._thread.join(5)
+    assert writer.failure is not None
+    # No timeout: this used to wait forever on a dead writer
+    assert writer.flush() is False
+    # Callers on the request path must not see the failure
+    writer.submit("INSERT INTO items (id, name) VALUES (1, 'x')")
+    writer.submit("INSERT INTO missing (id) VALUES (1)")
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute("SELECT name FROM items")] == ["x"]
+    assert (writer.written, writer.errors) == (1, 1)
+
+
+def test_close_does_not_block_on_a_full_queue(db_path):
+    release = threading.Event()
+
+    def slow(conn):
+        release.wait(5)
+        _prepare(conn)
+
+    writer = WriteBehindQueue(db_path, max_pending=1, prepare=slow)
+    writer.submit("INSERT INTO items (id, name) VALUES (?, ?)", (1, "queued"))
+    start = time.monotonic()
+    writer.close(timeout=0.1)
+    assert time.monotonic() - start < 1
+    release.set()
+    assert writer.flush(timeout=5)
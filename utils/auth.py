@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 from functools import wraps
 
@@ -10,4 +11,12 @@ def login_required(func):
             st.session_state.current_page = "login"
             st.experimental_rerun()
         return func(*args, **kwargs)
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def is_admin():
+    """Check if the logged-in user is listed in CODEHOLICS_ADMINS (comma-separated usernames)"""
+    if not st.session_state.get("authenticated", False):
+        return False
+    admins = {name.strip() for name in os.environ.get("CODEHOLICS_ADMINS", "").split(",") if name.strip()}
+    return st.session_state.get("username") in admins
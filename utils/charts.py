@@ -0,0 +1,324 @@
+import os
+import io
+import math
+import threading
+from collections import OrderedDict
+import streamlit as st
+import pandas as pd
+from utils.tracing import span
+
+MATPLOTLIB = "matplotlib"
+VEGA = "vega"
+BACKENDS = (MATPLOTLIB, VEGA)
+
+CHARTS = ("bar", "radar", "skill_gap", "journey_timeline", "trend", "donut")
+
+# Rendered outputs kept per process; identical inputs (e.g. revisiting a tab) reuse them
+RENDER_CACHE_SIZE = int(os.environ.get("CODEHOLICS_CHART_CACHE_SIZE", "256"))
+
+# Resolution st.pyplot uses when rasterizing
+PYPLOT_DPI = 200
+
+_render_cache = OrderedDict()
+_render_lock = threading.Lock()
+
+
+def _load_backends():
+    """Read the default and per-chart backends from the environment
+
+    CODEHOLICS_CHART_BACKEND sets the default for every chart and
+    CODEHOLICS_CHART_BACKENDS overrides single charts, e.g. "radar=vega,trend=matplotlib".
+    """
+    default = os.environ.get("CODEHOLICS_CHART_BACKEND", MATPLOTLIB)
+    backends = {chart: default for chart in CHARTS}
+    for item in os.environ.get("CODEHOLICS_CHART_BACKENDS", "").split(","):
+        if "=" in item:
+            chart, backend = [part.strip() for part in item.split("=", 1)]
+            backends[chart] = backend
+    for chart, backend in backends.items():
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown chart backend {backend!r} for {chart!r}")
+    return backends
+
+
+_backends = _load_backends()
+
+
+def backend_for(chart):
+    """Return the backend currently used for `chart`"""
+    return _backends.get(chart, MATPLOTLIB)
+
+
+def set_backend(chart, backend):
+    """Switch a single chart (or "*" for all) to another backend at runtime"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown chart backend {backend!r}")
+    for name in (CHARTS if chart == "*" else [chart]):
+        _backends[name] = backend
+
+
+def _render(backend, figure):
+    """Turn a built chart into what gets sent: PNG bytes or an Altair chart"""
+    if backend == VEGA:
+        return figure
+    import matplotlib.pyplot as plt
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=PYPLOT_DPI, bbox_inches="tight")
+    plt.close(figure)
+    return buffer.getvalue()
+
+
+def _show(chart_name, backend, build, *args):
+    """Build a chart with the chosen backend, or reuse the cached output, and send it to the browser"""
+    key = (chart_name, backend, repr(args))
+    with _render_lock:
+        output = _render_cache.get(key)
+        if output is not None:
+            _render_cache.move_to_end(key)
+
+    if output is None:
+        with span(f"chart.{chart_name}.{backend}"):
+            output = _render(backend, build(*args))
+        with _render_lock:
+            _render_cache[key] = output
+            while len(_render_cache) > RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
+
+    if backend == VEGA:
+        st.altair_chart(output, use_container_width=True)
+    else:
+        st.image(output, use_container_width=True)
+
+
+def clear_render_cache():
+    """Forget all cached chart outputs"""
+    with _render_lock:
+        _render_cache.clear()
+
+
+# --- Matplotlib builders (server-rasterized PNG) ---
+def _mpl_bar(names, values, title, xlabel, figsize):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.barh(names, values, color='skyblue')
+    ax.set_xlim(0, 1)
+    ax.set_xlabel(xlabel)
+    if title:
+        ax.set_title(title)
+    return fig
+
+
+def _mpl_radar(labels, values, color, title):
+    import numpy as np
+    import matplotlib.pyplot as plt
+    angles = np.linspace(0, 2*np.pi, len(labels), endpoint=False).tolist()
+    stats = np.concatenate((values, [values[0]]))
+    angles = np.concatenate((angles, [angles[0]]))
+
+    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
+    ax.plot(angles, stats, 'o-', linewidth=2, color=color)
+    ax.fill(angles, stats, alpha=0.25, color=color)
+    ax.set_thetagrids(np.degrees(angles[:-1]), labels)
+    ax.set_ylim(0, 1)
+    ax.grid(True)
+    ax.set_title(title, y=1.1)
+    return fig
+
+
+def _mpl_skill_gap(skill_gap, title):
+    import matplotlib.pyplot as plt
+    df = pd.DataFrame(skill_gap)
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.barh(df['skill'], df['current'], color='skyblue', label='Current')
+    ax.barh(df['skill'], df['gap'], left=df['current'], color='lightcoral', label='Gap')
+    ax.set_xlim(0, 1)
+    ax.set_xlabel('Proficiency')
+    ax.legend()
+    ax.set_title(title)
+    return fig
+
+
+def _mpl_journey_timeline(timeline):
+    import matplotlib.pyplot as plt
+    df = pd.DataFrame(timeline)
+    fig, ax1 = plt.subplots(figsize=(10, 5))
+
+    # Plot hours (left axis)
+    color = 'tab:blue'
+    ax1.set_xlabel('Course Progression')
+    ax1.set_ylabel('Cumulative Hours', color=color)
+    ax1.plot(df['course_index'], df['cumulative_hours'], 'o-', color=color)
+    ax1.tick_params(axis='y', labelcolor=color)
+
+    # Create a second y-axis for skills
+    ax2 = ax1.twinx()
+    color = 'tab:red'
+    ax2.set_ylabel('Cumulative Skills', color=color)
+    ax2.plot(df['course_index'], df['cumulative_skills'], 'o-', color=color)
+    ax2.tick_params(axis='y', labelcolor=color)
+
+    fig.tight_layout()
+    return fig
+
+
+def _mpl_trend(periods, values, title, xlabel):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(8, 3))
+    ax.plot(periods, values, marker='o')
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Demand Index')
+    ax.set_title(title)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    return fig
+
+
+def _mpl_donut(difficulty, title):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(3, 3))
+    size = 0.3
+    vals = [difficulty, 5 - difficulty]
+
+    cmap = plt.get_cmap("Blues")
+    outer_colors = [cmap(0.7), cmap(0.2)]
+
+    ax.pie(vals, radius=1, colors=outer_colors, wedgeprops=dict(width=size, edgecolor='w'))
+    ax.set_title(title)
+    return fig
+
+
+# --- Vega-Lite builders (data + spec rendered in the browser) ---
+def _vega_bar(names, values, title, xlabel, figsize):
+    import altair as alt
+    df = pd.DataFrame({'Skill': names, 'Value': values})
+    return alt.Chart(df, title=title or "").mark_bar(color='skyblue').encode(
+        x=alt.X('Value:Q', title=xlabel, scale=alt.Scale(domain=[0, 1])),
+        y=alt.Y('Skill:N', sort=None, title=None),
+        tooltip=['Skill', alt.Tooltip('Value:Q', format='.0%')],
+    )
+
+
+def _vega_radar(labels, values, color, title):
+    import altair as alt
+    # Vega-Lite has no polar line mark, so project the polygon to x/y here
+    count = len(labels)
+    points = []
+    for i, (label, value) in enumerate(list(zip(labels, values)) + [(labels[0], values[0])]):
+        angle = math.pi / 2 - 2 * math.pi * (i % count) / count
+        points.append({'Skill': label, 'Proficiency': value, 'order': i,
+                       'x': value * math.cos(angle), 'y': value * math.sin(angle),
+                       'label_x': 1.15 * math.cos(angle), 'label_y': 1.15 * math.sin(angle)})
+    df = pd.DataFrame(points)
+    domain = alt.Scale(domain=[-1.3, 1.3])
+    base = alt.Chart(df, title=title)
+    shape = base.mark_line(point=True, color=color, strokeWidth=2).encode(
+        x=alt.X('x:Q', scale=domain, axis=None),
+        y=alt.Y('y:Q', scale=domain, axis=None),
+        order='order:Q',
+        tooltip=['Skill', alt.Tooltip('Proficiency:Q', format='.0%')],
+    )
+    text = base.transform_filter(alt.datum.order < count).mark_text().encode(
+        x=alt.X('label_x:Q', scale=domain, axis=None),
+        y=alt.Y('label_y:Q', scale=domain, axis=None),
+        text='Skill:N',
+    )
+    return (shape + text).properties(height=400)
+
+
+def _vega_skill_gap(skill_gap, title):
+    import altair as alt
+    rows = []
+    for row in skill_gap:
+        rows.append({'Skill': row['skill'], 'Part': 'Current', 'Value': row['current']})
+        rows.append({'Skill': row['skill'], 'Part': 'Gap', 'Value': row['gap']})
+    df = pd.DataFrame(rows)
+    return alt.Chart(df, title=title).mark_bar().encode(
+        x=alt.X('sum(Value):Q', title='Proficiency', scale=alt.Scale(domain=[0, 1])),
+        y=alt.Y('Skill:N', sort=None, title=None),
+        color=alt.Color('Part:N', scale=alt.Scale(domain=['Current', 'Gap'], range=['skyblue', 'lightcoral'])),
+        order=alt.Order('Part:N', sort='ascending'),
+        tooltip=['Skill', 'Part', alt.Tooltip('Value:Q', format='.0%')],
+    )
+
+
+def _vega_journey_timeline(timeline):
+    import altair as alt
+    df = pd.DataFrame(timeline)
+    base = alt.Chart(df).encode(x=alt.X('course_index:O', title='Course Progression'),
+                                tooltip=['course_title', 'cumulative_hours', 'cumulative_skills'])
+    hours = base.mark_line(point=True, color='#1f77b4').encode(
+        y=alt.Y('cumulative_hours:Q', title='Cumulative Hours', axis=alt.Axis(titleColor='#1f77b4')))
+    skills = base.mark_line(point=True, color='#d62728').encode(
+        y=alt.Y('cumulative_skills:Q', title='Cumulative Skills', axis=alt.Axis(titleColor='#d62728')))
+    return alt.layer(hours, skills).resolve_scale(y='independent')
+
+
+def _vega_trend(periods, values, title, xlabel):
+    import altair as alt
+    df = pd.DataFrame({'Period': periods, 'Demand Index': values})
+    return alt.Chart(df, title=title).mark_line(point=True).encode(
+        x=alt.X('Period', title=xlabel),
+        y=alt.Y('Demand Index:Q', scale=alt.Scale(zero=False)),
+        tooltip=['Period', alt.Tooltip('Demand Index:Q', format='.3f')],
+    )
+
+
+def _vega_donut(difficulty, title):
+    import altair as alt
+    df = pd.DataFrame({'Part': ['Difficulty', 'Remaining'], 'Value': [difficulty, 5 - difficulty]})
+    return alt.Chart(df, title=title).mark_arc(innerRadius=50).encode(
+        theta=alt.Theta('Value:Q'),
+        color=alt.Color('Part:N', scale=alt.Scale(range=['#3182bd', '#c6dbef']), legend=None),
+        tooltip=['Part', 'Value'],
+    ).properties(height=200)
+
+
+_BUILDERS = {
+    "bar": {MATPLOTLIB: _mpl_bar, VEGA: _vega_bar},
+    "radar": {MATPLOTLIB: _mpl_radar, VEGA: _vega_radar},
+    "skill_gap": {MATPLOTLIB: _mpl_skill_gap, VEGA: _vega_skill_gap},
+    "journey_timeline": {MATPLOTLIB: _mpl_journey_timeline, VEGA: _vega_journey_timeline},
+    "trend": {MATPLOTLIB: _mpl_trend, VEGA: _vega_trend},
+    "donut": {MATPLOTLIB: _mpl_donut, VEGA: _vega_donut},
+}
+
+
+def build(chart, backend, *args):
+    """Build a chart object without displaying it (matplotlib Figure or Altair Chart)"""
+    return _BUILDERS[chart][backend](*args)
+
+
+# --- Public chart functions used by the pages ---
+def bar_chart(names, values, title=None, xlabel='Proficiency', figsize=(4, 4)):
+    """Horizontal 0-1 bar chart, e.g. skill proficiency or relevance"""
+    backend = backend_for("bar")
+    _show("bar", backend, _BUILDERS["bar"][backend], names, values, title, xlabel, figsize)
+
+
+def radar_chart(labels, values, color, title):
+    """Closed radar/polygon chart of skill proficiencies"""
+    backend = backend_for("radar")
+    _show("radar", backend, _BUILDERS["radar"][backend], list(labels), list(values), color, title)
+
+
+def skill_gap_chart(skill_gap, title):
+    """Stacked current/gap bars from compute_skill_gap rows"""
+    backend = backend_for("skill_gap")
+    _show("skill_gap", backend, _BUILDERS["skill_gap"][backend], skill_gap, title)
+
+
+def journey_timeline_chart(timeline):
+    """Cumulative hours and skills per course from build_timeline rows"""
+    backend = backend_for("journey_timeline")
+    _show("journey_timeline", backend, _BUILDERS["journey_timeline"][backend], timeline)
+
+
+def trend_chart(periods, values, title, xlabel='Months'):
+    """Demand index line chart"""
+    backend = backend_for("trend")
+    _show("trend", backend, _BUILDERS["trend"][backend], list(periods), list(values), title, xlabel)
+
+
+def difficulty_chart(difficulty):
+    """Donut showing a course difficulty out of 5"""
+    backend = backend_for("donut")
+    _show("donut", backend, _BUILDERS["donut"][backend], difficulty, f'Difficulty: {difficulty}/5')
@@ -0,0 +1,300 @@
+from utils.recommender import recommend_courses, career_matches, CAREER_SKILLS
+from utils.shared_cache import shared_cache
+
+# Assumed proficiency for skills a learning path introduces
+NEW_SKILL_PROFICIENCY = 0.6
+
+# Proficiency boost for existing skills covered by a course in the path
+COURSE_SKILL_BOOST = 0.15
+
+# Minimum proficiency a career expects for each required skill
+REQUIRED_PROFICIENCY = 0.7
+
+
+def build_timeline(courses):
+    """Cumulative hours and distinct skills after each course of a learning path"""
+    cumulative_hours = 0
+    cumulative_skills = []
+    timeline_data = []
+
+    for i, course in enumerate(courses):
+        cumulative_hours += course['duration_hours']
+        for skill in course['skills_covered']:
+            if skill not in cumulative_skills:
+                cumulative_skills.append(skill)
+
+        timeline_data.append({
+            'course_index': i + 1,
+            'course_title': course['title'],
+            'cumulative_hours': cumulative_hours,
+            'cumulative_skills': len(cumulative_skills)
+        })
+    return timeline_data
+
+
+def project_skills(skill_data, learning_path):
+    """Skill profile after completing the learning path, plus the names of newly added skills"""
+    current_skill_names = [s['skill'] for s in skill_data]
+    new_skill_names = [s for s in learning_path['expected_skills'] if s not in current_skill_names]
+
+    projected_skills = [dict(s) for s in skill_data]
+    # Add new skills
+    for skill in new_skill_names:
+        projected_skills.append({"skill": skill, "proficiency": NEW_SKILL_PROFICIENCY})
+
+    # Boost existing skills once per course that covers them, without exceeding 1.0
+    for skill in projected_skills:
+        if skill['skill'] in current_skill_names:
+            for course in learning_path['courses']:
+                if skill['skill'] in course['skills_covered']:
+                    skill['proficiency'] = min(1.0, skill['proficiency'] + COURSE_SKILL_BOOST)
+    return projected_skills, new_skill_names
+
+
+def compute_skill_gap(skill_data, required_skills):
+    """Current proficiency and remaining gap for each skill a career requires"""
+    proficiency = {s['skill']: s['proficiency'] for s in skill_data}
+    skill_gap = []
+    for req_skill in required_skills:
+        prof = proficiency.get(req_skill, 0)
+        skill_gap.append({
+            "skill": req_skill,
+            "required": True,
+            "current": prof,
+            "gap": max(0, REQUIRED_PROFICIENCY - prof)
+        })
+    return skill_gap
+
+
+def assemble_dashboard(user, courses, k=5):
+    """Build everything the dashboard renders for a parsed dataset user
+
+    The result uses the same shapes as the dashboard's learning path and skill
+    data, so it can stand in for the mock data.
+    """
+    skill_data = [{"skill": skill, "proficiency": prof} for skill, prof in user["skills"].items()]
+    path_courses = [courses[course_id] for course_id, _ in recommend_courses(user, courses, k)]
+
+    expected_skills = []
+    for course in path_courses:
+        for skill in course['skills_covered']:
+            if skill not in user["skills"] and skill not in expected_skills:
+                expected_skills.append(skill)
+
+    careers = career_matches(user)
+    learning_path = {
+        "user_id": user["user_id"],
+        "courses": path_courses,
+        "expected_skills": expected_skills,
+        "total_duration": sum(c['duration_hours'] for c in path_courses),
+        "career_alignment": careers[0][1] if careers else 0.0,
+    }
+    projected, new_skills = project_skills(skill_data, learning_path)
+    return {
+        "skill_data": skill_data,
+        "learning_path": learning_path,
+        "timeline": build_timeline(path_courses),
+        "projected_skills": projected,
+        "new_skills": new_skills,
+        "skill_gaps": {career: compute_skill_gap(skill_data, CAREER_SKILLS[career]) for career, _ in careers},
+    }
+
+
+# --- Demo data ---
+# Cached in the shared cache, so every worker on a host computes them once and
+# the "dashboard.data" warm-up task can fill them before the first visit
+@shared_cache("dashboard.users")
+def get_mock_user_data():
+    return {
+        "U001": {"name": "Alice Smith", "title": "Data Science Student"},
+        "U002": {"name": "Bob Johnson", "title": "Software Developer"},
+        "U003": {"name": "Carol Williams", "title": "Product Manager"},
+        "U004": {"name": "Dave Brown", "title": "UX Designer"},
+        "U005": {"name": "Eve Davis", "title": "DevOps Engineer"}
+    }
+
+
+@shared_cache("dashboard.learning_path")
+def get_mock_learning_path(user_id):
+    # Different paths for different users
+    paths = {
+        "U001": {
+            "user_id": "U001",
+            "courses": [
+                {"course_id": "C001", "title": "Advanced Python Programming", "skills_covered": ["Python", "Data Structures", "Algorithms"], "duration_hours": 25, "difficulty_level": 4.2},
+                {"course_id": "C015", "title": "Machine Learning Fundamentals", "skills_covered": ["Machine Learning", "Python", "Mathematics"], "duration_hours": 30, "difficulty_level": 4.5},
+                {"course_id": "C022", "title": "Data Visualization", "skills_covered": ["Data Visualization", "Python", "Statistics"], "duration_hours": 20, "difficulty_level": 3.8},
+                {"course_id": "C031", "title": "Deep Learning", "skills_covered": ["Deep Learning", "Neural Networks", "Python"], "duration_hours": 40, "difficulty_level": 4.8},
+                {"course_id": "C042", "title": "Natural Language Processing", "skills_covered": ["NLP", "Python", "Deep Learning"], "duration_hours": 35, "difficulty_level": 4.6}
+            ],
+            "expected_skills": ["Data Structures", "Algorithms", "Machine Learning", "Data Visualization", "Statistics", "Deep Learning", "Neural Networks", "NLP"],
+            "total_duration": 150,
+            "career_alignment": 0.85,
+            "peer_recommendations": ["U012", "U045", "U078"]
+        },
+        "U002": {
+            "user_id": "U002",
+            "courses": [
+                {"course_id": "C003", "title": "Web Development with React", "skills_covered": ["React", "JavaScript", "Web Development"], "duration_hours": 25, "difficulty_level": 3.9},
+                {"course_id": "C014", "title": "Backend Development with Node.js", "skills_covered": ["Node.js", "JavaScript", "APIs"], "duration_hours": 28, "difficulty_level": 4.0},
+                {"course_id": "C025", "title": "DevOps Fundamentals", "skills_covered": ["DevOps", "CI/CD", "Docker"], "duration_hours": 22, "difficulty_level": 4.2},
+                {"course_id": "C037", "title": "Cloud Computing with AWS", "skills_covered": ["AWS", "Cloud Computing", "Serverless"], "duration_hours": 30, "difficulty_level": 4.1},
+                {"course_id": "C049", "title": "Microservices Architecture", "skills_covered": ["Microservices", "System Design", "APIs"], "duration_hours": 35, "difficulty_level": 4.6}
+            ],
+            "expected_skills": ["React", "Node.js", "APIs", "DevOps", "CI/CD", "Docker", "AWS", "Cloud Computing", "Serverless", "Microservices", "System Design"],
+            "total_duration": 140,
+            "career_alignment": 0.9,
+            "peer_recommendations": ["U023", "U056", "U089"]
+        },
+        "U003": {
+            "user_id": "U003",
+            "courses": [
+                {"course_id": "C007", "title": "Product Management Fundamentals", "skills_covered": ["Product Management", "Strategy", "Requirements"], "duration_hours": 20, "difficulty_level": 3.5},
+                {"course_id": "C019", "title": "Agile Methodologies", "skills_covered": ["Agile", "Scrum", "Kanban"], "duration_hours": 15, "difficulty_level": 3.2},
+                {"course_id": "C028", "title": "User Research", "skills_covered": ["User Research", "Interviews", "Surveys"], "duration_hours": 18, "difficulty_level": 3.4},
+                {"course_id": "C036", "title": "Product Analytics", "skills_covered": ["Analytics", "KPIs", "Data Analysis"], "duration_hours": 22, "difficulty_level": 3.8},
+                {"course_id": "C044", "title": "Product Strategy", "skills_covered": ["Product Strategy", "Roadmapping", "Competitive Analysis"], "duration_hours": 25, "difficulty_level": 4.0}
+            ],
+            "expected_skills": ["Product Management", "Strategy", "Requirements", "Agile", "Scrum", "Kanban", "User Research", "Analytics", "KPIs", "Roadmapping", "Competitive Analysis"],
+            "total_duration": 100,
+            "career_alignment": 0.95,
+            "peer_recommendations": ["U034", "U067", "U099"]
+        },
+        "U004": {
+            "user_id": "U004",
+            "courses": [
+                {"course_id": "C008", "title": "UI/UX Design Principles", "skills_covered": ["UI Design", "UX Design", "Design Thinking"], "duration_hours": 25, "difficulty_level": 3.6},
+                {"course_id": "C021", "title": "User Interface Prototyping", "skills_covered": ["Prototyping", "Figma", "UI Design"], "duration_hours": 20, "difficulty_level": 3.5},
+                {"course_id": "C033", "title": "Interaction Design", "skills_covered": ["Interaction Design", "User Flows", "Wireframing"], "duration_hours": 22, "difficulty_level": 3.7},
+                {"course_id": "C041", "title": "Design Systems", "skills_covered": ["Design Systems", "Component Libraries", "Style Guides"], "duration_hours": 18, "difficulty_level": 4.0},
+                {"course_id": "C047", "title": "UX Research Methods", "skills_covered": ["UX Research", "Usability Testing", "Heuristic Evaluation"], "duration_hours": 24, "difficulty_level": 3.8}
+            ],
+            "expected_skills": ["UI Design", "UX Design", "Design Thinking", "Prototyping", "Figma", "Interaction Design", "User Flows", "Wireframing", "Design Systems", "UX Research"],
+            "total_duration": 109,
+            "career_alignment": 0.92,
+            "peer_recommendations": ["U027", "U058", "U091"]
+        },
+        "U005": {
+            "user_id": "U005",
+            "courses": [
+                {"course_id": "C010", "title": "DevOps Pipeline Automation", "skills_covered": ["DevOps", "CI/CD", "Jenkins"], "duration_hours": 30, "difficulty_level": 4.3},
+                {"course_id": "C018", "title": "Container Orchestration with Kubernetes", "skills_covered": ["Kubernetes", "Containers", "Docker"], "duration_hours": 35, "difficulty_level": 4.5},
+                {"course_id": "C026", "title": "Infrastructure as Code", "skills_covered": ["IaC", "Terraform", "CloudFormation"], "duration_hours": 28, "difficulty_level": 4.2},
+                {"course_id": "C039", "title": "Cloud Security", "skills_covered": ["Security", "Cloud", "Compliance"], "duration_hours": 25, "difficulty_level": 4.4},
+                {"course_id": "C043", "title": "Monitoring and Observability", "skills_covered": ["Monitoring", "Observability", "Prometheus"], "duration_hours": 22, "difficulty_level": 4.0}
+            ],
+            "expected_skills": ["DevOps", "CI/CD", "Jenkins", "Kubernetes", "Containers", "Docker", "IaC", "Terraform", "CloudFormation", "Security", "Cloud", "Compliance", "Monitoring", "Observability", "Prometheus"],
+            "total_duration": 140,
+            "career_alignment": 0.88,
+            "peer_recommendations": ["U018", "U052", "U087"]
+        }
+    }
+    return paths.get(user_id, None)
+
+
+@shared_cache("dashboard.clusters")
+def get_mock_cluster_data(user_id):
+    # Mock cluster data
+    clusters = {
+        "U001": {"cluster": 0, "cluster_size": 45, "description": "Data Science & ML Focused"},
+        "U002": {"cluster": 1, "cluster_size": 38, "description": "Software Development"},
+        "U003": {"cluster": 2, "cluster_size": 32, "description": "Product & Management"},
+        "U004": {"cluster": 3, "cluster_size": 28, "description": "Design & UX Focused"},
+        "U005": {"cluster": 4, "cluster_size": 35, "description": "DevOps & Infrastructure"}
+    }
+    return clusters.get(user_id, None)
+
+
+@shared_cache("dashboard.skills")
+def get_mock_skill_data(user_id):
+    # Mock skill data
+    skills = {
+        "U001": [
+            {"skill": "Python", "proficiency": 0.85},
+            {"skill": "Data Analysis", "proficiency": 0.78},
+            {"skill": "Statistics", "proficiency": 0.72},
+            {"skill": "Machine Learning", "proficiency": 0.65},
+            {"skill": "SQL", "proficiency": 0.80},
+            {"skill": "Data Visualization", "proficiency": 0.75}
+        ],
+        "U002": [
+            {"skill": "JavaScript", "proficiency": 0.88},
+            {"skill": "HTML/CSS", "proficiency": 0.92},
+            {"skill": "React", "proficiency": 0.75},
+            {"skill": "Node.js", "proficiency": 0.70},
+            {"skill": "Git", "proficiency": 0.85},
+            {"skill": "API Design", "proficiency": 0.72}
+        ],
+        "U003": [
+            {"skill": "Product Management", "proficiency": 0.82},
+            {"skill": "Agile", "proficiency": 0.78},
+            {"skill": "Requirements Gathering", "proficiency": 0.85},
+            {"skill": "Roadmapping", "proficiency": 0.76},
+            {"skill": "Stakeholder Management", "proficiency": 0.80},
+            {"skill": "Analytics", "proficiency": 0.65}
+        ],
+        "U004": [
+            {"skill": "UI Design", "proficiency": 0.90},
+            {"skill": "UX Design", "proficiency": 0.88},
+            {"skill": "Wireframing", "proficiency": 0.85},
+            {"skill": "User Research", "proficiency": 0.75},
+            {"skill": "Figma", "proficiency": 0.92},
+            {"skill": "Design Systems", "proficiency": 0.78}
+        ],
+        "U005": [
+            {"skill": "DevOps", "proficiency": 0.87},
+            {"skill": "Docker", "proficiency": 0.85},
+            {"skill": "Kubernetes", "proficiency": 0.78},
+            {"skill": "CI/CD", "proficiency": 0.83},
+            {"skill": "Cloud Platforms", "proficiency": 0.80},
+            {"skill": "Linux", "proficiency": 0.92}
+        ]
+    }
+    return skills.get(user_id, None)
+
+
+@shared_cache("dashboard.peers")
+def get_mock_peer_data(peer_ids):
+    peers = {
+        "U012": {"name": "John Smith", "title": "Data Scientist", "company": "Tech Analytics Inc.", "skills": ["Python", "Machine Learning", "Deep Learning"]},
+        "U023": {"name": "Jennifer Lee", "title": "Senior Developer", "company": "WebSolutions Co.", "skills": ["JavaScript", "React", "Node.js"]},
+        "U034": {"name": "Michael Chen", "title": "Product Manager", "company": "InnovateTech", "skills": ["Product Strategy", "Agile", "User Research"]},
+        "U045": {"name": "Sarah Johnson", "title": "Data Engineer", "company": "DataFlow Systems", "skills": ["Python", "SQL", "Big Data"]},
+        "U056": {"name": "David Wilson", "title": "Full Stack Developer", "company": "CodeMasters", "skills": ["JavaScript", "Python", "React"]},
+        "U067": {"name": "Emily Davis", "title": "Senior Product Manager", "company": "ProductFirst", "skills": ["Product Management", "Analytics", "Strategic Planning"]},
+        "U078": {"name": "Ryan Thompson", "title": "Machine Learning Engineer", "company": "AI Solutions", "skills": ["Python", "Deep Learning", "TensorFlow"]},
+        "U089": {"name": "Jessica Brown", "title": "DevOps Engineer", "company": "CloudOps", "skills": ["Docker", "Kubernetes", "AWS"]},
+        "U018": {"name": "Kevin Zhang", "title": "Cloud Engineer", "company": "CloudTech", "skills": ["AWS", "Docker", "Terraform"]},
+        "U027": {"name": "Lisa Wang", "title": "UX Designer", "company": "DesignThink", "skills": ["UI Design", "User Research", "Figma"]},
+        "U052": {"name": "Mark Johnson", "title": "Site Reliability Engineer", "company": "ReliableSystems", "skills": ["DevOps", "Monitoring", "Kubernetes"]},
+        "U058": {"name": "Anna Garcia", "title": "UI/UX Designer", "company": "CreativeDesign", "skills": ["UI Design", "UX Design", "Design Systems"]},
+        "U087": {"name": "Tom Wilson", "title": "DevOps Engineer", "company": "InfraOps", "skills": ["CI/CD", "Kubernetes", "Terraform"]},
+        "U091": {"name": "Sophie Miller", "title": "Senior Designer", "company": "VisualSolutions", "skills": ["UX Design", "Design Systems", "Prototyping"]},
+        "U099": {"name": "Chris Taylor", "title": "Product Strategy Lead", "company": "StrategyWorks", "skills": ["Product Strategy", "Market Analysis", "Roadmapping"]}
+    }
+    return {pid: peers[pid] for pid in peer_ids if pid in peers}
+
+
+# Career recommendations based on skill profile, for users without stored career matches
+CAREER_OPTIONS = {
+    "U001": ["Data Scientist", "Machine Learning Engineer", "Data Analyst"],
+    "U002": ["Senior Software Engineer", "Full Stack Developer", "DevOps Engineer"],
+    "U003": ["Senior Product Manager", "Product Director", "Program Manager"],
+    "U004": ["UX/UI Lead", "Design Manager", "Creative Director"],
+    "U005": ["DevOps Lead", "Cloud Architect", "Site Reliability Engineer"]
+}
+
+
+def dashboard_careers():
+    """Every career the skill-gap tabs can show: stored career matches and the demo options"""
+    return sorted(set(CAREER_SKILLS).union(*CAREER_OPTIONS.values()))
+
+
+def warm_demo_data():
+    """Fill the shared caches the dashboard reads, for every demo user"""
+    for user_id in get_mock_user_data():
+        learning_path = get_mock_learning_path(user_id)
+        get_mock_cluster_data(user_id)
+        get_mock_skill_data(user_id)
+        if learning_path:
+            get_mock_peer_data(learning_path["peer_recommendations"])
@@ -0,0 +1,128 @@
+import os
+import csv
+import random
+import argparse
+from utils.datasets import USER_COLUMNS, COURSE_COLUMNS
+
+# Vocabularies taken from the shipped data/users.csv and data/courses.csv
+SKILLS = ["Cloud Computing", "Communication", "Data Analysis", "Deep Learning", "DevOps",
+          "Leadership", "Machine Learning", "Mobile Development", "Problem Solving",
+          "Product Management", "Python", "SQL", "UX Design", "Web Development"]
+CERTIFICATIONS = ["AWS", "Azure", "GCP", "PMP", "SCRUM"]
+CAREERS = ["Data Scientist", "DevOps Engineer", "ML Engineer", "Product Manager",
+           "Software Developer", "UX Designer"]
+INDUSTRIES = ["Tech", "Finance", "Healthcare", "Manufacturing"]
+
+# Columns expected by User.import_from_csv for application accounts
+ACCOUNT_COLUMNS = ["username", "email", "password", "skills", "education_level", "about"]
+EDUCATION_LEVELS = ["High School", "Associate's Degree", "Bachelor's Degree",
+                    "Master's Degree", "PhD", "Other"]
+
+
+def course_id(n):
+    """Course ids follow the C001 pattern and simply grow wider past 999"""
+    return f"C{n:03d}"
+
+
+def user_id(n):
+    """User ids follow the U001 pattern and simply grow wider past 999"""
+    return f"U{n:03d}"
+
+
+def generate_courses(count, seed=0):
+    """Yield `count` course rows in the courses.csv schema"""
+    rng = random.Random(seed)
+    for n in range(1, count + 1):
+        skills = rng.sample(SKILLS, rng.randint(1, 5))
+        yield {
+            "course_id": course_id(n),
+            "title": f"Course {n}",
+            "description": f"This is course {n} covering {', '.join(skills)}",
+            "skills_covered": str(skills),
+            "difficulty_level": rng.uniform(1.0, 5.0),
+            "duration_hours": rng.randint(5, 40),
+            "prerequisites": str(rng.sample(SKILLS, rng.randint(0, 2))),
+            "industry_relevance": str({industry: rng.random() for industry in INDUSTRIES}),
+        }
+
+
+def generate_users(count, course_count, seed=0):
+    """Yield `count` user rows in the users.csv schema"""
+    rng = random.Random(seed + 1)
+    for n in range(1, count + 1):
+        skills = [{skill: rng.random()} for skill in rng.sample(SKILLS, rng.randint(2, 5))]
+        completed = [course_id(rng.randint(1, course_count))
+                     for _ in range(rng.randint(0, min(10, course_count)))]
+        yield {
+            "user_id": user_id(n),
+            "explicit_skills": str(skills),
+            "certifications": str(rng.sample(CERTIFICATIONS, rng.randint(0, 2))),
+            "completed_courses": str(list(dict.fromkeys(completed))),
+            "career_goals": str(rng.sample(CAREERS, rng.randint(1, 3))),
+            "engagement_metrics": str({
+                "course_completion_rate": rng.random(),
+                "avg_quiz_score": rng.uniform(50.0, 100.0),
+                "forum_participation": rng.random(),
+                "time_spent_weekly": rng.randint(1, 20),
+            }),
+        }
+
+
+def generate_accounts(count, seed=0):
+    """Yield `count` login accounts in the format User.import_from_csv expects"""
+    rng = random.Random(seed + 2)
+    for n in range(1, count + 1):
+        yield {
+            "username": f"user{n}",
+            "email": f"user{n}@example.com",
+            "password": f"password{n}",
+            "skills": ", ".join(rng.sample(SKILLS, rng.randint(1, 4))),
+            "education_level": rng.choice(EDUCATION_LEVELS),
+            "about": "",
+        }
+
+
+def write_csv(path, columns, rows):
+    """Stream rows to a CSV file without holding them in memory"""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def generate_dataset(out_dir, users=200, courses=50, accounts=0, seed=0):
+    """Write users.csv, courses.csv and optionally accounts.csv into out_dir"""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        "courses": os.path.join(out_dir, "courses.csv"),
+        "users": os.path.join(out_dir, "users.csv"),
+    }
+    write_csv(paths["courses"], COURSE_COLUMNS, generate_courses(courses, seed))
+    write_csv(paths["users"], USER_COLUMNS, generate_users(users, courses, seed))
+    if accounts:
+        paths["accounts"] = os.path.join(out_dir, "accounts.csv")
+        write_csv(paths["accounts"], ACCOUNT_COLUMNS, generate_accounts(accounts, seed))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic users/courses datasets")
+    parser.add_argument("out_dir", help="Directory to write the CSV files to")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--accounts", type=int, default=0,
+                        help="Also write accounts.csv for User.import_from_csv")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = generate_dataset(args.out_dir, args.users, args.courses, args.accounts, args.seed)
+    for name, path in paths.items():
+        print(f"{name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
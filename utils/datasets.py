@@ -0,0 +1,76 @@
+import os
+import csv
+import ast
+from utils import ingest
+
+# --- Dataset locations ---
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+USERS_CSV = os.path.join(DATA_DIR, "users.csv")
+COURSES_CSV = os.path.join(DATA_DIR, "courses.csv")
+
+# --- Schemas ---
+USER_COLUMNS = ["user_id", "explicit_skills", "certifications", "completed_courses",
+                "career_goals", "engagement_metrics"]
+COURSE_COLUMNS = ["course_id", "title", "description", "skills_covered", "difficulty_level",
+                  "duration_hours", "prerequisites", "industry_relevance"]
+
+# Columns stored as Python literals (lists / dicts) inside the CSV cells
+USER_LITERAL_COLUMNS = ["explicit_skills", "certifications", "completed_courses",
+                        "career_goals", "engagement_metrics"]
+COURSE_LITERAL_COLUMNS = ["skills_covered", "prerequisites", "industry_relevance"]
+
+
+def parse_literal(kind, text):
+    """Parse a literal cell with the fast tokenizer, falling back to literal_eval for other shapes"""
+    try:
+        return ingest.parse_cell(kind, text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+def parse_user_row(row):
+    """Turn a raw users.csv row into a dict of typed values"""
+    user = dict(row)
+    for column in USER_LITERAL_COLUMNS:
+        user[column] = parse_literal(ingest.USER_SCHEMA[column], row[column])
+    # explicit_skills is a list of single-entry dicts; flatten to {skill: proficiency}
+    skills = {}
+    for entry in user["explicit_skills"]:
+        skills.update(entry)
+    user["skills"] = skills
+    return user
+
+
+def parse_course_row(row):
+    """Turn a raw courses.csv row into a dict of typed values"""
+    course = dict(row)
+    for column in COURSE_LITERAL_COLUMNS:
+        course[column] = parse_literal(ingest.COURSE_SCHEMA[column], row[column])
+    course["difficulty_level"] = float(row["difficulty_level"])
+    course["duration_hours"] = int(row["duration_hours"])
+    return course
+
+
+def iter_users(csv_path=USERS_CSV):
+    """Yield parsed users one at a time from a users.csv file"""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield parse_user_row(row)
+
+
+def iter_courses(csv_path=COURSES_CSV):
+    """Yield parsed courses one at a time from a courses.csv file"""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield parse_course_row(row)
+
+
+def load_users(csv_path=USERS_CSV):
+    """Load all users from a users.csv file"""
+    return list(iter_users(csv_path))
+
+
+def load_courses(csv_path=COURSES_CSV):
+    """Load all courses from a courses.csv file, keyed by course_id"""
+    return {course["course_id"]: course for course in iter_courses(csv_path)}
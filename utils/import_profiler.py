@@ -0,0 +1,89 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each run is appended here so cold-start cost can be tracked across commits
+HISTORY_PATH = os.path.join(BASE_DIR, "import_profile_history.jsonl")
+
+# What a fresh worker imports before the first page renders, and what pages load on demand
+DEFAULT_TARGETS = ["streamlit", "pages.login", "pages.signup", "pages.dashboard", "pages.admin"]
+
+
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into {module: (self_ms, cumulative_ms)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = [part.strip() for part in line.split(":", 1)[1].split("|")]
+            modules[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+        except ValueError:
+            continue
+    return modules
+
+
+def profile_import(module_name):
+    """Import `module_name` in a fresh interpreter and return its per-module import times"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    modules = parse_importtime(result.stderr)
+    return {
+        "module": module_name,
+        "ok": result.returncode == 0,
+        "total_ms": modules.get(module_name, (0.0, 0.0))[1],
+        "modules": modules,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(targets=DEFAULT_TARGETS, top=15):
+    """Profile each target and keep the `top` slowest modules (by self time) per target"""
+    entries = []
+    for target in targets:
+        profile = profile_import(target)
+        slowest = sorted(profile["modules"].items(), key=lambda item: item[1][0], reverse=True)[:top]
+        entries.append({
+            "module": target,
+            "ok": profile["ok"],
+            "total_ms": profile["total_ms"],
+            "slowest": [{"module": name, "self_ms": s, "cumulative_ms": c} for name, (s, c) in slowest],
+        })
+    return {"commit": git_commit(), "timestamp": time.time(), "targets": entries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report per-module import cost of the app's pages")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON-lines file each report is appended to")
+    args = parser.parse_args()
+
+    report = build_report(args.targets, args.top)
+    for entry in report["targets"]:
+        status = "" if entry["ok"] else "  (import failed)"
+        print(f"{entry['module']}: {entry['total_ms']:.1f} ms{status}")
+        for row in entry["slowest"]:
+            print(f"    {row['module']:40s} self {row['self_ms']:8.1f} ms  cumulative {row['cumulative_ms']:8.1f} ms")
+
+    if args.history:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    main()
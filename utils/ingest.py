@@ -0,0 +1,254 @@
+import os
+import re
+import csv
+import ast
+import sys
+import time
+import argparse
+from collections import deque
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Cell grammar ---
+# The literal columns only ever hold these shapes, as written by str() on lists and dicts:
+#   STR_LIST    ['Python', 'SQL']
+#   NUM_DICT    {'Tech': 0.61, 'Finance': 0.88}
+#   SKILL_LIST  [{'SQL': 0.82}, {'Python': 0.74}]
+# Each shape is validated with one full-match regex and its items pulled out with findall,
+# which runs in C instead of building and walking an AST per cell. Cells whose strings are
+# all plain single-quoted (no escapes) take a cheaper pair of regexes first.
+STR = "str"
+INT = "int"
+FLOAT = "float"
+STR_LIST = "str_list"
+NUM_DICT = "num_dict"
+SKILL_LIST = "skill_list"
+
+_PLAIN_STR = r"'[^'\\]*'"
+_STR = r"""(?:'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")"""
+_NUM = r"-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?"
+
+
+def _sequence(open_, item, close):
+    return re.compile(rf"\{open_}\s*(?:{item}(?:\s*,\s*{item})*\s*,?)?\s*\{close}")
+
+
+def _shapes(string):
+    pair = rf"{string}\s*:\s*{_NUM}"
+    return {
+        STR_LIST: _sequence("[", string, "]"),
+        NUM_DICT: _sequence("{", pair, "}"),
+        SKILL_LIST: _sequence("[", rf"\{{\s*{pair}\s*\}}", "]"),
+    }
+
+
+_PLAIN_SHAPES = _shapes(_PLAIN_STR)
+_SHAPES = _shapes(_STR)
+_PLAIN_STR_ITEM = re.compile(r"'([^'\\]*)'")
+_PLAIN_PAIR_ITEM = re.compile(rf"'([^'\\]*)'\s*:\s*({_NUM})")
+_STR_ITEM = re.compile(_STR)
+_PAIR_ITEM = re.compile(rf"({_STR})\s*:\s*({_NUM})")
+
+USER_SCHEMA = {
+    "user_id": STR,
+    "explicit_skills": SKILL_LIST,
+    "certifications": STR_LIST,
+    "completed_courses": STR_LIST,
+    "career_goals": STR_LIST,
+    "engagement_metrics": NUM_DICT,
+}
+COURSE_SCHEMA = {
+    "course_id": STR,
+    "title": STR,
+    "description": STR,
+    "skills_covered": STR_LIST,
+    "difficulty_level": FLOAT,
+    "duration_hours": INT,
+    "prerequisites": STR_LIST,
+    "industry_relevance": NUM_DICT,
+}
+
+# Rows sent to a worker per task
+CHUNK_ROWS = 20000
+
+
+class RowError(ValueError):
+    """A cell that doesn't match its column's type"""
+
+    def __init__(self, line, column, message, value=None):
+        super().__init__(f"line {line}, column {column}: {message}")
+        self.line = line
+        self.column = column
+        self.value = value
+
+    def as_dict(self):
+        return {"line": self.line, "column": self.column, "error": str(self), "value": self.value}
+
+
+def _string(token):
+    # Escapes are rare (an apostrophe inside a name); let Python decode those
+    return ast.literal_eval(token) if "\\" in token else token[1:-1]
+
+
+def _number(text):
+    return float(text) if "." in text or "e" in text or "E" in text else int(text)
+
+
+def parse_str_list(text):
+    if _PLAIN_SHAPES[STR_LIST].fullmatch(text):
+        return _PLAIN_STR_ITEM.findall(text)
+    if not _SHAPES[STR_LIST].fullmatch(text):
+        raise ValueError("expected a list of strings")
+    return [_string(token) for token in _STR_ITEM.findall(text)]
+
+
+def parse_num_dict(text):
+    if _PLAIN_SHAPES[NUM_DICT].fullmatch(text):
+        return {key: _number(number) for key, number in _PLAIN_PAIR_ITEM.findall(text)}
+    if not _SHAPES[NUM_DICT].fullmatch(text):
+        raise ValueError("expected a dict of string to number")
+    return {_string(key): _number(number) for key, number in _PAIR_ITEM.findall(text)}
+
+
+def parse_skill_list(text):
+    if _PLAIN_SHAPES[SKILL_LIST].fullmatch(text):
+        return [{key: _number(number)} for key, number in _PLAIN_PAIR_ITEM.findall(text)]
+    if not _SHAPES[SKILL_LIST].fullmatch(text):
+        raise ValueError("expected a list of single-entry {skill: proficiency} dicts")
+    return [{_string(key): _number(number)} for key, number in _PAIR_ITEM.findall(text)]
+
+
+PARSERS = {
+    STR: str,
+    INT: int,
+    FLOAT: float,
+    STR_LIST: parse_str_list,
+    NUM_DICT: parse_num_dict,
+    SKILL_LIST: parse_skill_list,
+}
+
+
+def parse_cell(kind, text):
+    """Parse one cell of the given kind; raises ValueError if it doesn't match"""
+    return PARSERS[kind](text if kind == STR else text.strip())
+
+
+# --- Chunked ingestion ---
+class Table:
+    """Typed columns (one list per schema column) plus the rows that failed validation"""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.columns = {name: [] for name in schema}
+        self.errors = []
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), []))
+
+    def extend(self, other):
+        for name, values in other.columns.items():
+            self.columns[name].extend(values)
+        self.errors.extend(other.errors)
+
+    def rows(self):
+        """Iterate the table as one dict per row"""
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+
+def parse_chunk(schema, header, lines):
+    """Parse (line number, raw cells) pairs into a Table; runs in a pool worker"""
+    table = Table(schema)
+    missing = [name for name in schema if name not in header]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    positions = [(name, header.index(name), kind) for name, kind in schema.items()]
+    outputs = [table.columns[name] for name in schema]
+    width = len(header)
+
+    for line, cells in lines:
+        if len(cells) != width:
+            table.errors.append(RowError(line, None, f"expected {width} cells, got {len(cells)}").as_dict())
+            continue
+        parsed = []
+        for name, index, kind in positions:
+            cell = cells[index]
+            try:
+                parsed.append(PARSERS[kind](cell if kind == STR else cell.strip()))
+            except ValueError as e:
+                table.errors.append(RowError(line, name, str(e), cell).as_dict())
+                break
+        else:
+            for output, value in zip(outputs, parsed):
+                output.append(value)
+    return table
+
+
+def _chunks(reader, size):
+    chunk = []
+    for cells in reader:
+        chunk.append((reader.line_num, cells))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ingest(csv_path, schema, workers=None, chunk_rows=CHUNK_ROWS, max_errors=None):
+    """Read a CSV into a typed Table, parsing chunks in a process pool
+
+    The csv module (C) splits rows in this process; chunks of raw cells go to
+    `workers` processes (default: one per CPU; 1 = parse inline). Invalid rows are left out and
+    reported in `table.errors`; more than `max_errors` of them raises.
+    """
+    table = Table(schema)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        chunks = _chunks(reader, chunk_rows)
+        parse = partial(parse_chunk, schema, header)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for chunk in chunks:
+                table.extend(parse(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # A bounded window of chunks in flight, collected in file order
+                window = deque()
+                for chunk in chunks:
+                    window.append(pool.submit(parse, chunk))
+                    if len(window) > 2 * workers:
+                        table.extend(window.popleft().result())
+                while window:
+                    table.extend(window.popleft().result())
+        if max_errors is not None and len(table.errors) > max_errors:
+            raise ValueError(f"{len(table.errors)} invalid rows in {csv_path}; first: {table.errors[0]['error']}")
+    return table
+
+
+def main():
+    from utils.datasets import USERS_CSV, COURSES_CSV
+
+    parser = argparse.ArgumentParser(description="Validate and parse users.csv / courses.csv")
+    parser.add_argument("kind", choices=["users", "courses"])
+    parser.add_argument("csv_path", nargs="?")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    schema = USER_SCHEMA if args.kind == "users" else COURSE_SCHEMA
+    path = args.csv_path or (USERS_CSV if args.kind == "users" else COURSES_CSV)
+    start = time.perf_counter()
+    table = ingest(path, schema, args.workers, args.chunk_rows)
+    elapsed = time.perf_counter() - start
+    print(f"{len(table)} rows in {elapsed:.2f}s ({len(table) / elapsed:.0f} rows/s), {len(table.errors)} invalid")
+    for error in table.errors[:20]:
+        print(error["error"])
+    if table.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import sys
+import time
+import importlib
+import threading
+from utils import tracing
+
+_lock = threading.Lock()
+
+# module name -> milliseconds its first import took in this process
+load_times = {}
+
+
+def lazy_page(module_name, func_name):
+    """Return a stand-in for `module_name.func_name` that imports the module on first call
+
+    Pages with heavy dependencies (matplotlib, networkx, ...) are only imported
+    once somebody actually opens them, instead of on every worker start.
+    """
+    target = None
+
+    def page(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(load_module(module_name), func_name)
+        return target(*args, **kwargs)
+
+    page.__name__ = func_name
+    page.__qualname__ = func_name
+    page.__doc__ = f"Lazily loaded {module_name}.{func_name}"
+    return page
+
+
+def load_module(module_name):
+    """Import a module once, recording how long the first import took"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    with _lock:
+        module = sys.modules.get(module_name)
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(module_name)
+            elapsed = time.perf_counter() - start
+            load_times[module_name] = elapsed * 1000
+            tracing.record(f"import.{module_name}", elapsed)
+    return module
+
+
+def is_loaded(module_name):
+    """Check whether a lazily loaded page has been imported yet"""
+    return module_name in sys.modules
@@ -0,0 +1,25 @@
+import streamlit as st
+
+
+def lazy_tabs(labels, items, key):
+    """Tab strip that renders only the selected tab
+
+    Works like zip(st.tabs(labels), items), except that only the selected
+    (index, item) pair is returned, so the caller builds one tab's content per
+    rerun instead of all of them:
+
+        for i, course in lazy_tabs(labels, courses, key="course_tabs"):
+            ...
+    """
+    if not labels:
+        return []
+    # Tie the widget to the label set so a different user/path starts on the first tab
+    widget_key = f"{key}:{hash(tuple(labels))}"
+    active = st.radio(
+        key, range(len(labels)),
+        format_func=lambda i: labels[i],
+        horizontal=True,
+        label_visibility="collapsed",
+        key=widget_key,
+    )
+    return [(active, items[active])]
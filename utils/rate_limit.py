@@ -0,0 +1,181 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# Failed-login budget per email: a burst of 5, then one attempt every 30 seconds
+EMAIL_CAPACITY = 5
+EMAIL_REFILL_PER_SECOND = 1 / 30
+
+# Per browser session: a burst of 10, then one attempt every 10 seconds
+SESSION_CAPACITY = 10
+SESSION_REFILL_PER_SECOND = 1 / 10
+
+# Whole process: caps password-hash verifications per second whatever the key spread
+GLOBAL_CAPACITY = 50
+GLOBAL_REFILL_PER_SECOND = 20.0
+
+# Buckets kept per scope; beyond this the least recently used are forgotten
+MAX_KEYS = 100000
+
+# Set to a SQLite file to keep limits across restarts
+PERSIST_PATH = os.environ.get("CODEHOLICS_LOGIN_RATE_DB")
+
+EMAIL = "email"
+SESSION = "session"
+GLOBAL = "global"
+
+
+class TokenBucket:
+    """Token buckets for many keys, stored as [tokens, updated_at] in LRU order
+
+    A bucket that has refilled completely is identical to a missing one, so
+    idle keys are dropped from the cold end as other keys are touched; every
+    operation is O(1) amortized. Not thread-safe on its own.
+    """
+
+    def __init__(self, capacity, refill_per_second, max_keys=MAX_KEYS):
+        self.capacity = capacity
+        self.rate = refill_per_second
+        self.max_keys = max_keys
+        self.full_after = capacity / refill_per_second
+        self._buckets = OrderedDict()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def level(self, key, now):
+        state = self._buckets.get(key)
+        if state is None:
+            return self.capacity
+        return min(self.capacity, state[0] + (now - state[1]) * self.rate)
+
+    def retry_after(self, key, now):
+        """Seconds until `key` has a whole token again"""
+        return max(0.0, (1 - self.level(key, now)) / self.rate)
+
+    def take(self, key, now):
+        tokens = self.level(key, now) - 1
+        self._buckets[key] = [tokens, now]
+        self._buckets.move_to_end(key)
+        self._prune(now)
+        return tokens
+
+    def restore(self, key, tokens, updated_at):
+        self._buckets[key] = [tokens, updated_at]
+
+    def reset(self, key):
+        self._buckets.pop(key, None)
+
+    def _prune(self, now):
+        buckets = self._buckets
+        while buckets:
+            key, (_, updated_at) = next(iter(buckets.items()))
+            if len(buckets) <= self.max_keys and now - updated_at < self.full_after:
+                break
+            buckets.popitem(last=False)
+
+
+class LoginRateLimiter:
+    """Decides whether a login attempt may spend a password-hash verification
+
+    An attempt needs a token from the email's bucket, the session's bucket
+    and the process-wide bucket; it is refused without touching the
+    database if any of them is empty.
+    """
+
+    def __init__(self, persist_path=PERSIST_PATH):
+        self.buckets = {
+            EMAIL: TokenBucket(EMAIL_CAPACITY, EMAIL_REFILL_PER_SECOND),
+            SESSION: TokenBucket(SESSION_CAPACITY, SESSION_REFILL_PER_SECOND),
+            GLOBAL: TokenBucket(GLOBAL_CAPACITY, GLOBAL_REFILL_PER_SECOND),
+        }
+        self.refused = 0
+        self._lock = threading.Lock()
+        self._queue = None
+        if persist_path:
+            self._load(persist_path)
+
+    @staticmethod
+    def _keys(email, session_id):
+        return ((EMAIL, email.strip().lower()), (SESSION, session_id), (GLOBAL, ""))
+
+    def acquire(self, email, session_id, now=None):
+        """Return (allowed, retry_after_seconds) and consume a token from each bucket if allowed"""
+        now = now or time.time()
+        keys = self._keys(email, session_id)
+        with self._lock:
+            wait = max(self.buckets[scope].retry_after(key, now) for scope, key in keys)
+            if wait > 0:
+                self.refused += 1
+                return False, wait
+            for scope, key in keys:
+                tokens = self.buckets[scope].take(key, now)
+                if self._queue and scope != GLOBAL:
+                    self._queue.submit(
+                        "INSERT OR REPLACE INTO login_rate_limits (scope, key, tokens, updated_at) VALUES (?, ?, ?, ?)",
+                        (scope, key, tokens, now),
+                    )
+        return True, 0.0
+
+    def reset(self, email):
+        """Forget an email's failures after a successful login"""
+        key = email.strip().lower()
+        with self._lock:
+            self.buckets[EMAIL].reset(key)
+        if self._queue:
+            self._queue.submit("DELETE FROM login_rate_limits WHERE scope = ? AND key = ?", (EMAIL, key))
+
+    def stats(self):
+        return {"refused": self.refused, **{scope: len(bucket) for scope, bucket in self.buckets.items()}}
+
+    # --- Persistence ---
+    @staticmethod
+    def _create_table(conn):
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS login_rate_limits (
+            scope TEXT NOT NULL,
+            key TEXT NOT NULL,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (scope, key)
+        )
+        ''')
+        conn.commit()
+
+    def _load(self, path):
+        import sqlite3
+        from database.write_behind import WriteBehindQueue
+
+        now = time.time()
+        conn = sqlite3.connect(path)
+        try:
+            self._create_table(conn)
+            for scope in (EMAIL, SESSION):
+                bucket = self.buckets[scope]
+                cutoff = now - bucket.full_after
+                # Fully refilled rows carry no state; drop them instead of loading them
+                conn.execute("DELETE FROM login_rate_limits WHERE scope = ? AND updated_at < ?", (scope, cutoff))
+                for key, tokens, updated_at in conn.execute(
+                        "SELECT key, tokens, updated_at FROM login_rate_limits WHERE scope = ? ORDER BY updated_at",
+                        (scope,)):
+                    bucket.restore(key, tokens, updated_at)
+            conn.commit()
+        finally:
+            conn.close()
+        # Attempts are recorded off the request path, like feedback and connection clicks
+        self._queue = WriteBehindQueue(path, prepare=self._create_table)
+
+
+_login_limiter = None
+_login_limiter_lock = threading.Lock()
+
+
+def get_login_limiter():
+    """Process-wide login rate limiter"""
+    global _login_limiter
+    if _login_limiter is None:
+        with _login_limiter_lock:
+            if _login_limiter is None:
+                _login_limiter = LoginRateLimiter()
+    return _login_limiter
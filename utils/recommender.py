@@ -0,0 +1,81 @@
+import heapq
+
+# Skills each career goal in data/users.csv calls for
+CAREER_SKILLS = {
+    "Data Scientist": ["Python", "SQL", "Data Analysis", "Machine Learning", "Deep Learning"],
+    "DevOps Engineer": ["DevOps", "Cloud Computing", "Python", "Problem Solving"],
+    "ML Engineer": ["Machine Learning", "Deep Learning", "Python", "Cloud Computing", "DevOps"],
+    "Product Manager": ["Product Management", "Leadership", "Communication", "Data Analysis", "UX Design"],
+    "Software Developer": ["Python", "Web Development", "Mobile Development", "SQL", "Problem Solving"],
+    "UX Designer": ["UX Design", "Communication", "Problem Solving", "Web Development", "Mobile Development"],
+}
+
+# Proficiency at which a skill counts as acquired
+TARGET_PROFICIENCY = 0.7
+
+# Weight of skills that help but are not part of any career goal
+OFF_GOAL_WEIGHT = 0.2
+
+# Score multiplier for each prerequisite the user does not have yet
+MISSING_PREREQ_PENALTY = 0.5
+
+
+def skill_needs(user):
+    """Map each skill to how much the user still needs it (0 = not needed)"""
+    skills = user["skills"]
+    goals = set()
+    for career in user["career_goals"]:
+        goals.update(CAREER_SKILLS.get(career, []))
+
+    needs = {}
+    for skill in goals:
+        needs[skill] = max(0.0, TARGET_PROFICIENCY - skills.get(skill, 0.0)) / TARGET_PROFICIENCY
+    return needs
+
+
+def score_course(user, needs, course):
+    """Score a single course for a user; higher is better"""
+    skills = user["skills"]
+    covered = course["skills_covered"]
+    if not covered:
+        return 0.0
+
+    score = 0.0
+    for skill in covered:
+        if skill in needs:
+            score += needs[skill]
+        else:
+            score += OFF_GOAL_WEIGHT * (1.0 - skills.get(skill, 0.0))
+    score /= len(covered) ** 0.5
+
+    for prereq in course["prerequisites"]:
+        if skills.get(prereq, 0.0) < 0.3:
+            score *= MISSING_PREREQ_PENALTY
+    return score
+
+
+def recommend_courses(user, courses, k=5):
+    """Return the top-k (course_id, score) pairs for a parsed user
+
+    `courses` is a dict of parsed courses keyed by course_id; courses the user
+    already completed are never recommended.
+    """
+    needs = skill_needs(user)
+    completed = set(user["completed_courses"])
+    candidates = (
+        (score_course(user, needs, course), course_id)
+        for course_id, course in courses.items()
+        if course_id not in completed
+    )
+    return [(course_id, score) for score, course_id in heapq.nlargest(k, candidates)]
+
+
+def career_matches(user, k=3):
+    """Return the top-k (career, match) pairs, match being the share of required skills at target level"""
+    skills = user["skills"]
+    matches = []
+    for career, required in CAREER_SKILLS.items():
+        match = sum(min(1.0, skills.get(skill, 0.0) / TARGET_PROFICIENCY) for skill in required) / len(required)
+        matches.append((career, match))
+    matches.sort(key=lambda item: item[1], reverse=True)
+    return matches[:k]
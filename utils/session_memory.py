@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+# Approximate bytes of shared objects one process keeps; least recently used go first
+STORE_MAX_BYTES = int(os.environ.get("CODEHOLICS_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Per-session budget for st.session_state; sessions above it are flagged on the admin page
+SESSION_MAX_BYTES = int(os.environ.get("CODEHOLICS_SESSION_MAX_BYTES", str(256 * 1024)))
+
+# Sessions not seen for this long are dropped from the report (seconds)
+SESSION_TTL = 3600.0
+
+# Objects visited per size estimate, so one huge value can't stall a rerun
+MAX_OBJECTS = 100000
+
+# Shared, immutable or code objects; counting them against a session would be noise
+_SKIP_TYPES = (type, type(sys), type(len), type(lambda: None))
+
+
+def deep_sizeof(value, max_objects=MAX_OBJECTS):
+    """Approximate bytes held by `value` and everything it references
+
+    Objects reachable twice are counted once. Stops after `max_objects`
+    objects, so the result is a lower bound for very large structures.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack and len(seen) < max_objects:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        elif hasattr(obj, "__slots__"):
+            stack.extend(getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot))
+    return total
+
+
+class ObjectStore:
+    """Process-wide LRU of shared objects, so sessions can hold ids instead of copies
+
+    Values handed out are shared by every session in the process: treat them
+    as read-only. An entry stored with a `ttl` is a miss once it has expired.
+    """
+
+    def __init__(self, max_bytes=STORE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> [value, bytes, hits, stored_at, expires_at]
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Return (True, value) on a hit, (False, None) on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[4] is not None and entry[4] <= time.time():
+                del self._entries[key]
+                self.bytes -= entry[1]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            entry[2] += 1
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key, value, ttl=None):
+        """Store `value` under `key` for `ttl` seconds (None = until evicted); values larger than the whole store are not kept"""
+        size = deep_sizeof(value)
+        if size > self.max_bytes:
+            return key
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            now = time.time()
+            self._entries[key] = [value, size, 0, now, None if ttl is None else now + ttl]
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted[1]
+        return key
+
+    def get_or_compute(self, key, compute, ttl=None):
+        hit, value = self.get(key)
+        if not hit:
+            value = compute()
+            self.put(key, value, ttl)
+        return value
+
+    def entries(self):
+        """Per-entry sizes, largest first"""
+        with self._lock:
+            rows = [{"key": key, "bytes": size, "hits": hits, "stored_at": stored_at}
+                    for key, (_, size, hits, stored_at, _) in self._entries.items()]
+        return sorted(rows, key=lambda row: row["bytes"], reverse=True)
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_object_store():
+    """The process-wide shared object store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ObjectStore()
+    return _store
+
+
+# --- Per-session accounting ---
+_sessions_lock = threading.Lock()
+_sessions = {}
+
+
+def account_session(session_id, state):
+    """Record the approximate size of one session's state, per key
+
+    Called once per rerun; the result feeds session_report(). A session that
+    first goes over SESSION_MAX_BYTES is logged.
+    """
+    sizes = {str(key): deep_sizeof(state[key]) for key in list(state.keys())}
+    total = sum(sizes.values())
+    now = time.time()
+    with _sessions_lock:
+        previous = _sessions.get(session_id)
+        if total > SESSION_MAX_BYTES and (previous is None or not previous["over_cap"]):
+            largest = max(sizes, key=sizes.get)
+            print(f"Session {session_id} holds ~{total} bytes (cap {SESSION_MAX_BYTES}); largest key: {largest}")
+        _sessions[session_id] = {"session": session_id, "bytes": total, "keys": sizes, "updated_at": now,
+                                 "over_cap": total > SESSION_MAX_BYTES}
+        for stale in [sid for sid, row in _sessions.items() if now - row["updated_at"] > SESSION_TTL]:
+            del _sessions[stale]
+    return total
+
+
+def session_report(projected_sessions=1000):
+    """Sessions by size plus a host sizing estimate for `projected_sessions` concurrent users"""
+    with _sessions_lock:
+        sessions = sorted((dict(row) for row in _sessions.values()), key=lambda row: row["bytes"], reverse=True)
+    store = get_object_store().stats()
+    mean = sum(row["bytes"] for row in sessions) / len(sessions) if sessions else 0
+    return {
+        "sessions": sessions,
+        "session_count": len(sessions),
+        "mean_session_bytes": mean,
+        "max_session_bytes": sessions[0]["bytes"] if sessions else 0,
+        "session_cap_bytes": SESSION_MAX_BYTES,
+        "store": store,
+        # The store is paid once per process; session state once per user
+        "projected_bytes": store["bytes"] + mean * projected_sessions,
+    }
@@ -0,0 +1,324 @@
+import os
+import time
+import uuid
+import pickle
+import sqlite3
+import hashlib
+import stat
+import threading
+from functools import wraps
+from utils.session_memory import get_object_store
+
+MAX_BYTES = int(os.environ.get("CODEHOLICS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# A worker computing a missing entry holds a lease this long; others wait for it
+LEASE_SECONDS = 30.0
+WAIT_POLL_SECONDS = 0.05
+
+# Threads of one process serialize misses on the same key through these striped locks
+KEY_LOCK_STRIPES = 64
+
+# last_access is only rewritten when older than this, so hits stay read-mostly
+TOUCH_INTERVAL = 60.0
+
+
+def get_cache_path():
+    """Path of the host's cache file (CODEHOLICS_CACHE_PATH overrides it)
+
+    One file per user and host, shared by every worker process. Values are
+    pickled, so the file must live somewhere only this user can write.
+    Read on each call, so a caller can set the variable after import.
+    """
+    override = os.environ.get("CODEHOLICS_CACHE_PATH")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "codeholics", "cache.db")
+
+
+def _check_private(st, path):
+    """Refuse a file or directory another user owns or could write to"""
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by uid {st.st_uid}, not by this user; refusing to use it as a cache")
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users; refusing to use it as a cache")
+
+
+def secure_cache_path(path):
+    """Create the cache directory (0700) and file (0600), checking both belong to this user only
+
+    Cached values are unpickled, so a file somebody else could plant or
+    modify would let them run code in every worker.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_private(os.stat(directory), directory)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        _check_private(os.fstat(fd), path)
+    finally:
+        os.close(fd)
+
+
+class SharedCache:
+    """Size-bounded LRU cache in a memory-mapped SQLite file shared across processes
+
+    Values are pickled. Keys carry a per-namespace version so a whole
+    namespace can be invalidated by bumping it, and misses are computed by
+    one process at a time (a lease row) to avoid stampedes.
+    """
+
+    def __init__(self, path=None, max_bytes=MAX_BYTES, lease_seconds=LEASE_SECONDS):
+        path = path or get_cache_path()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        secure_cache_path(path)
+        self._create_tables(self._conn())
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Reads come straight from the OS page cache, shared by all workers
+            conn.execute(f"PRAGMA mmap_size={self.max_bytes * 2}")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _create_tables(conn):
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL,
+            last_access REAL NOT NULL
+        )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access ON cache_entries (last_access)")
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_versions (
+            namespace TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+        ''')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_leases (
+            key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        ''')
+
+    # --- Versions ---
+    def namespace_version(self, namespace):
+        row = self._conn().execute("SELECT version FROM cache_versions WHERE namespace = ?", (namespace,)).fetchone()
+        return row[0] if row else 0
+
+    def invalidate(self, namespace):
+        """Make every existing key of `namespace` unreachable; LRU eviction reclaims the space"""
+        self._conn().execute(
+            """INSERT INTO cache_versions (namespace, version) VALUES (?, 1)
+            ON CONFLICT(namespace) DO UPDATE SET version = version + 1""",
+            (namespace,),
+        )
+
+    # --- Entries ---
+    def get(self, key):
+        """Return (True, value) on a hit, (False, None) on a miss"""
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at, last_access FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] < now):
+            self.misses += 1
+            return False, None
+        if now - row[2] > TOUCH_INTERVAL:
+            conn.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return True, pickle.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            """INSERT OR REPLACE INTO cache_entries (key, value, size, expires_at, last_access)
+            VALUES (?, ?, ?, ?, ?)""",
+            (key, sqlite3.Binary(data), len(data), now + ttl if ttl else None, now),
+        )
+        self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT total(size) FROM cache_entries").fetchone()[0]
+        while total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY last_access LIMIT 32"
+            ).fetchall()
+            if not rows:
+                break
+            evicted = []
+            for key, size in rows:
+                evicted.append((key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", evicted)
+
+    def largest_entries(self, limit=20):
+        """(key, bytes) of the biggest entries"""
+        return self._conn().execute(
+            "SELECT key, size FROM cache_entries ORDER BY size DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def stats(self):
+        count, size = self._conn().execute("SELECT count(*), total(size) FROM cache_entries").fetchone()
+        return {"entries": count, "bytes": int(size), "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+    # --- Stampede protection ---
+    def _acquire_lease(self, key):
+        now = time.time()
+        conn = self._conn()
+        conn.execute("DELETE FROM cache_leases WHERE key = ? AND expires_at < ?", (key, now))
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?)",
+            (key, self.owner, now + self.lease_seconds),
+        )
+        return cursor.rowcount == 1
+
+    def _release_lease(self, key):
+        self._conn().execute("DELETE FROM cache_leases WHERE key = ? AND owner = ?", (key, self.owner))
+
+    def _key_lock(self, key):
+        return self._key_locks[hash(key) % KEY_LOCK_STRIPES]
+
+    def get_or_compute(self, key, compute, ttl=None):
+        """Return the cached value, computing it in at most one process/thread at a time"""
+        hit, value = self.get(key)
+        if hit:
+            return value
+        # Threads of this process queue behind one local lock, processes behind the lease row
+        with self._key_lock(key):
+            hit, value = self.get(key)
+            if hit:
+                return value
+            deadline = time.time() + self.lease_seconds
+            while not self._acquire_lease(key):
+                time.sleep(WAIT_POLL_SECONDS)
+                hit, value = self.get(key)
+                if hit:
+                    return value
+                if time.time() > deadline:
+                    break
+            try:
+                value = compute()
+                self.set(key, value, ttl)
+                return value
+            finally:
+                self._release_lease(key)
+
+
+class LocalCache:
+    """Stand-in for SharedCache when the cache file can't be opened
+
+    Stores nothing itself, so @shared_cache results live only in this
+    process's object store, as if every worker had a cache of its own.
+    """
+
+    path = None
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def namespace_version(self, namespace):
+        return self._versions.get(namespace, 0)
+
+    def invalidate(self, namespace):
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def get(self, key):
+        self.misses += 1
+        return False, None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def largest_entries(self, limit=20):
+        return []
+
+    def stats(self):
+        return {"entries": 0, "bytes": 0, "max_bytes": 0, "hits": self.hits, "misses": self.misses}
+
+    def get_or_compute(self, key, compute, ttl=None):
+        self.misses += 1
+        return compute()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """Process-wide handle on the host's shared cache file
+
+    If the file can't be opened (read-only home, refused permissions, a
+    corrupt database) the process logs it once and falls back to a
+    LocalCache, so cached functions keep working uncached across processes.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                try:
+                    _default_cache = SharedCache()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Shared cache unavailable, caching per process only: {e}")
+                    _default_cache = LocalCache()
+    return _default_cache
+
+
+def make_key(namespace, version, data_version, args, kwargs):
+    digest = hashlib.sha1(pickle.dumps((args, sorted(kwargs.items())), protocol=4)).hexdigest()
+    return f"{namespace}:v{version}.{data_version}:{digest}"
+
+
+def shared_cache(namespace, version=1, ttl=None):
+    """Decorator caching a function's results in the cross-process shared cache
+
+    `version` is the code version of the function: bump it when its output
+    format changes. SharedCache.invalidate(namespace) drops current data.
+    Arguments must be picklable, and results are shared between sessions,
+    so callers must not modify them.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_shared_cache()
+            key = make_key(namespace, version, cache.namespace_version(namespace), args, kwargs)
+            # Sessions of this process share one unpickled copy instead of decoding their own
+            store = get_object_store()
+            hit, value = store.get(key)
+            if not hit:
+                value = cache.get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+                store.put(key, value, ttl)
+            return value
+
+        wrapper.invalidate = lambda: get_shared_cache().invalidate(namespace)
+        return wrapper
+    return decorator
@@ -0,0 +1,304 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from functools import wraps
+
+# Tracing is off unless explicitly enabled; a disabled span costs one global lookup
+_enabled = os.environ.get("CODEHOLICS_TRACING", "0") == "1"
+
+# Number of most recent samples kept per span for the rolling histograms
+WINDOW_SIZE = int(os.environ.get("CODEHOLICS_TRACING_WINDOW", "1024"))
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_spans = {}
+_metrics_server = None
+
+
+def enable():
+    """Turn span recording on for this process"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Turn span recording off for this process"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Return True if spans are currently being recorded"""
+    return _enabled
+
+
+class SpanStats:
+    """Rolling wall/CPU samples for a single named span"""
+
+    def __init__(self, name, window=WINDOW_SIZE):
+        self.name = name
+        self.count = 0
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self.wall = deque(maxlen=window)
+        self.cpu = deque(maxlen=window)
+        # Per-bucket wall-time counts since start; unlike the window these only ever grow
+        self.bucket_counts = [0] * len(BUCKETS)
+
+    def record(self, wall, cpu):
+        """Add one sample"""
+        self.count += 1
+        self.total_wall += wall
+        self.total_cpu += cpu
+        self.wall.append(wall)
+        self.cpu.append(cpu)
+        for i, bound in enumerate(BUCKETS):
+            if wall <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    @staticmethod
+    def _percentile(samples, q):
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def histogram(self):
+        """Cumulative ("le") bucket counts of wall time over every sample since start"""
+        cumulative = []
+        running = 0
+        for c in self.bucket_counts:
+            running += c
+            cumulative.append(running)
+        return cumulative
+
+    def snapshot(self):
+        """Return a plain dict summary of this span"""
+        wall = list(self.wall)
+        cpu = list(self.cpu)
+        return {
+            "span": self.name,
+            "count": self.count,
+            "total_wall_s": self.total_wall,
+            "total_cpu_s": self.total_cpu,
+            "window": len(wall),
+            "wall_p50_ms": self._percentile(wall, 0.50) * 1000,
+            "wall_p95_ms": self._percentile(wall, 0.95) * 1000,
+            "wall_p99_ms": self._percentile(wall, 0.99) * 1000,
+            "wall_max_ms": (max(wall) if wall else 0.0) * 1000,
+            "cpu_p50_ms": self._percentile(cpu, 0.50) * 1000,
+            "cpu_p95_ms": self._percentile(cpu, 0.95) * 1000,
+        }
+
+
+def record(name, wall, cpu=0.0):
+    """Record a sample for span `name` (seconds)"""
+    with _lock:
+        stats = _spans.get(name)
+        if stats is None:
+            stats = _spans[name] = SpanStats(name)
+        stats.record(wall, cpu)
+
+
+class _Span:
+    __slots__ = ("name", "_wall", "_cpu")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self._wall, time.thread_time() - self._cpu)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """Context manager timing the enclosed block as span `name`
+
+    Usage:
+        with span("dashboard.skill_analysis.radar"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def traced(name=None):
+    """Decorator timing every call of the wrapped function as a span"""
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def reset():
+    """Drop all recorded spans"""
+    with _lock:
+        _spans.clear()
+
+
+def snapshot():
+    """Return summaries of all spans, slowest total wall time first"""
+    with _lock:
+        rows = [stats.snapshot() for stats in _spans.values()]
+    return sorted(rows, key=lambda row: row["total_wall_s"], reverse=True)
+
+
+# --- Exporters ---
+def to_json():
+    """Dump all span summaries as a JSON document"""
+    return json.dumps({"generated_at": time.time(), "spans": snapshot()}, indent=2)
+
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus():
+    """Dump all spans in the Prometheus text exposition format
+
+    The histogram counts every sample since the process started, so its
+    buckets, sum and count only increase as Prometheus requires; the rolling
+    window is not used here.
+    """
+    with _lock:
+        spans = [(name, stats.histogram(), stats.total_wall, stats.total_cpu, stats.count)
+                 for name, stats in sorted(_spans.items())]
+
+    lines = [
+        "# HELP codeholics_span_wall_seconds Wall time per span",
+        "# TYPE codeholics_span_wall_seconds histogram",
+    ]
+    for name, buckets, total_wall, _, count in spans:
+        label = _escape_label(name)
+        for bound, bucket in zip(BUCKETS, buckets):
+            lines.append(f'codeholics_span_wall_seconds_bucket{{span="{label}",le="{bound}"}} {bucket}')
+        lines.append(f'codeholics_span_wall_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+        lines.append(f'codeholics_span_wall_seconds_sum{{span="{label}"}} {total_wall}')
+        lines.append(f'codeholics_span_wall_seconds_count{{span="{label}"}} {count}')
+
+    lines.append("# HELP codeholics_span_cpu_seconds_total CPU time spent in each span")
+    lines.append("# TYPE codeholics_span_cpu_seconds_total counter")
+    for name, _, _, total_cpu, _ in spans:
+        lines.append(f'codeholics_span_cpu_seconds_total{{span="{_escape_label(name)}"}} {total_cpu}')
+
+    lines.append("# HELP codeholics_span_calls_total Number of times each span ran")
+    lines.append("# TYPE codeholics_span_calls_total counter")
+    for name, _, _, _, count in spans:
+        lines.append(f'codeholics_span_calls_total{{span="{_escape_label(name)}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+# --- Health checks ---
+_health_checks = {}
+
+
+def register_health_check(name, check):
+    """Add a check to /health; `check()` returns None when healthy, else a short description of the problem"""
+    _health_checks[name] = check
+
+
+def health():
+    """Run every registered check; /health answers 503 when any of them reports a problem"""
+    problems = {}
+    for name, check in list(_health_checks.items()):
+        try:
+            problem = check()
+        except Exception as e:
+            problem = f"{type(e).__name__}: {e}"
+        if problem:
+            problems[name] = problem
+    return {"healthy": not problems, "problems": problems}
+
+
+# --- Dump endpoint ---
+def _make_handler():
+    # http.server pulls in ssl/socket; only import it when the endpoint is requested
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = 200
+            if self.path.startswith("/health"):
+                document = health()
+                if document["healthy"]:
+                    body, content_type = "ok\n", "text/plain"
+                else:
+                    body, content_type = json.dumps(document, indent=2), "application/json"
+                    status = 503
+            elif self.path.startswith("/ready"):
+                # Load balancers should only route here once the warm-up tasks have finished
+                from utils import warmup
+                document = warmup.readiness()
+                body, content_type = json.dumps(document, indent=2), "application/json"
+                status = 200 if document["ready"] else 503
+            elif self.path.startswith("/metrics.json"):
+                body, content_type = to_json(), "application/json"
+            elif self.path.startswith("/metrics"):
+                body, content_type = to_prometheus(), "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+def start_metrics_server(port=None, host="127.0.0.1"):
+    """Serve /metrics (Prometheus), /metrics.json, /health and /ready on a daemon thread
+
+    The port comes from CODEHOLICS_METRICS_PORT when not given; nothing is
+    started if neither is set. Safe to call on every rerun.
+    """
+    global _metrics_server
+    if _metrics_server is not None:
+        return _metrics_server
+    port = port or os.environ.get("CODEHOLICS_METRICS_PORT")
+    if not port:
+        return None
+    with _lock:
+        if _metrics_server is None:
+            from http.server import ThreadingHTTPServer
+            server = ThreadingHTTPServer((host, int(port)), _make_handler())
+            threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+            _metrics_server = server
+    return _metrics_server
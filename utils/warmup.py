@@ -0,0 +1,158 @@
+import os
+import time
+import heapq
+import itertools
+import threading
+from utils import tracing
+
+# Threads running warm-up tasks; 0 turns warm-up off and everything stays lazy
+WORKERS = int(os.environ.get("CODEHOLICS_WARMUP_WORKERS", "2"))
+
+# Longest a request waits on a warm-up task before building the artifact itself (seconds)
+WAIT_TIMEOUT = 30.0
+
+PENDING = "pending"
+QUEUED = "queued"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+_lock = threading.Lock()
+_tasks = {}
+_queue = []
+_order = itertools.count()
+_started = False
+
+
+class Task:
+    """One warm-up step: `func` builds an artifact that some request would otherwise build lazily
+
+    Lower `priority` runs first among tasks whose `requires` are all ready.
+    Only `required` tasks gate readiness; the rest are best effort.
+    """
+
+    def __init__(self, name, func, priority=100, requires=(), required=True):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.requires = tuple(requires)
+        self.required = required
+        self.state = PENDING
+        self.error = None
+        self.started_at = None
+        self.seconds = None
+        self.done = threading.Event()
+
+    def snapshot(self):
+        return {"task": self.name, "state": self.state, "priority": self.priority, "required": self.required,
+                "requires": list(self.requires), "seconds": self.seconds, "error": self.error}
+
+
+def _enqueue_ready():
+    """Queue pending tasks whose dependencies are ready; fail those whose dependencies failed (holding _lock)"""
+    changed = True
+    while changed:
+        changed = False
+        for task in _tasks.values():
+            if task.state != PENDING:
+                continue
+            states = [_tasks[name].state if name in _tasks else FAILED for name in task.requires]
+            if FAILED in states:
+                failed = [name for name, state in zip(task.requires, states) if state == FAILED]
+                task.state, task.error = FAILED, f"dependency failed: {', '.join(failed)}"
+                task.done.set()
+                changed = True
+            elif all(state == READY for state in states):
+                task.state = QUEUED
+                heapq.heappush(_queue, (task.priority, next(_order), task))
+
+
+def _worker(wakeup):
+    while True:
+        with _lock:
+            while not _queue:
+                if all(task.done.is_set() for task in _tasks.values()):
+                    return
+                if not any(task.state == RUNNING for task in _tasks.values()):
+                    # Nothing running and nothing queued: what's left waits on itself
+                    for task in _tasks.values():
+                        if not task.done.is_set():
+                            task.state, task.error = FAILED, "dependency cycle"
+                            task.done.set()
+                    wakeup.notify_all()
+                    return
+                wakeup.wait()
+            _, _, task = heapq.heappop(_queue)
+            task.state = RUNNING
+            task.started_at = time.time()
+        start = time.perf_counter()
+        try:
+            task.func()
+            state, error = READY, None
+        except Exception as e:
+            state, error = FAILED, f"{type(e).__name__}: {e}"
+            print(f"Warm-up task {task.name} failed: {error}")
+        elapsed = time.perf_counter() - start
+        tracing.record(f"warmup.{task.name}", elapsed)
+        with _lock:
+            task.state, task.error, task.seconds = state, error, elapsed
+            task.done.set()
+            _enqueue_ready()
+            wakeup.notify_all()
+
+
+def start(tasks, workers=WORKERS):
+    """Run `tasks` on background threads in dependency and priority order
+
+    Safe to call on every rerun: only the first call in a process starts
+    anything. Returns False when warm-up is switched off, in which case the
+    process counts as ready straight away and every artifact stays lazy.
+    """
+    global _started
+    if _started:
+        return bool(_tasks)
+    with _lock:
+        if _started:
+            return bool(_tasks)
+        if workers <= 0:
+            _started = True
+            return False
+        for task in tasks:
+            _tasks[task.name] = task
+        _enqueue_ready()
+        wakeup = threading.Condition(_lock)
+        for i in range(workers):
+            threading.Thread(target=_worker, args=(wakeup,), name=f"warmup-{i}", daemon=True).start()
+        _started = True
+    return True
+
+
+def wait(*names, timeout=WAIT_TIMEOUT):
+    """Block until the named tasks finish; True if all of them are ready
+
+    Unknown tasks, or warm-up not running, return at once so the caller falls
+    back to building what it needs itself.
+    """
+    deadline = time.monotonic() + timeout
+    ok = True
+    for name in names:
+        task = _tasks.get(name)
+        if task is None:
+            ok = False
+            continue
+        if not task.done.wait(max(0.0, deadline - time.monotonic())):
+            ok = False
+        ok = ok and task.state == READY
+    return ok
+
+
+def is_ready():
+    """True once every required task is ready"""
+    return _started and all(task.state == READY for task in _tasks.values() if task.required)
+
+
+def readiness():
+    """Readiness document for health checks and the admin page"""
+    with _lock:
+        tasks = [task.snapshot() for task in sorted(_tasks.values(), key=lambda task: task.priority)]
+    return {"ready": is_ready(), "started": _started, "tasks": tasks}